@@ -0,0 +1,109 @@
+"""
+Dandolo SDK Benchmark Baselines
+
+Shared storage for the benchmark scripts: a committed baseline per
+suite, a local JSONL history of every run, and the regression check.
+"""
+
+import json
+import os
+import platform
+import subprocess
+import time
+from typing import Dict, List, Optional
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINES_DIR = os.path.join(BENCHMARKS_DIR, "baselines")
+HISTORY_DIR = os.path.join(BENCHMARKS_DIR, "results")
+
+
+def environment() -> Dict[str, str]:
+    """Describe the machine and revision a run was made on."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BENCHMARKS_DIR,
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = "unknown"
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "commit": commit
+    }
+
+
+def baseline_path(suite: str) -> str:
+    return os.path.join(BASELINES_DIR, f"{suite}.json")
+
+
+def load_baseline(path: str) -> Optional[Dict[str, float]]:
+    """
+    Read a baseline file.
+    
+    Args:
+        path: Baseline JSON file
+    
+    Returns:
+        Seconds per benchmark, or None if there is no baseline yet
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as fh:
+        return json.load(fh)["results"]
+
+
+def save_baseline(path: str, results: Dict[str, float]) -> None:
+    """Write results as the new baseline."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump({**environment(), "results": results}, fh, indent=2, sort_keys=True)
+        fh.write("\n")
+
+
+def append_history(suite: str, results: Dict[str, float]) -> str:
+    """
+    Record a run in the suite's history file.
+    
+    Args:
+        suite: Suite name
+        results: Seconds per benchmark
+    
+    Returns:
+        Path of the history file
+    """
+    os.makedirs(HISTORY_DIR, exist_ok=True)
+    path = os.path.join(HISTORY_DIR, f"{suite}.jsonl")
+    with open(path, "a", encoding="utf-8") as fh:
+        fh.write(json.dumps({"timestamp": time.time(), **environment(), "results": results}, sort_keys=True) + "\n")
+    return path
+
+
+def regressions(
+    results: Dict[str, float],
+    baseline: Optional[Dict[str, float]],
+    tolerance: float,
+    slack: float
+) -> List[str]:
+    """
+    Names of benchmarks slower than the baseline allows.
+    
+    Args:
+        results: Seconds per benchmark (lower is better)
+        baseline: Baseline results, or None
+        tolerance: Allowed relative slowdown, e.g. 0.25
+        slack: Allowed absolute slowdown in seconds, absorbing noise on
+            very short timings
+    
+    Returns:
+        Regressed benchmark names
+    """
+    if baseline is None:
+        return []
+    return [
+        name for name, seconds in results.items()
+        if name in baseline and seconds > baseline[name] * (1 + tolerance) + slack
+    ]
\ No newline at end of file
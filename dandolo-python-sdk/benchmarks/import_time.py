@@ -0,0 +1,118 @@
+"""
+Dandolo SDK Import-Time Benchmark
+
+Measures the cold-start cost of importing the SDK, the way a serverless
+handler pays it, and fails when it regresses.
+
+Each scenario runs in fresh interpreters; the fastest run, the least
+disturbed by other load on the machine, is compared with the recorded
+baseline. The script also checks that importing the
+package does not load heavy or optional dependencies before they are
+needed, a check that does not depend on machine speed.
+
+Usage:
+    python benchmarks/import_time.py            # compare with the baseline
+    python benchmarks/import_time.py --update   # record a new baseline
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from baseline import append_history, baseline_path, load_baseline, regressions, save_baseline
+
+SDK_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SUITE = "import_time"
+
+# Modules that must not be loaded by a bare `import dandolo`
+OPTIONAL_MODULES = ["requests", "aiohttp", "orjson", "msgspec", "httpx", "zstandard", "tiktoken", "pyarrow", "pandas"]
+
+# (name, statement, modules that must stay unloaded after it)
+SCENARIOS: List[Tuple[str, str, List[str]]] = [
+    ("import dandolo", "import dandolo", OPTIONAL_MODULES),
+    ("from dandolo import Dandolo", "from dandolo import Dandolo", ["asyncio", "sqlite3", "aiohttp", "httpx", "zstandard", "tiktoken", "pyarrow", "pandas"]),
+    ("Dandolo(...) construction", "from dandolo import Dandolo; Dandolo(api_key='dk_benchmark')", ["aiohttp", "httpx", "pyarrow", "pandas"]),
+]
+
+_CHILD = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+import json
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {modules!r} if m in sys.modules]}}))
+"""
+
+
+def measure(statement: str, modules: List[str], runs: int) -> Tuple[float, List[str]]:
+    """
+    Time a statement in fresh interpreters.
+
+    Args:
+        statement: Python code to run
+        modules: Module names to report if loaded afterwards
+        runs: Number of interpreters to start
+
+    Returns:
+        Fastest run in seconds, and the listed modules that were loaded
+    """
+    env = dict(os.environ, PYTHONPATH=SDK_ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    code = _CHILD.format(statement=statement, modules=modules)
+    timings = []
+    loaded: List[str] = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            env=env,
+            cwd=SDK_ROOT,
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout
+        result = json.loads(output)
+        timings.append(result["seconds"])
+        loaded = result["loaded"]
+    return min(timings), loaded
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark; returns 1 on regression."""
+    parser = argparse.ArgumentParser(description="Import-time benchmark for the Dandolo SDK")
+    parser.add_argument("--runs", type=int, default=15, help="Fresh interpreters per scenario")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed relative slowdown")
+    parser.add_argument("--slack-ms", type=float, default=10.0, help="Allowed absolute slowdown in milliseconds")
+    parser.add_argument("--baseline", default=baseline_path(SUITE), help="Baseline JSON file")
+    parser.add_argument("--update", action="store_true", help="Record the results as the new baseline")
+    args = parser.parse_args(argv)
+
+    baseline = None if args.update else load_baseline(args.baseline)
+    results: Dict[str, float] = {}
+    eager: Dict[str, List[str]] = {}
+
+    for name, statement, forbidden in SCENARIOS:
+        results[name], eager[name] = measure(statement, forbidden, args.runs)
+
+    regressed = regressions(results, baseline, args.tolerance, args.slack_ms / 1000)
+    for name, seconds in results.items():
+        line = f"{name:<30} {seconds * 1000:8.1f} ms"
+        if baseline is not None and name in baseline:
+            line += f"   baseline {baseline[name] * 1000:8.1f} ms"
+        if name in regressed:
+            line += "   REGRESSION"
+        if eager[name]:
+            line += f"   loads {', '.join(eager[name])} eagerly"
+        print(line)
+
+    append_history(SUITE, results)
+    failed = bool(regressed) or any(eager.values())
+    if args.update or baseline is None:
+        save_baseline(args.baseline, results)
+        print(f"Baseline written to {args.baseline}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
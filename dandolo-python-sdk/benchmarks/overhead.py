@@ -0,0 +1,240 @@
+"""
+Dandolo SDK Overhead Benchmarks
+
+Offline micro-benchmarks of the time the client itself spends per call:
+request handling in _request, JSON encoding and decoding of small and
+large histories, response object construction, the retry path and
+concurrent throughput. Every request goes to an in-process transport
+that returns a prebuilt response, so no network is involved and the
+numbers are the SDK's share of a request's latency.
+
+Each run is appended to benchmarks/results/overhead.jsonl; timings that
+exceed the committed baseline by more than the tolerance are flagged and
+make the script exit with status 1.
+
+Usage:
+    python benchmarks/overhead.py                 # run and compare with the baseline
+    python benchmarks/overhead.py --quick         # fewer iterations
+    python benchmarks/overhead.py -k encode       # only benchmarks matching "encode"
+    python benchmarks/overhead.py --update        # record a new baseline
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from baseline import append_history, baseline_path, load_baseline, regressions, save_baseline
+
+from dandolo import ChatCompletion, Conversation, Dandolo, MockResponse, RetryBudget, RetryPolicy, Transport
+from dandolo.serialization import get_serializer
+
+SUITE = "overhead"
+
+COMPLETION = {
+    "id": "chatcmpl-benchmark",
+    "object": "chat.completion",
+    "created": 1700000000,
+    "model": "llama-3.3-70b",
+    "choices": [{
+        "index": 0,
+        "message": {"role": "assistant", "content": "The capital of France is Paris."},
+        "finish_reason": "stop"
+    }],
+    "usage": {"prompt_tokens": 24, "completion_tokens": 8, "total_tokens": 32}
+}
+
+SMALL_HISTORY = [
+    {"role": "system", "content": "You are a helpful assistant."},
+    {"role": "user", "content": "What's the capital of France?"},
+    {"role": "assistant", "content": "The capital of France is Paris."}
+]
+
+# About 100k tokens: a long agent session
+LARGE_HISTORY = [
+    {"role": "user" if i % 2 == 0 else "assistant", "content": f"Turn {i}: " + "lorem ipsum dolor sit amet " * 75}
+    for i in range(200)
+]
+
+
+class StaticTransport(Transport):
+    """Answers every request with the same prebuilt response."""
+    
+    def __init__(self, responses: List[MockResponse], latency: float = 0.0):
+        self._responses = itertools.cycle(responses)
+        self.latency = latency
+    
+    def request(self, method, url, headers=None, content=None, timeout=None, stream=False):
+        if self.latency:
+            time.sleep(self.latency)
+        return next(self._responses)
+
+
+def make_client(responses: Optional[List[MockResponse]] = None, latency: float = 0.0, **kwargs) -> Dandolo:
+    return Dandolo(
+        api_key="dk_benchmark",
+        transport=StaticTransport(responses or [MockResponse(json_data=COMPLETION)], latency),
+        **kwargs
+    )
+
+
+def per_call(fn: Callable[[], Any], number: int, repeat: int) -> float:
+    """
+    Time a function.
+    
+    Returns:
+        Seconds per call of the fastest of repeat rounds of number calls
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def throughput(client: Dandolo, requests: int, concurrency: int, repeat: int = 3) -> float:
+    """
+    Run batches of concurrent requests.
+    
+    Returns:
+        Wall-clock seconds per request of the fastest batch
+    """
+    batch = [{"messages": SMALL_HISTORY}] * requests
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = client.chat.completions.batch(batch, max_concurrency=concurrency)
+        best = min(best, (time.perf_counter() - start) / requests)
+        if results.error_count:
+            raise RuntimeError(f"{results.error_count} benchmark requests failed")
+    return best
+
+
+def benchmarks(scale: float) -> List[Tuple[str, Callable[[], float]]]:
+    """
+    Build the benchmark list.
+    
+    Args:
+        scale: Iteration multiplier (below 1 for quick runs)
+    
+    Returns:
+        (name, run) pairs; run returns seconds per operation
+    """
+    def n(count: int) -> int:
+        return max(1, int(count * scale))
+    
+    client = make_client()
+    completions = client.chat.completions
+    small_data = {"model": "auto-select", "messages": SMALL_HISTORY, "stream": False}
+    conversation = Conversation(LARGE_HISTORY)
+    conversation.encode(client.serializer)
+    
+    failing = MockResponse(503, json_data={"error": {"message": "upstream unavailable"}})
+    retry_client = make_client(
+        [failing, failing, MockResponse(json_data=COMPLETION)],
+        retry_policy=RetryPolicy(
+            max_retries=3,
+            base_delay=0.0,
+            max_delay=0.0,
+            budget=RetryBudget(ratio=10.0, min_retries_per_second=1e9)
+        )
+    )
+    
+    suite: List[Tuple[str, Callable[[], float]]] = [
+        ("transport floor", lambda: per_call(
+            lambda: client.transport.request("POST", "http://benchmark/v1/chat/completions"), n(50000), 5)),
+        ("_request small", lambda: per_call(
+            lambda: client._request("POST", "/v1/chat/completions", small_data), n(20000), 5)),
+        ("create small", lambda: per_call(
+            lambda: completions.create(messages=SMALL_HISTORY), n(20000), 5)),
+        ("create large", lambda: per_call(
+            lambda: completions.create(messages=LARGE_HISTORY), n(500), 5)),
+        ("create large conversation", lambda: per_call(
+            lambda: completions.create(messages=conversation), n(2000), 5)),
+        ("retry path (2 failures)", lambda: per_call(
+            lambda: retry_client.chat.completions.create(messages=SMALL_HISTORY), n(5000), 5)),
+        ("ChatCompletion.from_dict", lambda: per_call(
+            lambda: ChatCompletion.from_dict(COMPLETION), n(100000), 5)),
+        ("ChatCompletion content access", lambda: per_call(
+            lambda: ChatCompletion.from_dict(COMPLETION).choices[0].message.content, n(50000), 5)),
+        ("throughput 16 threads", lambda: throughput(make_client(max_workers=16), n(5000), 16)),
+        ("throughput 64 threads, 5ms upstream", lambda: throughput(
+            make_client(latency=0.005, max_workers=64), n(3000), 64)),
+    ]
+    
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            serializer = get_serializer(name)
+        except ImportError:
+            continue
+        small_bytes = serializer.dumps(SMALL_HISTORY)
+        large_bytes = serializer.dumps(LARGE_HISTORY)
+        suite += [
+            (f"encode small [{name}]", lambda s=serializer: per_call(lambda: s.dumps(SMALL_HISTORY), n(50000), 5)),
+            (f"encode large [{name}]", lambda s=serializer: per_call(lambda: s.dumps(LARGE_HISTORY), n(500), 5)),
+            (f"decode small [{name}]", lambda s=serializer, b=small_bytes: per_call(lambda: s.loads(b), n(50000), 5)),
+            (f"decode large [{name}]", lambda s=serializer, b=large_bytes: per_call(lambda: s.loads(b), n(500), 5)),
+        ]
+    return suite
+
+
+def format_time(seconds: float) -> str:
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:9.2f} ms"
+    return f"{seconds * 1e6:9.2f} us"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the suite; returns 1 on regression."""
+    parser = argparse.ArgumentParser(description="Offline overhead benchmarks for the Dandolo SDK")
+    parser.add_argument("-k", dest="pattern", help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--quick", action="store_true", help="Run a tenth of the iterations")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative slowdown")
+    parser.add_argument("--slack-us", type=float, default=2.0, help="Allowed absolute slowdown in microseconds")
+    parser.add_argument("--baseline", default=baseline_path(SUITE), help="Baseline JSON file")
+    parser.add_argument("--update", action="store_true", help="Record the results as the new baseline")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    args = parser.parse_args(argv)
+    
+    baseline = None if args.update else load_baseline(args.baseline)
+    results: Dict[str, float] = {}
+    for name, run in benchmarks(0.1 if args.quick else 1.0):
+        if args.pattern and args.pattern not in name:
+            continue
+        results[name] = run()
+        if not args.json:
+            line = f"{name:<40} {format_time(results[name])}"
+            if baseline is not None and name in baseline:
+                change = results[name] / baseline[name] - 1 if baseline[name] else 0.0
+                line += f"   baseline {format_time(baseline[name])}  {change:+6.1%}"
+            print(line, flush=True)
+    
+    regressed = regressions(results, baseline, args.tolerance, args.slack_us / 1e6)
+    if args.json:
+        print(json.dumps({"results": results, "regressions": regressed}, indent=2))
+    else:
+        if "create small" in results and "transport floor" in results:
+            overhead = results["create small"] - results["transport floor"]
+            print(f"\nClient overhead per create(): {format_time(overhead).strip()}")
+        for name in regressed:
+            print(f"REGRESSION: {name}")
+    
+    append_history(SUITE, results)
+    if args.update or baseline is None:
+        if args.pattern or args.quick:
+            print("Not writing a baseline from a partial or quick run", file=sys.stderr)
+        else:
+            save_baseline(args.baseline, results)
+            print(f"Baseline written to {args.baseline}")
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
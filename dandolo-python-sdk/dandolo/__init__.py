@@ -15,31 +15,191 @@ Example:
     print(response.choices[0].message.content)
 """
 
-from .client import Dandolo
-from .exceptions import (
-    DandoloError,
-    AuthenticationError,
-    RateLimitError,
-    ModelNotFoundError,
-    ValidationError
-)
-from .types import (
-    ChatCompletion,
-    ChatMessage,
-    Choice,
-    Usage,
-    Model
-)
+import importlib
+from typing import TYPE_CHECKING
+
+# Public names and the submodule defining each. Submodules are imported on
+# first attribute access, so `from dandolo import Dandolo` loads the sync
+# client only, and optional backends load when they are first used.
+_LAZY_ATTRIBUTES = {
+    "Dandolo": "client",
+    "AsyncDandolo": "async_client",
+    "BatchItem": "batch",
+    "BatchResult": "batch",
+    "ResponseCache": "cache",
+    "CacheStats": "cache",
+    "DiskCache": "disk_cache",
+    "RateLimiter": "rate_limit",
+    "RetryPolicy": "retry",
+    "RetryBudget": "retry",
+    "HedgePolicy": "hedging",
+    "CircuitBreaker": "circuit_breaker",
+    "CircuitBreakerRegistry": "circuit_breaker",
+    "LoadBalancer": "balancer",
+    "ConnectionPool": "pool",
+    "PoolStats": "pool",
+    "TokenEstimator": "tokens",
+    "Conversation": "conversation",
+    "TrimPolicy": "conversation",
+    "SummarizePolicy": "conversation",
+    "SingleFlight": "singleflight",
+    "SingleFlightStats": "singleflight",
+    "Compression": "compression",
+    "CompressionStats": "compression",
+    "RequestHooks": "hooks",
+    "RequestEvent": "hooks",
+    "RequestTiming": "hooks",
+    "opentelemetry_hooks": "hooks",
+    "MockServer": "mock_server",
+    "MockServerConfig": "mock_server",
+    "Latency": "mock_server",
+    "LoadGenerator": "bench",
+    "BenchReport": "bench",
+    "Serializer": "serialization",
+    "get_serializer": "serialization",
+    "Transport": "transport",
+    "RequestsTransport": "transport",
+    "HTTPXTransport": "transport",
+    "MockTransport": "transport",
+    "MockRequest": "transport",
+    "MockResponse": "transport",
+    "DandoloError": "exceptions",
+    "AuthenticationError": "exceptions",
+    "RateLimitError": "exceptions",
+    "ModelNotFoundError": "exceptions",
+    "ValidationError": "exceptions",
+    "ServerError": "exceptions",
+    "NetworkError": "exceptions",
+    "CircuitOpenError": "exceptions",
+    "Stream": "streaming",
+    "AsyncStream": "streaming",
+    "accumulate_chunks": "streaming",
+    "ChatCompletion": "types",
+    "ChatCompletionChunk": "types",
+    "ChatMessage": "types",
+    "Choice": "types",
+    "Usage": "types",
+    "Model": "types"
+}
+
+if TYPE_CHECKING:  # pragma: no cover - static analysis only
+    from .client import Dandolo
+    from .async_client import AsyncDandolo
+    from .batch import BatchItem, BatchResult
+    from .cache import ResponseCache, CacheStats
+    from .disk_cache import DiskCache
+    from .rate_limit import RateLimiter
+    from .retry import RetryPolicy, RetryBudget
+    from .hedging import HedgePolicy
+    from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+    from .balancer import LoadBalancer
+    from .pool import ConnectionPool, PoolStats
+    from .tokens import TokenEstimator
+    from .conversation import Conversation, TrimPolicy, SummarizePolicy
+    from .singleflight import SingleFlight, SingleFlightStats
+    from .compression import Compression, CompressionStats
+    from .hooks import RequestHooks, RequestEvent, RequestTiming, opentelemetry_hooks
+    from .mock_server import MockServer, MockServerConfig, Latency
+    from .bench import LoadGenerator, BenchReport
+    from .serialization import Serializer, get_serializer
+    from .transport import (
+        Transport,
+        RequestsTransport,
+        HTTPXTransport,
+        MockTransport,
+        MockRequest,
+        MockResponse
+    )
+    from .exceptions import (
+        DandoloError,
+        AuthenticationError,
+        RateLimitError,
+        ModelNotFoundError,
+        ValidationError,
+        ServerError,
+        NetworkError,
+        CircuitOpenError
+    )
+    from .streaming import Stream, AsyncStream, accumulate_chunks
+    from .types import (
+        ChatCompletion,
+        ChatCompletionChunk,
+        ChatMessage,
+        Choice,
+        Usage,
+        Model
+    )
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __version__ = "1.0.0"
 __all__ = [
     "Dandolo",
+    "AsyncDandolo",
     "DandoloError",
     "AuthenticationError", 
     "RateLimitError",
     "ModelNotFoundError",
     "ValidationError",
+    "ServerError",
+    "NetworkError",
+    "CircuitOpenError",
+    "BatchItem",
+    "BatchResult",
+    "ResponseCache",
+    "CacheStats",
+    "DiskCache",
+    "RateLimiter",
+    "RetryPolicy",
+    "RetryBudget",
+    "HedgePolicy",
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "LoadBalancer",
+    "ConnectionPool",
+    "PoolStats",
+    "Transport",
+    "RequestsTransport",
+    "HTTPXTransport",
+    "MockTransport",
+    "MockRequest",
+    "MockResponse",
+    "TokenEstimator",
+    "Conversation",
+    "TrimPolicy",
+    "SummarizePolicy",
+    "SingleFlight",
+    "SingleFlightStats",
+    "Compression",
+    "CompressionStats",
+    "RequestHooks",
+    "RequestEvent",
+    "RequestTiming",
+    "opentelemetry_hooks",
+    "MockServer",
+    "MockServerConfig",
+    "Latency",
+    "LoadGenerator",
+    "BenchReport",
+    "Serializer",
+    "get_serializer",
+    "Stream",
+    "AsyncStream",
+    "accumulate_chunks",
     "ChatCompletion",
+    "ChatCompletionChunk",
     "ChatMessage",
     "Choice",
     "Usage",
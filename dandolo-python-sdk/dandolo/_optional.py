@@ -0,0 +1,38 @@
+"""
+Dandolo SDK Optional Dependencies
+
+Optional backends (fast JSON, HTTP/2, zstd, tiktoken, Arrow) are imported
+on first use rather than with the package, so `import dandolo` only pays
+for what a process actually touches.
+"""
+
+import importlib
+from types import ModuleType
+from typing import Dict, Optional
+
+
+_modules: Dict[str, Optional[ModuleType]] = {}
+
+
+def optional_import(name: str) -> Optional[ModuleType]:
+    """
+    Import an optional dependency on first use.
+    
+    The outcome is remembered, so later calls are a dictionary lookup.
+    
+    Args:
+        name: Module name, e.g. "orjson"
+    
+    Returns:
+        The module, or None if it is not installed
+    """
+    try:
+        return _modules[name]
+    except KeyError:
+        pass
+    try:
+        module = importlib.import_module(name)
+    except ImportError:
+        module = None
+    _modules[name] = module
+    return module
\ No newline at end of file
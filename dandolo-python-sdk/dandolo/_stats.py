@@ -0,0 +1,24 @@
+"""
+Dandolo SDK Percentiles
+
+One percentile definition shared by the hedge delay, batch results and
+the load generator, so their numbers can be compared.
+"""
+
+import math
+from typing import Sequence
+
+
+def percentile(sorted_values: Sequence[float], p: float) -> float:
+    """
+    Nearest-rank percentile of pre-sorted values.
+    
+    Args:
+        sorted_values: Values in ascending order (at least one)
+        p: Percentile between 0 and 100
+    
+    Returns:
+        The smallest value with at least p percent of the values at or below it
+    """
+    rank = math.ceil(len(sorted_values) * p / 100.0)
+    return sorted_values[min(len(sorted_values), max(1, rank)) - 1]
@@ -0,0 +1,696 @@
+"""
+Dandolo AI Async Client
+
+Asynchronous client for interacting with the Dandolo API from asyncio code.
+Mirrors the Dandolo client surface on top of a shared aiohttp connector.
+
+Requires the optional "async" extra: pip install dandolo-ai[async]
+"""
+
+import asyncio
+import time
+from typing import List, Dict, Any, Optional, Union
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from .cache import cache_key, is_cacheable
+from .catalog import AsyncModelCatalog
+from .exceptions import DandoloError, NetworkError, ServerError, error_from_status
+from .rate_limit import RateLimiter
+from .hedging import HedgePolicy
+from .balancer import LoadBalancer
+from .compression import Compression
+from .conversation import Conversation
+from .hooks import RequestEvent, RequestHooks
+from .singleflight import SingleFlight
+from .circuit_breaker import OPEN, CircuitBreaker, CircuitBreakerRegistry
+from .retry import RetryPolicy
+from .serialization import Serializer, get_serializer
+from .streaming import AsyncStream
+from .tokens import TokenEstimator
+from .types import ChatCompletion, Model
+
+
+def _phase_trace_config() -> "aiohttp.TraceConfig":
+    """aiohttp tracing that records connection pool waits and connection setup for request hooks."""
+    config = aiohttp.TraceConfig()
+    
+    async def queued_start(session, context, params):
+        context.queued = time.perf_counter()
+    
+    async def queued_end(session, context, params):
+        if context.trace_request_ctx is not None:
+            context.trace_request_ctx["queueing"] += time.perf_counter() - context.queued
+    
+    async def create_start(session, context, params):
+        context.connecting = time.perf_counter()
+    
+    async def create_end(session, context, params):
+        if context.trace_request_ctx is not None:
+            context.trace_request_ctx["connect"] += time.perf_counter() - context.connecting
+    
+    config.on_connection_queued_start.append(queued_start)
+    config.on_connection_queued_end.append(queued_end)
+    config.on_connection_create_start.append(create_start)
+    config.on_connection_create_end.append(create_end)
+    return config
+
+
+class AsyncChatCompletions:
+    """Async chat completions endpoint handler."""
+    
+    def __init__(self, client):
+        self.client = client
+    
+    async def create(
+        self,
+        messages: Union[List[Dict[str, str]], Conversation],
+        model: str = "auto-select",
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        stream: bool = False,
+        **kwargs
+    ) -> Union[ChatCompletion, AsyncStream]:
+        """
+        Create a chat completion.
+        
+        Args:
+            messages: List of message objects with 'role' and 'content',
+                or a Conversation (only its new messages are re-encoded)
+            model: Model to use ("auto-select" for intelligent routing)
+            max_tokens: Maximum tokens to generate
+            temperature: Randomness (0.0 to 2.0)
+            stream: Whether to stream the response
+            **kwargs: Additional parameters
+        
+        Returns:
+            ChatCompletion object with response, or an AsyncStream of
+            ChatCompletionChunk objects when stream=True
+        
+        Raises:
+            AuthenticationError: Invalid API key
+            RateLimitError: Rate limit exceeded
+            ModelNotFoundError: Model not available
+            ValidationError: Invalid request parameters
+            DandoloError: Other API errors
+        """
+        conversation = None
+        if isinstance(messages, Conversation):
+            conversation, messages = messages, messages.messages
+        
+        data = {
+            "model": model,
+            "messages": messages,
+            "stream": stream
+        }
+        
+        if max_tokens is not None:
+            data["max_tokens"] = max_tokens
+        if temperature is not None:
+            data["temperature"] = temperature
+        
+        data.update(kwargs)
+        
+        if self.client.validate_models:
+            await self.client.catalog.check_request(model, messages, max_tokens)
+        
+        body = conversation.encode_request(data, self.client.serializer) if conversation is not None else None
+        
+        if stream:
+            hooks = self.client.hooks
+            event = hooks.start("POST", "/v1/chat/completions", data, stream=True) if hooks is not None else None
+            response = await self.client._request("POST", "/v1/chat/completions", data, stream=True, body=body, event=event)
+            return AsyncStream(response, loads=self.client.serializer.loads, hooks=hooks, event=event)
+        
+        cache = self.client.cache
+        key = None
+        if cache is not None and is_cacheable(data):
+            key = cache_key(data)
+            cached = cache.get(key)
+            if cached is not None:
+                # Responses are read-only views, so the cached payload is shared
+                return ChatCompletion.from_dict(cached)
+        
+        async def fetch() -> Dict[str, Any]:
+            if self.client.hedge_policy is not None:
+                response = await self.client.hedge_policy.call_async(
+                    lambda: self.client._request("POST", "/v1/chat/completions", data, body=body)
+                )
+            else:
+                response = await self.client._request("POST", "/v1/chat/completions", data, body=body)
+            
+            if key is not None:
+                cache.set(key, response)
+            return response
+        
+        single_flight = self.client.single_flight
+        if single_flight is not None and is_cacheable(data):
+            # Concurrent identical requests share one upstream call
+            response = await single_flight.do_async(key or cache_key(data), fetch)
+        else:
+            response = await fetch()
+        
+        return ChatCompletion.from_dict(response)
+
+
+class AsyncChat:
+    """Async chat namespace for chat-related endpoints."""
+    
+    def __init__(self, client):
+        self.completions = AsyncChatCompletions(client)
+
+
+class AsyncModels:
+    """Async models endpoint handler."""
+    
+    def __init__(self, client):
+        self.client = client
+    
+    async def list(self, refresh: bool = False) -> List[Model]:
+        """
+        List all available models.
+        
+        Served from the client's model catalog, which is revalidated with
+        the server once its TTL expires.
+        
+        Args:
+            refresh: Revalidate with the server before returning
+        
+        Returns:
+            List of Model objects
+        """
+        return await self.client.catalog.models(refresh=refresh)
+
+
+class AsyncDandolo:
+    """
+    Asynchronous Dandolo client.
+    
+    All requests share one aiohttp connector, so thousands of concurrent
+    completions are multiplexed over a bounded connection pool without
+    tying up a thread each.
+    
+    Example:
+        async with AsyncDandolo(api_key="ak_your_agent_key") as client:
+            response = await client.chat.completions.create(
+                messages=[{"role": "user", "content": "Hello!"}]
+            )
+            
+            results = await asyncio.gather(*[
+                client.chat.completions.create(messages=[{"role": "user", "content": p}])
+                for p in prompts
+            ])
+    """
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Union[str, List[str]] = "https://api.dandolo.ai",
+        timeout: int = 60,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        max_connections: int = 100,
+        max_connections_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        cache: Optional[Any] = None,
+        model_catalog_ttl: float = 300.0,
+        validate_models: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+        load_balancer: Optional[LoadBalancer] = None,
+        serializer: Optional[Union[Serializer, str]] = None,
+        compression: Optional[Compression] = None,
+        single_flight: Optional[SingleFlight] = None,
+        token_estimator: Optional[TokenEstimator] = None,
+        hooks: Optional[RequestHooks] = None
+    ):
+        """
+        Initialize async Dandolo client.
+        
+        Args:
+            api_key: Your Dandolo API key (dk_ or ak_ prefix)
+            base_url: Base URL for the Dandolo API, or a list of base URLs
+                to balance across with failover
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retries for failed requests
+            retry_delay: Base delay between retries in seconds
+            max_connections: Total connection pool size (0 for unlimited)
+            max_connections_per_host: Per-host pool size (0 for unlimited)
+            keepalive_timeout: Seconds an idle pooled connection is kept open
+            cache: Optional ResponseCache or DiskCache for deterministic
+                (temperature=0) completions
+            model_catalog_ttl: Seconds the cached model list is trusted
+                before it is revalidated in the background
+            validate_models: Reject unknown models and over-long prompts
+                locally using the cached model catalog
+            rate_limiter: Optional RateLimiter that queues requests to stay
+                within per-second and daily quotas
+            retry_policy: Retry behaviour; defaults to a RetryPolicy built
+                from max_retries and retry_delay
+            hedge_policy: Optional HedgePolicy that duplicates slow
+                non-streaming completions to cut tail latency
+            circuit_breakers: Optional CircuitBreakerRegistry that fails
+                fast while the base URL or a model is unhealthy
+            load_balancer: Optional LoadBalancer with tuned settings; its
+                endpoints take precedence over base_url
+            serializer: JSON codec, or the name of one ("orjson", "msgspec",
+                "json"); defaults to the fastest installed
+            compression: Optional Compression for large request bodies,
+                with automatic fallback for servers that reject them
+            single_flight: Optional SingleFlight that merges identical
+                deterministic requests in flight at the same time
+            token_estimator: Token counter used by validate_models (the
+                heuristic TokenEstimator by default)
+            hooks: Optional RequestHooks called before and after each
+                attempt, on retries, errors and streamed chunks, with a
+                timing breakdown of every attempt
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncDandolo requires aiohttp. Install it with: pip install dandolo-ai[async]"
+            )
+        
+        if not api_key:
+            raise ValueError("API key is required")
+        
+        if not (api_key.startswith("dk_") or api_key.startswith("ak_")):
+            raise ValueError("API key must start with 'dk_' (developer) or 'ak_' (agent)")
+        
+        self.api_key = api_key
+        urls = [base_url] if isinstance(base_url, str) else list(base_url)
+        if load_balancer is None and len(urls) > 1:
+            load_balancer = LoadBalancer(urls)
+        self.load_balancer = load_balancer
+        self.base_url = load_balancer.urls[0] if load_balancer is not None else urls[0].rstrip("/")
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.cache = cache
+        self.validate_models = validate_models
+        self.token_estimator = token_estimator or TokenEstimator()
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_retries=max_retries,
+            base_delay=retry_delay
+        )
+        self.hedge_policy = hedge_policy
+        self.circuit_breakers = circuit_breakers
+        self.compression = compression
+        self.single_flight = single_flight
+        self.hooks = hooks
+        self.serializer = serializer if isinstance(serializer, Serializer) else get_serializer(serializer)
+        
+        # Initialize endpoint handlers
+        self.chat = AsyncChat(self)
+        self.models = AsyncModels(self)
+        self.catalog = AsyncModelCatalog(self, ttl=model_catalog_ttl)
+        
+        # Session is created lazily so it binds to the running event loop
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "User-Agent": "dandolo-python-sdk/1.0.0"
+        }
+    
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """Shared aiohttp session, created on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                trace_configs=[_phase_trace_config()] if self.hooks is not None else None
+            )
+        return self._session
+    
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+        raw: bool = False,
+        body: Optional[bytes] = None,
+        event: Optional[RequestEvent] = None
+    ) -> Any:
+        """
+        Make an HTTP request with automatic retries and error handling.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            data: Request data (for POST requests)
+            stream: Return the open response without reading the body
+            headers: Extra request headers
+            raw: Return the aiohttp response, with its body already read,
+                instead of parsed JSON; 304 Not Modified is returned rather
+                than raised
+            body: Pre-encoded request body, sent instead of encoding data
+            event: Hook event for the call, when the caller needs it
+                afterwards (streams); created here if hooks are set
+        
+        Returns:
+            Parsed JSON response, or the aiohttp.ClientResponse when stream
+            (unread) or raw is set
+        
+        Raises:
+            Various DandoloError subclasses based on response
+        """
+        method = method.upper()
+        if method not in ("GET", "POST"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
+        hooks = self.hooks
+        if hooks is not None and event is None:
+            event = hooks.start(method, endpoint, data, stream)
+        if event is None:
+            return await self._send(method, endpoint, data, stream, headers, raw, body)
+        
+        try:
+            return await self._send(method, endpoint, data, stream, headers, raw, body, event)
+        except BaseException as exc:
+            if event.error is not exc:
+                # Raised outside status handling: client-side rate limit,
+                # open circuit, transport error or cancellation
+                event.error = exc
+                event.retry_delay = None
+                event.finish_attempt()
+            hooks.emit("on_error", event)
+            raise
+    
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        stream: bool,
+        headers: Optional[Dict[str, str]],
+        raw: bool,
+        body: Optional[bytes],
+        event: Optional[RequestEvent] = None
+    ) -> Any:
+        """Send a request with retries and failover; see _request()."""
+        hooks = self.hooks
+        if stream:
+            # Bound the wait for each read, not the whole generation
+            timeout = aiohttp.ClientTimeout(total=None, sock_connect=self.timeout, sock_read=self.timeout)
+            headers = {**(headers or {}), "Accept": "text/event-stream"}
+        else:
+            timeout = aiohttp.ClientTimeout(total=self.timeout)
+        
+        if self.compression is not None:
+            headers = {**(headers or {}), "Accept-Encoding": self.compression.accept_encoding}
+        if body is None and data is not None and method == "POST":
+            body = self.serializer.dumps(data)
+        compressed_body: Optional[bytes] = None
+        fallback = False
+        policy = self.retry_policy
+        policy.budget.record_request()
+        attempt = 0
+        delay = 0.0
+        failed_urls: set = set()
+        base_url = self._choose_endpoint(failed_urls)
+        
+        while True:
+            url = f"{base_url}{endpoint}"
+            if event is not None:
+                event.begin_attempt(url, attempt)
+            if self.rate_limiter is not None:
+                waiting = time.perf_counter()
+                await self.rate_limiter.acquire_async()
+                if event is not None:
+                    event.timing.queueing += time.perf_counter() - waiting
+            breakers = self._circuits_for(base_url, data)
+            trials = self._admit(breakers)
+            if event is not None:
+                hooks.emit("before_request", event)
+            started = self.load_balancer.start(base_url) if self.load_balancer is not None else 0.0
+            settled = False
+            
+            try:
+                content, attempt_headers = body, headers
+                compressing = self.compression is not None and self.compression.should_compress(body, base_url)
+                if compressing:
+                    if compressed_body is None:
+                        compressed_body = self.compression.compress(body)
+                    content = compressed_body
+                    attempt_headers = {**(headers or {}), "Content-Encoding": self.compression.algorithm}
+                
+                phases = {"queueing": 0.0, "connect": 0.0} if event is not None else None
+                sending = time.perf_counter()
+                try:
+                    response = await self.session.request(
+                        method,
+                        url,
+                        data=content,
+                        headers=attempt_headers,
+                        timeout=timeout,
+                        trace_request_ctx=phases
+                    )
+                except asyncio.TimeoutError:
+                    error = NetworkError("Request timeout")
+                except aiohttp.ClientConnectionError:
+                    error = NetworkError("Connection error")
+                else:
+                    if event is not None:
+                        event.record_transport(time.perf_counter() - sending, phases["queueing"], phases["connect"])
+                        event.status_code = response.status
+                    
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.update_from_headers(response.headers)
+                        if response.status == 429:
+                            self.rate_limiter.on_rate_limited(response.headers.get("Retry-After"))
+                        elif response.status < 400:
+                            self.rate_limiter.on_success()
+                    
+                    if self.compression is not None and body is not None:
+                        fallback = self.compression.check_response(base_url, response.status, compressing, fallback)
+                        if fallback:
+                            # The server may not decode compressed bodies: resend uncompressed
+                            response.release()
+                            self._record_outcome(base_url, breakers, started, None)
+                            settled = True
+                            if event is not None:
+                                event.finish_attempt()
+                                hooks.emit("after_response", event)
+                            continue
+                    
+                    # Handle different status codes
+                    if response.status == 200 or (raw and response.status == 304):
+                        self._record_outcome(base_url, breakers, started, None)
+                        settled = True
+                        if event is None:
+                            if stream:
+                                return response
+                            if raw:
+                                # Reading to EOF frees the connection and keeps the body for read()
+                                await response.read()
+                                return response
+                            async with response:
+                                return self.serializer.loads(await response.read())
+                        
+                        result = response
+                        if raw:
+                            reading = time.perf_counter()
+                            await response.read()
+                            event.timing.body_read = time.perf_counter() - reading
+                        elif not stream:
+                            async with response:
+                                reading = time.perf_counter()
+                                payload = await response.read()
+                                decoding = time.perf_counter()
+                                result = self.serializer.loads(payload)
+                                event.timing.body_read = decoding - reading
+                                event.timing.decode = time.perf_counter() - decoding
+                        event.finish_attempt()
+                        hooks.emit("after_response", event)
+                        return result
+                    
+                    async with response:
+                        error = error_from_status(
+                            response.status,
+                            await self._error_data(response),
+                            endpoint,
+                            retry_after=response.headers.get("Retry-After")
+                        )
+                    if event is not None:
+                        event.error = error
+                        event.finish_attempt()
+                        hooks.emit("after_response", event)
+                
+                self._record_outcome(base_url, breakers, started, error)
+                settled = True
+            except BaseException:
+                # Includes cancellation by wait_for or of a losing hedge
+                if not settled:
+                    self._abandon(base_url, trials)
+                raise
+            delay = policy.next_delay(attempt, error, delay)
+            if event is not None:
+                if event.error is None:
+                    event.error = error
+                    event.record_transport(time.perf_counter() - sending, phases["queueing"], phases["connect"])
+                    event.finish_attempt()
+                event.retry_delay = delay
+                if delay is not None:
+                    hooks.emit("on_retry", event)
+            if delay is None:
+                raise error
+            if isinstance(error, (ServerError, NetworkError)):
+                failed_urls.add(base_url)
+            next_url = self._choose_endpoint(failed_urls)
+            if next_url == base_url:
+                await asyncio.sleep(delay)
+            # Otherwise fail over to the other endpoint without waiting
+            base_url = next_url
+            attempt += 1
+    
+    def _choose_endpoint(self, exclude: set) -> str:
+        """Base URL for the next attempt, avoiding failed and open-circuit endpoints."""
+        if self.load_balancer is None:
+            return self.base_url
+        unavailable = set(exclude)
+        if self.circuit_breakers is not None:
+            unavailable.update(
+                url for url in self.load_balancer.urls
+                if self._url_circuit(url).state == OPEN
+            )
+        return self.load_balancer.choose(unavailable)
+    
+    def _url_circuit(self, base_url: str) -> CircuitBreaker:
+        """Circuit breaker of one base URL."""
+        # No background probe; open circuits recover through half-open trials
+        return self.circuit_breakers.get(f"url:{base_url}")
+    
+    def _circuits_for(self, base_url: str, data: Optional[Dict[str, Any]]) -> List[CircuitBreaker]:
+        """Circuit breakers guarding a request: the base URL and the model."""
+        if self.circuit_breakers is None:
+            return []
+        breakers = [self._url_circuit(base_url)]
+        model = (data or {}).get("model")
+        if model:
+            breakers.append(self.circuit_breakers.get(f"model:{model}"))
+        return breakers
+    
+    def _admit(self, breakers: List[CircuitBreaker]) -> List[CircuitBreaker]:
+        """
+        Pass a request through every breaker, or through none of them.
+        
+        Returns:
+            The breakers whose half-open trial slot the request holds
+        
+        Raises:
+            CircuitOpenError: A breaker refused; slots already taken are freed
+        """
+        trials: List[CircuitBreaker] = []
+        try:
+            for breaker in breakers:
+                if breaker.before_request():
+                    trials.append(breaker)
+        except BaseException:
+            for breaker in trials:
+                breaker.release()
+            raise
+        return trials
+    
+    def _abandon(self, base_url: str, trials: List[CircuitBreaker]) -> None:
+        """Undo the bookkeeping of an attempt that raised before its outcome was recorded."""
+        if self.load_balancer is not None:
+            self.load_balancer.release(base_url)
+        for breaker in trials:
+            breaker.release()
+    
+    def _record_outcome(
+        self,
+        base_url: str,
+        breakers: List[CircuitBreaker],
+        started: float,
+        error: Optional[Exception]
+    ) -> None:
+        """Feed a request outcome to the load balancer and circuit breakers."""
+        failed = isinstance(error, (ServerError, NetworkError))
+        if self.load_balancer is not None:
+            self.load_balancer.finish(base_url, started, failed)
+        for breaker in breakers:
+            if failed:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+    
+    async def _error_data(self, response) -> Any:
+        """Decode an error response body, tolerating non-JSON bodies."""
+        try:
+            content = await response.read()
+            return (self.serializer.loads(content) if content else None) or {}
+        except ValueError:
+            return {}
+    
+    async def validate_key(self) -> Dict[str, Any]:
+        """
+        Validate the API key and get usage information.
+        
+        Returns:
+            Dictionary with key information (see Dandolo.validate_key)
+        """
+        try:
+            # The cached catalog avoids refetching the model list on every check
+            await self.catalog.models()
+            
+            key_type = "agent" if self.api_key.startswith("ak_") else "developer"
+            daily_limit = 5000 if key_type == "agent" else 500
+            
+            return {
+                "is_valid": True,
+                "key_type": key_type,
+                "daily_usage": 0,  # Would be fetched from actual usage endpoint
+                "daily_limit": daily_limit,
+                "remaining": daily_limit
+            }
+        except DandoloError:
+            return {
+                "is_valid": False,
+                "key_type": None,
+                "daily_usage": None,
+                "daily_limit": None,
+                "remaining": None
+            }
+    
+    async def get_usage(self) -> Dict[str, Any]:
+        """
+        Get current usage statistics.
+        
+        Returns:
+            Dictionary with usage information
+        """
+        return await self.validate_key()
+    
+    async def close(self) -> None:
+        """Close the shared session and its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self.hedge_policy is not None:
+            self.hedge_policy.close()
+        if self.circuit_breakers is not None:
+            self.circuit_breakers.close()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
\ No newline at end of file
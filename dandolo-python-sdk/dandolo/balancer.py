@@ -0,0 +1,230 @@
+"""
+Dandolo SDK Load Balancing
+
+Client-side balancing across several API endpoints: latency-aware
+selection, ejection of failing endpoints and automatic reinstatement.
+"""
+
+import math
+import random
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class Endpoint:
+    """Health and latency state of one base URL."""
+    
+    def __init__(self, url: str):
+        self.url = url
+        self.ewma = 0.0
+        self.inflight = 0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.times_ejected = 0
+        self.ejected_until = 0.0
+        self._updated = 0.0
+    
+    def is_ejected(self, now: float) -> bool:
+        return now < self.ejected_until
+    
+    def score(self) -> float:
+        """Expected cost of sending one more request here (lower is better)."""
+        return self.ewma * (self.inflight + 1)
+
+
+class LoadBalancer:
+    """
+    Power-of-two-choices balancer over peak-EWMA latency.
+    
+    Each request samples two healthy endpoints and picks the one with the
+    lower latency estimate weighted by its in-flight requests, so traffic
+    drifts to the faster edge without stampeding it. Endpoints that fail
+    max_failures times in a row are ejected for ejection_time, doubling on
+    each repeated ejection up to max_ejection_time, and return on their own
+    once the ejection expires. Endpoints without measurements score zero,
+    so new and reinstated endpoints are tried promptly.
+    
+    Example:
+        client = Dandolo(
+            api_key="ak_your_agent_key",
+            base_url=["https://api.dandolo.ai", "https://eu.dandolo.example"]
+        )
+        print(client.load_balancer.snapshot())
+    """
+    
+    def __init__(
+        self,
+        endpoints: Iterable[str],
+        decay: float = 10.0,
+        max_failures: int = 3,
+        ejection_time: float = 30.0,
+        max_ejection_time: float = 300.0,
+        failure_penalty: float = 5.0
+    ):
+        """
+        Initialize the balancer.
+        
+        Args:
+            endpoints: Base URLs to balance across
+            decay: Seconds over which old latency samples lose most of their weight
+            max_failures: Consecutive failures that eject an endpoint
+            ejection_time: Seconds an endpoint is ejected the first time
+            max_ejection_time: Upper bound for repeated ejections
+            failure_penalty: Latency in seconds charged for a failed request,
+                so fast failures do not attract traffic
+        """
+        self._endpoints = [Endpoint(url.rstrip("/")) for url in endpoints]
+        if not self._endpoints:
+            raise ValueError("At least one endpoint is required")
+        self._by_url = {endpoint.url: endpoint for endpoint in self._endpoints}
+        self.decay = decay
+        self.max_failures = max_failures
+        self.ejection_time = ejection_time
+        self.max_ejection_time = max_ejection_time
+        self.failure_penalty = failure_penalty
+        self._lock = threading.Lock()
+    
+    @property
+    def urls(self) -> List[str]:
+        """Configured base URLs, in order."""
+        return [endpoint.url for endpoint in self._endpoints]
+    
+    def choose(self, exclude: Iterable[str] = ()) -> str:
+        """
+        Pick the endpoint for the next attempt.
+        
+        Args:
+            exclude: URLs to avoid, e.g. ones that already failed this request
+        
+        Returns:
+            Base URL. Excluded or ejected endpoints are only returned when
+            nothing else is left.
+        """
+        excluded = set(exclude)
+        with self._lock:
+            now = time.monotonic()
+            healthy = [e for e in self._endpoints if not e.is_ejected(now)]
+            candidates = [e for e in healthy if e.url not in excluded] or healthy
+            if not candidates:
+                # Everything is ejected: use whichever comes back first
+                return min(self._endpoints, key=lambda e: e.ejected_until).url
+            if len(candidates) == 1:
+                return candidates[0].url
+            first, second = random.sample(candidates, 2)
+            return (first if first.score() <= second.score() else second).url
+    
+    def start(self, url: str) -> float:
+        """
+        Mark a request as in flight.
+        
+        Args:
+            url: Endpoint the request is sent to
+        
+        Returns:
+            Start time to pass to finish()
+        """
+        with self._lock:
+            endpoint = self._by_url.get(url)
+            if endpoint is not None:
+                endpoint.inflight += 1
+                endpoint.requests += 1
+        return time.monotonic()
+    
+    def release(self, url: str) -> None:
+        """
+        Free the in-flight slot of a request that ended without an outcome.
+        
+        Unlike finish(), no latency sample is taken and the failure count
+        is left alone, so a cancelled request neither flatters nor
+        penalises the endpoint.
+        
+        Args:
+            url: Endpoint the request was sent to
+        """
+        with self._lock:
+            endpoint = self._by_url.get(url)
+            if endpoint is not None:
+                endpoint.inflight = max(0, endpoint.inflight - 1)
+    
+    def finish(self, url: str, started: float, failed: bool = False) -> None:
+        """
+        Record the outcome of a request.
+        
+        Args:
+            url: Endpoint the request was sent to
+            started: Value returned by start()
+            failed: Whether the endpoint misbehaved (5xx or network error)
+        """
+        with self._lock:
+            endpoint = self._by_url.get(url)
+            if endpoint is None:
+                return
+            now = time.monotonic()
+            endpoint.inflight = max(0, endpoint.inflight - 1)
+            latency = now - started
+            self._observe(endpoint, max(latency, self.failure_penalty) if failed else latency, now)
+            
+            if not failed:
+                endpoint.consecutive_failures = 0
+                endpoint.times_ejected = 0
+                return
+            
+            endpoint.failures += 1
+            endpoint.consecutive_failures += 1
+            if endpoint.consecutive_failures >= self.max_failures:
+                duration = min(
+                    self.max_ejection_time,
+                    self.ejection_time * (2 ** endpoint.times_ejected)
+                )
+                endpoint.ejected_until = now + duration
+                endpoint.times_ejected += 1
+                endpoint.consecutive_failures = 0
+                # Forget the old estimate so the endpoint is retried on return
+                endpoint.ewma = 0.0
+    
+    def _observe(self, endpoint: Endpoint, latency: float, now: float) -> None:
+        """Fold a latency sample into the peak EWMA. Caller holds the lock."""
+        if endpoint.ewma == 0.0 or latency > endpoint.ewma:
+            # Peak sensitivity: react to slowdowns immediately
+            endpoint.ewma = latency
+        else:
+            weight = math.exp(-(now - endpoint._updated) / self.decay)
+            endpoint.ewma = endpoint.ewma * weight + latency * (1 - weight)
+        endpoint._updated = now
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Describe every endpoint for dashboards.
+        
+        Returns:
+            Dictionary keyed by URL with latency estimate, in-flight,
+            request and failure counts and remaining ejection time
+        """
+        with self._lock:
+            now = time.monotonic()
+            return {
+                endpoint.url: {
+                    "ewma_latency": endpoint.ewma,
+                    "inflight": endpoint.inflight,
+                    "requests": endpoint.requests,
+                    "failures": endpoint.failures,
+                    "ejected": endpoint.is_ejected(now),
+                    "ejected_for": max(0.0, endpoint.ejected_until - now)
+                }
+                for endpoint in self._endpoints
+            }
+    
+    def reinstate(self, url: Optional[str] = None) -> None:
+        """
+        End ejections early.
+        
+        Args:
+            url: Endpoint to reinstate (all endpoints if None)
+        """
+        with self._lock:
+            for endpoint in self._endpoints:
+                if url is None or endpoint.url == url.rstrip("/"):
+                    endpoint.ejected_until = 0.0
+                    endpoint.consecutive_failures = 0
\ No newline at end of file
@@ -0,0 +1,466 @@
+"""
+Dandolo SDK Batch Processing
+
+Bounded-concurrency execution of many chat completion requests with
+results kept in input order and errors reported per item, collected into
+a columnar BatchResult for large evaluation runs.
+"""
+
+import threading
+import time
+from array import array
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from ._optional import optional_import
+from ._stats import percentile
+from .types import ChatCompletion, ChatMessage, Choice, Usage
+
+if TYPE_CHECKING:
+    import pandas
+    import pyarrow
+
+
+@dataclass
+class BatchItem:
+    """Outcome of a single request in a batch."""
+    index: int
+    response: Any = None
+    error: Optional[Exception] = None
+    latency: float = 0.0
+    
+    @property
+    def ok(self) -> bool:
+        """Whether the request completed without an error."""
+        return self.error is None
+
+
+class _StringColumn:
+    """Strings packed into one UTF-8 buffer with int64 offsets (Arrow large_string layout)."""
+    
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = array("q", [0])
+        self.valid = array("b")
+    
+    def append(self, value: Optional[str]) -> None:
+        if value is not None:
+            self.data += value.encode("utf-8")
+        self.offsets.append(len(self.data))
+        self.valid.append(value is not None)
+    
+    def __getitem__(self, index: int) -> Optional[str]:
+        if not self.valid[index]:
+            return None
+        return self.data[self.offsets[index]:self.offsets[index + 1]].decode("utf-8")
+
+
+class _DictColumn:
+    """Low-cardinality strings stored as int32 codes into a value table (-1 for null)."""
+    
+    def __init__(self):
+        self.codes = array("i")
+        self.values: List[str] = []
+        self._lookup: Dict[str, int] = {}
+    
+    def append(self, value: Optional[str]) -> None:
+        if value is None:
+            self.codes.append(-1)
+            return
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+    
+    def __getitem__(self, index: int) -> Optional[str]:
+        code = self.codes[index]
+        return self.values[code] if code >= 0 else None
+
+
+def _validity_bitmap(flags: Iterable[bool], length: int) -> Optional[bytes]:
+    """Arrow validity bitmap, or None when every value is present."""
+    bitmap = bytearray((length + 7) // 8)
+    nulls = 0
+    for i, flag in enumerate(flags):
+        if flag:
+            bitmap[i >> 3] |= 1 << (i & 7)
+        else:
+            nulls += 1
+    return bytes(bitmap) if nulls else None
+
+
+_CHOICE_KEYS = frozenset(Choice._fields)
+_MESSAGE_KEYS = frozenset(("role", "content"))
+_USAGE_KEYS = frozenset(Usage._fields)
+
+
+def _only(payload: Dict[str, Any], keys: frozenset) -> bool:
+    """Whether every non-null key of payload is one of keys."""
+    return payload.keys() <= keys or all(value is None or key in keys for key, value in payload.items())
+
+
+def _reproducible(response: ChatCompletion) -> bool:
+    """Whether a row's columns rebuild response's fields, choices and usage."""
+    data = response.to_dict()
+    choices = data.get("choices")
+    if not choices or len(choices) != 1:
+        return False
+    choice = choices[0]
+    message = choice.get("message") or {}
+    usage = data.get("usage")
+    return (
+        isinstance(data.get("id"), str)
+        and isinstance(data.get("model"), str)
+        and isinstance(data.get("created"), int)
+        and data.get("object", "chat.completion") == "chat.completion"
+        and choice.get("index", 0) == 0
+        and _only(choice, _CHOICE_KEYS)
+        and message.get("role", "assistant") == "assistant"
+        and isinstance(message.get("content"), str)
+        and _only(message, _MESSAGE_KEYS)
+        and (usage is None or (_only(usage, _USAGE_KEYS) and any(usage.values())))
+    )
+
+
+class BatchResult(Sequence):
+    """
+    Columnar results of a batch of chat completions.
+    
+    Each row keeps the first choice's content and finish_reason, the model,
+    token usage, latency and error of one request, in input order. Text is
+    packed into contiguous UTF-8 buffers and repeated strings (models,
+    finish reasons, error messages) into code tables, so hundreds of
+    thousands of rows cost a fraction of the equivalent response objects.
+    
+    Indexing and iteration yield BatchItem objects rebuilt on demand, so
+    the result can be used like the list of items it replaces. The columns
+    and exports describe the first choice only. Responses the columns
+    cannot reproduce (several choices, another role, tool calls or other
+    message fields, usage reported as zeros) are also kept whole and
+    returned as received; other top-level response fields are not kept.
+    Errors are kept as raised but without their tracebacks, so a run with
+    many failures does not hold on to every failed call's stack frames.
+    
+    Example:
+        results = client.chat.completions.batch(requests, max_concurrency=16)
+        print(results.total_usage().total_tokens)
+        print(results.latency_percentiles((50, 99), model="llama-3.3-70b"))
+        df = results.to_pandas()
+    """
+    
+    def __init__(self):
+        self.ids = _StringColumn()
+        self.content = _StringColumn()
+        self.model = _DictColumn()
+        self.finish_reason = _DictColumn()
+        self.error = _DictColumn()
+        self.created = array("q")
+        self.prompt_tokens = array("q")
+        self.completion_tokens = array("q")
+        self.total_tokens = array("q")
+        self.latency = array("d")
+        self._exceptions: Dict[int, Exception] = {}
+        self._responses: Dict[int, ChatCompletion] = {}
+    
+    def append(
+        self,
+        response: Optional[ChatCompletion] = None,
+        error: Optional[Exception] = None,
+        latency: float = 0.0
+    ) -> None:
+        """
+        Add the outcome of the next request.
+        
+        Args:
+            response: Completion (a response dict is wrapped as ChatCompletion)
+            error: Exception raised instead of a response
+            latency: Request latency in seconds
+        """
+        if isinstance(response, dict):
+            response = ChatCompletion.from_dict(response)
+        choice = response.choices[0] if response is not None and response.choices else None
+        usage = response.usage if response is not None else None
+        
+        if error is not None:
+            _drop_traceback(error)
+            self._exceptions[len(self.latency)] = error
+        elif response is not None and not _reproducible(response):
+            self._responses[len(self.latency)] = response
+        self.ids.append(response.id if response is not None else None)
+        self.content.append(choice.message.content if choice is not None else None)
+        self.model.append(response.model if response is not None else None)
+        self.finish_reason.append(choice.finish_reason if choice is not None else None)
+        self.error.append(f"{type(error).__name__}: {error}" if error is not None else None)
+        self.created.append((response.created or 0) if response is not None else 0)
+        self.prompt_tokens.append(usage.prompt_tokens if usage is not None else 0)
+        self.completion_tokens.append(usage.completion_tokens if usage is not None else 0)
+        self.total_tokens.append(usage.total_tokens if usage is not None else 0)
+        self.latency.append(latency)
+    
+    def __len__(self) -> int:
+        return len(self.latency)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("BatchResult index out of range")
+        
+        error = self._exceptions.get(index)
+        response = None
+        if error is None:
+            response = self._responses.get(index) or self._rebuild(index)
+        return BatchItem(index, response=response, error=error, latency=self.latency[index])
+    
+    def _rebuild(self, index: int) -> ChatCompletion:
+        """Single-choice assistant completion from one row's columns."""
+        usage = None
+        if self.total_tokens[index] or self.prompt_tokens[index] or self.completion_tokens[index]:
+            usage = Usage(self.prompt_tokens[index], self.completion_tokens[index], self.total_tokens[index])
+        return ChatCompletion(
+            id=self.ids[index] or "",
+            created=self.created[index],
+            model=self.model[index] or "auto-select",
+            choices=[Choice(
+                index=0,
+                message=ChatMessage(role="assistant", content=self.content[index] or ""),
+                finish_reason=self.finish_reason[index]
+            )],
+            usage=usage
+        )
+    
+    @property
+    def ok_count(self) -> int:
+        """Number of successful requests."""
+        return len(self) - len(self._exceptions)
+    
+    @property
+    def error_count(self) -> int:
+        """Number of failed requests."""
+        return len(self._exceptions)
+    
+    @property
+    def models(self) -> List[str]:
+        """Distinct models that answered, in order of first appearance."""
+        return list(self.model.values)
+    
+    def total_usage(self, model: Optional[str] = None) -> Usage:
+        """
+        Sum token usage.
+        
+        Args:
+            model: Only count rows answered by this model
+        
+        Returns:
+            Usage with summed prompt, completion and total tokens
+        """
+        rows = self._rows(model)
+        if rows is None:
+            return Usage(sum(self.prompt_tokens), sum(self.completion_tokens), sum(self.total_tokens))
+        return Usage(
+            sum(self.prompt_tokens[i] for i in rows),
+            sum(self.completion_tokens[i] for i in rows),
+            sum(self.total_tokens[i] for i in rows)
+        )
+    
+    def latency_percentiles(
+        self,
+        percentiles: Tuple[float, ...] = (50.0, 95.0, 99.0),
+        model: Optional[str] = None
+    ) -> Dict[float, float]:
+        """
+        Latency percentiles of successful requests.
+        
+        Args:
+            percentiles: Percentiles between 0 and 100
+            model: Only include rows answered by this model
+        
+        Returns:
+            Mapping of percentile to latency in seconds (empty if no rows match)
+        """
+        rows = self._rows(model)
+        if rows is None:
+            rows = [i for i in range(len(self)) if i not in self._exceptions]
+        values = sorted(self.latency[i] for i in rows)
+        if not values:
+            return {}
+        return {p: percentile(values, p) for p in percentiles}
+    
+    def _rows(self, model: Optional[str]) -> Optional[List[int]]:
+        """Row indices answered by model, or None for all rows."""
+        if model is None:
+            return None
+        code = self.model._lookup.get(model)
+        return [i for i, c in enumerate(self.model.codes) if c == code] if code is not None else []
+    
+    def to_arrow(self) -> "pyarrow.Table":
+        """
+        Export to a pyarrow Table.
+        
+        Numeric columns and text buffers are handed to Arrow without
+        copying; export once the batch has finished.
+        
+        Returns:
+            Table with id, model, content, finish_reason, token, latency
+            and error columns
+        
+        Raises:
+            ImportError: pyarrow is not installed
+        """
+        pyarrow = optional_import("pyarrow")
+        if pyarrow is None:
+            raise ImportError("to_arrow() requires pyarrow. Install it with: pip install dandolo-ai[arrow]")
+        
+        length = len(self)
+        
+        def numeric(values: array, type_) -> "pyarrow.Array":
+            return pyarrow.Array.from_buffers(type_, length, [None, pyarrow.py_buffer(values)])
+        
+        def strings(column: _StringColumn) -> "pyarrow.Array":
+            validity = _validity_bitmap(column.valid, length)
+            return pyarrow.Array.from_buffers(
+                pyarrow.large_string(),
+                length,
+                [
+                    pyarrow.py_buffer(validity) if validity is not None else None,
+                    pyarrow.py_buffer(column.offsets),
+                    pyarrow.py_buffer(column.data)
+                ]
+            )
+        
+        def categories(column: _DictColumn) -> "pyarrow.Array":
+            validity = _validity_bitmap((code >= 0 for code in column.codes), length)
+            indices = pyarrow.Array.from_buffers(
+                pyarrow.int32(),
+                length,
+                [pyarrow.py_buffer(validity) if validity is not None else None, pyarrow.py_buffer(column.codes)]
+            )
+            return pyarrow.DictionaryArray.from_arrays(indices, pyarrow.array(column.values, pyarrow.string()))
+        
+        return pyarrow.table({
+            "id": strings(self.ids),
+            "model": categories(self.model),
+            "content": strings(self.content),
+            "finish_reason": categories(self.finish_reason),
+            "prompt_tokens": numeric(self.prompt_tokens, pyarrow.int64()),
+            "completion_tokens": numeric(self.completion_tokens, pyarrow.int64()),
+            "total_tokens": numeric(self.total_tokens, pyarrow.int64()),
+            "latency": numeric(self.latency, pyarrow.float64()),
+            "error": categories(self.error)
+        })
+    
+    def to_pandas(self) -> "pandas.DataFrame":
+        """
+        Export to a pandas DataFrame, via Arrow when pyarrow is installed.
+        
+        Returns:
+            DataFrame with one row per request; model, finish_reason and
+            error are categorical
+        
+        Raises:
+            ImportError: pandas is not installed
+        """
+        pandas = optional_import("pandas")
+        if pandas is None:
+            raise ImportError("to_pandas() requires pandas. Install it with: pip install pandas")
+        if optional_import("pyarrow") is not None:
+            return self.to_arrow().to_pandas()
+        
+        import numpy
+        
+        def categories(column: _DictColumn) -> "pandas.Categorical":
+            return pandas.Categorical.from_codes(numpy.frombuffer(column.codes, dtype=numpy.int32), column.values)
+        
+        return pandas.DataFrame({
+            "id": [self.ids[i] for i in range(len(self))],
+            "model": categories(self.model),
+            "content": [self.content[i] for i in range(len(self))],
+            "finish_reason": categories(self.finish_reason),
+            "prompt_tokens": numpy.frombuffer(self.prompt_tokens, dtype=numpy.int64),
+            "completion_tokens": numpy.frombuffer(self.completion_tokens, dtype=numpy.int64),
+            "total_tokens": numpy.frombuffer(self.total_tokens, dtype=numpy.int64),
+            "latency": numpy.frombuffer(self.latency, dtype=numpy.float64),
+            "error": categories(self.error)
+        })
+
+
+def _drop_traceback(error: BaseException) -> None:
+    """Release the frames an exception (and the ones it chains) keep alive."""
+    seen = set()
+    stack = [error]
+    while stack:
+        exc = stack.pop()
+        if exc is None or id(exc) in seen:
+            continue
+        seen.add(id(exc))
+        exc.__traceback__ = None
+        stack.extend((exc.__cause__, exc.__context__))
+
+
+def run_batch(
+    create: Callable[..., Any],
+    requests: Iterable[Dict[str, Any]],
+    executor: Optional[Executor],
+    max_concurrency: int = 8
+) -> BatchResult:
+    """
+    Run create(**request) for every request on a worker pool.
+    
+    Requests are submitted as earlier ones finish rather than all at
+    once, so a long (or lazy) iterable never queues more than
+    max_concurrency requests in the pool.
+    
+    Args:
+        create: Callable performing a single request (e.g. ChatCompletions.create)
+        requests: Iterable of keyword-argument dicts, one per request
+        executor: Pool to run requests on (the client's shared executor), or
+            None for a pool of max_concurrency threads kept for this batch
+        max_concurrency: Maximum number of requests in flight at once
+    
+    Returns:
+        BatchResult with one row per request, in the same order as requests
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="dandolo-batch") as own:
+            return run_batch(create, requests, own, max_concurrency)
+    
+    slots = threading.BoundedSemaphore(max_concurrency)
+    
+    def run_one(index: int, request: Dict[str, Any]) -> BatchItem:
+        start = time.perf_counter()
+        try:
+            if request.get("stream"):
+                raise ValueError("Streaming is not supported in batch requests")
+            response = create(**request)
+            return BatchItem(index, response=response, latency=time.perf_counter() - start)
+        except Exception as e:
+            return BatchItem(index, error=e, latency=time.perf_counter() - start)
+        finally:
+            slots.release()
+    
+    result = BatchResult()
+    pending: Deque[Future] = deque()
+    
+    def collect(future: Future) -> None:
+        item = future.result()
+        result.append(item.response, item.error, item.latency)
+    
+    for index, request in enumerate(requests):
+        slots.acquire()
+        pending.append(executor.submit(run_one, index, request))
+        # Rows are appended in order as results arrive, so full responses
+        # are released instead of accumulating until the batch ends
+        while pending and pending[0].done():
+            collect(pending.popleft())
+    while pending:
+        collect(pending.popleft())
+    return result
\ No newline at end of file
@@ -0,0 +1,438 @@
+"""
+Dandolo SDK Load Generator
+
+Drives sustained load through the SDK for capacity planning and reports
+what callers would see: latency percentiles, time to first token,
+throughput, errors by exception class and retries.
+
+Two load models are supported:
+
+- open loop (--rps): requests start on a fixed schedule whether or not
+  earlier ones have finished, like independent users. Latency is measured
+  from the scheduled start, so time spent waiting behind a saturated
+  client counts against it.
+- closed loop (--concurrency): a fixed number of workers each send the
+  next request as soon as the previous one completes, like a job queue.
+
+Provides the dandolo-bench command line tool:
+    
+    dandolo-bench --rps 20 --duration 60 --prompts prompts.jsonl --json report.json
+    dandolo-bench --concurrency 32 --duration 30 --stream
+    dandolo-bench --mock --mock-latency lognormal:0.4,3 --rps 50
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from ._stats import percentile
+from .client import Dandolo
+from .transport import Transport
+
+
+DEFAULT_PROMPTS = [
+    "Summarize the benefits of decentralized inference in two sentences.",
+    "Write a Python function that checks whether a string is a palindrome.",
+    "What is the capital of France?",
+    "Explain the difference between latency and throughput.",
+    "List three ways to reduce the cost of running language models."
+]
+
+
+@dataclass
+class RequestSample:
+    """Outcome of one benchmark request."""
+    scheduled: float  # seconds since the run started
+    latency: float
+    ttft: Optional[float] = None  # time to first streamed token
+    completion_tokens: int = 0
+    retries: int = 0
+    error: Optional[str] = None  # exception class name
+
+
+@dataclass
+class BenchReport:
+    """Summary of a load run."""
+    mode: str  # "open" or "closed"
+    target: float  # requests per second or concurrency
+    window: float  # seconds during which new requests were started
+    duration: float  # until the last request finished
+    stream: bool
+    samples: List[RequestSample] = field(default_factory=list, repr=False)
+    
+    @property
+    def requests(self) -> int:
+        return len(self.samples)
+    
+    @property
+    def successes(self) -> int:
+        return sum(1 for sample in self.samples if sample.error is None)
+    
+    @property
+    def errors(self) -> Dict[str, int]:
+        """Failed requests by exception class."""
+        counts: Dict[str, int] = {}
+        for sample in self.samples:
+            if sample.error is not None:
+                counts[sample.error] = counts.get(sample.error, 0) + 1
+        return dict(sorted(counts.items(), key=lambda item: -item[1]))
+    
+    @property
+    def offered_rate(self) -> float:
+        """Requests started per second during the load window."""
+        return self.requests / self.window if self.window else 0.0
+    
+    @property
+    def throughput(self) -> float:
+        """Completed requests per second."""
+        return self.successes / self.duration if self.duration else 0.0
+    
+    @property
+    def tokens_per_second(self) -> float:
+        """Completion tokens per second across all requests."""
+        tokens = sum(sample.completion_tokens for sample in self.samples)
+        return tokens / self.duration if self.duration else 0.0
+    
+    def latency(self) -> Dict[str, float]:
+        """Latency distribution of successful requests in seconds."""
+        return summarize([sample.latency for sample in self.samples if sample.error is None])
+    
+    def ttft(self) -> Dict[str, float]:
+        """Time-to-first-token distribution of streamed requests in seconds."""
+        return summarize([sample.ttft for sample in self.samples if sample.ttft is not None])
+    
+    def retries(self) -> Dict[str, int]:
+        """Retry totals: retries sent, requests that needed one, and the most for one request."""
+        counts = [sample.retries for sample in self.samples]
+        return {
+            "total": sum(counts),
+            "requests_retried": sum(1 for count in counts if count),
+            "max": max(counts, default=0)
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "target": self.target,
+            "window": self.window,
+            "duration": self.duration,
+            "stream": self.stream,
+            "requests": self.requests,
+            "successes": self.successes,
+            "offered_rate": self.offered_rate,
+            "throughput": self.throughput,
+            "tokens_per_second": self.tokens_per_second,
+            "latency": self.latency(),
+            "ttft": self.ttft(),
+            "errors": self.errors,
+            "retries": self.retries()
+        }
+    
+    def format(self) -> str:
+        """Human-readable summary."""
+        unit = "req/s" if self.mode == "open" else "workers"
+        lines = [
+            f"Mode:        {self.mode} loop, {self.target:g} {unit}, {self.window:g}s (drained after {self.duration:.1f}s)",
+            f"Requests:    {self.requests}  ok: {self.successes}  failed: {self.requests - self.successes}",
+            f"Throughput:  {self.throughput:.2f} req/s completed, {self.offered_rate:.2f} req/s started, "
+            f"{self.tokens_per_second:.1f} tokens/s"
+        ]
+        for name, stats in (("Latency", self.latency()), ("TTFT", self.ttft())):
+            if stats:
+                lines.append(
+                    f"{name + ':':<12} p50 {stats['p50'] * 1000:.0f}ms  p95 {stats['p95'] * 1000:.0f}ms  "
+                    f"p99 {stats['p99'] * 1000:.0f}ms  max {stats['max'] * 1000:.0f}ms"
+                )
+        retries = self.retries()
+        lines.append(f"Retries:     {retries['total']} over {retries['requests_retried']} requests (max {retries['max']})")
+        for name, count in self.errors.items():
+            lines.append(f"  {name}: {count}")
+        return "\n".join(lines)
+
+
+def summarize(values: Iterable[float]) -> Dict[str, float]:
+    """p50/p95/p99, mean and max of values; empty if there are none."""
+    ordered = sorted(values)
+    if not ordered:
+        return {}
+    return {
+        "p50": percentile(ordered, 50),
+        "p95": percentile(ordered, 95),
+        "p99": percentile(ordered, 99),
+        "mean": sum(ordered) / len(ordered),
+        "max": ordered[-1]
+    }
+
+
+def load_prompts(path: str) -> List[Dict[str, Any]]:
+    """
+    Read a prompt corpus.
+    
+    Args:
+        path: File with one request per line: either a JSON object of
+            create() keyword arguments (e.g. {"messages": [...]}) or plain
+            prompt text
+    
+    Returns:
+        create() keyword arguments per request
+    """
+    requests = []
+    with open(path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("{"):
+                requests.append(json.loads(line))
+            else:
+                requests.append({"messages": [{"role": "user", "content": line}]})
+    if not requests:
+        raise ValueError(f"No prompts found in {path}")
+    return requests
+
+
+class _AttemptCounter(Transport):
+    """Counts the HTTP attempts made on the calling thread."""
+    
+    def __init__(self, transport: Transport):
+        self.transport = transport
+        self._local = threading.local()
+    
+    def reset(self) -> None:
+        self._local.attempts = 0
+    
+    @property
+    def attempts(self) -> int:
+        return getattr(self._local, "attempts", 0)
+    
+    def request(self, method, url, headers=None, content=None, timeout=None, stream=False):
+        self._local.attempts = self.attempts + 1
+        return self.transport.request(method, url, headers=headers, content=content, timeout=timeout, stream=stream)
+    
+    def close(self) -> None:
+        self.transport.close()
+
+
+class LoadGenerator:
+    """
+    Sends benchmark traffic through a Dandolo client.
+    
+    Example:
+        with Dandolo(api_key="dk_your_key", max_workers=64) as client:
+            report = LoadGenerator(client).run(rps=20, duration=60)
+            print(report.format())
+    """
+    
+    def __init__(
+        self,
+        client: Dandolo,
+        requests: Optional[List[Dict[str, Any]]] = None,
+        stream: bool = False,
+        **create_kwargs
+    ):
+        """
+        Initialize the generator.
+        
+        Args:
+            client: Client to send requests through; its transport is
+                wrapped to count retries
+            requests: create() keyword arguments, cycled through in order
+                (defaults to a few short prompts)
+            stream: Stream responses and measure time to first token
+            **create_kwargs: Extra create() arguments for every request
+                (e.g. model, max_tokens)
+        """
+        self.client = client
+        self.requests = requests or [{"messages": [{"role": "user", "content": prompt}]} for prompt in DEFAULT_PROMPTS]
+        self.stream = stream
+        self.create_kwargs = create_kwargs
+        self._counter = _AttemptCounter(client.transport)
+        client.transport = self._counter
+        self._next_request = itertools.cycle(self.requests)
+        self._lock = threading.Lock()
+    
+    def _send(self, scheduled: float, origin: float) -> RequestSample:
+        with self._lock:
+            kwargs = {**self.create_kwargs, **next(self._next_request)}
+        self._counter.reset()
+        start = origin + scheduled
+        sample = RequestSample(scheduled=scheduled, latency=0.0)
+        try:
+            if self.stream:
+                for chunk in self.client.chat.completions.create(stream=True, **kwargs):
+                    if sample.ttft is None and chunk.choices and chunk.choices[0].delta.content:
+                        sample.ttft = time.perf_counter() - start
+                    if chunk.usage is not None:
+                        sample.completion_tokens = chunk.usage.completion_tokens
+            else:
+                response = self.client.chat.completions.create(**kwargs)
+                if response.usage is not None:
+                    sample.completion_tokens = response.usage.completion_tokens
+        except Exception as exc:
+            sample.error = type(exc).__name__
+        sample.latency = time.perf_counter() - start
+        sample.retries = max(0, self._counter.attempts - 1)
+        return sample
+    
+    def run(
+        self,
+        duration: float,
+        rps: Optional[float] = None,
+        concurrency: Optional[int] = None,
+        max_in_flight: int = 256
+    ) -> BenchReport:
+        """
+        Generate load for a fixed time.
+        
+        Args:
+            duration: Seconds to keep starting requests
+            rps: Open loop at this many requests per second
+            concurrency: Closed loop with this many workers
+            max_in_flight: Open loop only; threads available for
+                outstanding requests (later ones queue, and the wait is
+                counted in their latency)
+        
+        Returns:
+            BenchReport once every started request has finished
+        
+        Raises:
+            ValueError: Neither or both of rps and concurrency given
+        """
+        if (rps is None) == (concurrency is None):
+            raise ValueError("Specify exactly one of rps (open loop) or concurrency (closed loop)")
+        
+        samples: List[RequestSample] = []
+        origin = time.perf_counter()
+        
+        if rps is not None:
+            interval = 1.0 / rps
+            with ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="dandolo-bench") as executor:
+                futures = []
+                for index in itertools.count():
+                    scheduled = index * interval
+                    if scheduled >= duration:
+                        break
+                    wait = origin + scheduled - time.perf_counter()
+                    if wait > 0:
+                        time.sleep(wait)
+                    futures.append(executor.submit(self._send, scheduled, origin))
+                samples = [future.result() for future in futures]
+            mode, target = "open", rps
+        else:
+            deadline = origin + duration
+            
+            def worker() -> None:
+                while True:
+                    now = time.perf_counter()
+                    if now >= deadline:
+                        return
+                    sample = self._send(now - origin, origin)
+                    with self._lock:
+                        samples.append(sample)
+            
+            threads = [
+                threading.Thread(target=worker, name=f"dandolo-bench-{i}", daemon=True)
+                for i in range(concurrency)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            mode, target = "closed", concurrency
+        
+        elapsed = time.perf_counter() - origin
+        samples.sort(key=lambda sample: sample.scheduled)
+        return BenchReport(
+            mode=mode,
+            target=target,
+            window=duration,
+            duration=elapsed,
+            stream=self.stream,
+            samples=samples
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for the dandolo-bench command."""
+    parser = argparse.ArgumentParser(prog="dandolo-bench", description="Generate load through the Dandolo SDK")
+    load = parser.add_mutually_exclusive_group(required=True)
+    load.add_argument("--rps", type=float, help="Open loop: requests started per second")
+    load.add_argument("--concurrency", type=int, help="Closed loop: concurrent workers")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to generate load")
+    parser.add_argument("--prompts", help="Corpus: JSONL of create() arguments or one prompt per line")
+    parser.add_argument("--stream", action="store_true", help="Stream responses and measure time to first token")
+    parser.add_argument("--model", default="auto-select")
+    parser.add_argument("--max-tokens", type=int)
+    parser.add_argument("--api-key")
+    parser.add_argument("--base-url", default="https://api.dandolo.ai")
+    parser.add_argument("--timeout", type=int, default=60)
+    parser.add_argument("--max-retries", type=int, default=3)
+    parser.add_argument("--max-in-flight", type=int, default=256, help="Open loop: threads for outstanding requests")
+    parser.add_argument("--json", dest="json_path", help='Write the report as JSON to this file ("-" for stdout)')
+    parser.add_argument("--samples", action="store_true", help="Include every request in the JSON report")
+    parser.add_argument("--mock", action="store_true", help="Target an in-process mock server instead of --base-url")
+    parser.add_argument("--mock-latency", default="lognormal:0.3,2", help="Mock time to first byte distribution")
+    parser.add_argument("--mock-tokens-per-second", type=float, default=50.0)
+    parser.add_argument("--mock-error-rate", type=float, default=0.0)
+    args = parser.parse_args(argv)
+    
+    requests = load_prompts(args.prompts) if args.prompts else None
+    create_kwargs: Dict[str, Any] = {"model": args.model}
+    if args.max_tokens is not None:
+        create_kwargs["max_tokens"] = args.max_tokens
+    
+    server = None
+    api_key = args.api_key or os.getenv("DANDOLO_API_KEY")
+    base_url = args.base_url
+    if args.mock:
+        from .mock_server import Latency, MockServer, MockServerConfig
+        
+        server = MockServer(MockServerConfig(
+            latency=Latency.parse(args.mock_latency),
+            tokens_per_second=args.mock_tokens_per_second,
+            error_rate=args.mock_error_rate
+        )).__enter__()
+        api_key, base_url = api_key or "dk_bench", server.url
+    elif not api_key:
+        print("An API key is required (--api-key or DANDOLO_API_KEY)", file=sys.stderr)
+        return 2
+    
+    workers = args.concurrency or args.max_in_flight
+    try:
+        with Dandolo(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=args.timeout,
+            max_retries=args.max_retries,
+            max_workers=workers
+        ) as client:
+            generator = LoadGenerator(client, requests, stream=args.stream, **create_kwargs)
+            report = generator.run(args.duration, args.rps, args.concurrency, args.max_in_flight)
+    finally:
+        if server is not None:
+            server.__exit__(None, None, None)
+    
+    if args.json_path != "-":
+        print(report.format())
+    if args.json_path:
+        result = report.to_dict()
+        if args.samples:
+            result["samples"] = [sample.__dict__ for sample in report.samples]
+        output = json.dumps(result, indent=2)
+        if args.json_path == "-":
+            print(output)
+        else:
+            with open(args.json_path, "w", encoding="utf-8") as fh:
+                fh.write(output + "\n")
+    return 0 if report.successes else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
\ No newline at end of file
@@ -0,0 +1,170 @@
+"""
+Dandolo SDK Response Cache
+
+Opt-in caching of deterministic chat completions, keyed on a canonical
+hash of the request payload.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+# Request fields that do not influence the generated completion
+_UNKEYED_FIELDS = ("stream",)
+
+
+def cache_key(data: Dict[str, Any]) -> str:
+    """
+    Compute a canonical cache key for a chat completion request.
+    
+    The key covers the model, messages and every sampling parameter, and
+    is independent of dict ordering.
+    
+    Args:
+        data: Request payload as sent to /v1/chat/completions
+    
+    Returns:
+        Hex SHA-256 digest of the canonical payload
+    """
+    keyed = {k: v for k, v in data.items() if k not in _UNKEYED_FIELDS}
+    canonical = json.dumps(keyed, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def is_cacheable(data: Dict[str, Any]) -> bool:
+    """
+    Whether a request is deterministic enough to serve from cache.
+    
+    Only non-streaming requests with temperature=0 qualify; without an
+    explicit temperature the server samples and responses differ.
+    
+    Args:
+        data: Request payload as sent to /v1/chat/completions
+    
+    Returns:
+        True if the response may be cached
+    """
+    if data.get("stream"):
+        return False
+    temperature = data.get("temperature")
+    return temperature is not None and float(temperature) == 0.0
+
+
+@dataclass
+class CacheStats:
+    """Cache hit/miss statistics."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+    
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """
+    Thread-safe in-memory LRU cache with per-entry TTL.
+    
+    Example:
+        client = Dandolo(api_key="ak_your_agent_key", cache=ResponseCache(max_size=10000, ttl=3600))
+        
+        # Served from cache on repeat
+        client.chat.completions.create(messages=messages, temperature=0)
+        print(client.cache.stats())
+    """
+    
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = 300.0):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_size: Maximum number of entries before LRU eviction
+            ttl: Seconds an entry stays valid (None for no expiry)
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up an entry, refreshing its LRU position.
+        
+        Args:
+            key: Cache key (see cache_key)
+        
+        Returns:
+            Cached value, or None on a miss or expired entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return value
+    
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store an entry, evicting the least recently used ones if full.
+        
+        Args:
+            key: Cache key (see cache_key)
+            value: Response to cache
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+    
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._stats = CacheStats()
+    
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache statistics."""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                expirations=self._stats.expirations,
+                size=len(self._entries)
+            )
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
\ No newline at end of file
@@ -0,0 +1,309 @@
+"""
+Dandolo SDK Model Catalog
+
+Cached view of /v1/models with TTL, background refresh and conditional
+revalidation, used to check requests locally before they are sent.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from .exceptions import DandoloError, ModelNotFoundError, ValidationError
+from .types import Model
+
+
+# Model ids resolved by the server rather than listed in the catalog
+ROUTED_MODELS = ("auto-select",)
+
+
+class ModelCatalog:
+    """
+    TTL cache of the model list.
+    
+    Within the TTL the cached list is returned without a request. Once it
+    expires the stale list is still returned immediately while a background
+    thread revalidates it, sending If-None-Match when the server provided
+    an ETag so an unchanged catalog costs a 304 instead of a full body.
+    
+    Example:
+        catalog = client.catalog
+        model = catalog.get("llama-3.3-70b")
+        print(model.context_length)
+    """
+    
+    def __init__(self, client, ttl: float = 300.0, background_refresh: bool = True):
+        """
+        Initialize the catalog.
+        
+        Args:
+            client: Dandolo client used to fetch /v1/models
+            ttl: Seconds before the cached list is revalidated
+            background_refresh: Serve stale data while refreshing in a
+                background thread instead of blocking the caller
+        """
+        self.client = client
+        self.ttl = ttl
+        self.background_refresh = background_refresh
+        
+        self._models: Optional[List[Model]] = None
+        self._by_id: Dict[str, Model] = {}
+        self._etag: Optional[str] = None
+        self._fetched_at = 0.0
+        self._fetch_lock = threading.Lock()
+        self._thread_lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+    
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the cached list is within its TTL."""
+        return self._models is not None and time.monotonic() - self._fetched_at < self.ttl
+    
+    def models(self, refresh: bool = False) -> List[Model]:
+        """
+        Return the model list, fetching or revalidating as needed.
+        
+        Args:
+            refresh: Revalidate with the server before returning
+        
+        Returns:
+            List of Model objects
+        """
+        if refresh:
+            self.refresh()
+        elif self._models is None:
+            with self._fetch_lock:
+                loaded = self._models is not None
+            if not loaded:
+                self.refresh()
+        elif not self.is_fresh:
+            if self.background_refresh:
+                self._refresh_in_background()
+            else:
+                self.refresh()
+        return list(self._models)
+    
+    def refresh(self) -> None:
+        """Revalidate the catalog with the server, blocking until done."""
+        with self._fetch_lock:
+            headers = {"If-None-Match": self._etag} if self._etag and self._models is not None else None
+            response = self.client._request("GET", "/v1/models", headers=headers, raw=True)
+            
+            if response.status_code == 304:
+                self._fetched_at = time.monotonic()
+                return
+            
+            self._load(self.client.serializer.loads(response.content), response.headers.get("ETag"))
+    
+    def _load(self, payload: Dict[str, Any], etag: Optional[str]) -> None:
+        """Replace the cached list with a freshly fetched /v1/models body."""
+        models = [Model.from_dict(model) for model in payload.get("data", [])]
+        self._models = models
+        self._by_id = {model.id: model for model in models}
+        self._etag = etag
+        self._fetched_at = time.monotonic()
+    
+    def _refresh_in_background(self) -> None:
+        """Start a refresh thread unless one is already running."""
+        with self._thread_lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._background_refresh,
+                name="dandolo-catalog-refresh",
+                daemon=True
+            )
+            self._refresh_thread.start()
+    
+    def _background_refresh(self) -> None:
+        try:
+            self.refresh()
+        except DandoloError:
+            # Keep serving the stale list; the next expiry retries
+            pass
+    
+    def get(self, model_id: str) -> Optional[Model]:
+        """
+        Look up a model by id.
+        
+        Args:
+            model_id: Model identifier
+        
+        Returns:
+            Model object, or None if it is not in the catalog
+        """
+        self.models()
+        return self._by_id.get(model_id)
+    
+    def invalidate(self) -> None:
+        """Drop the cached list so the next access fetches it again."""
+        with self._fetch_lock:
+            self._models = None
+            self._by_id = {}
+            self._etag = None
+    
+    def check_request(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        max_tokens: Optional[int] = None
+    ) -> None:
+        """
+        Reject requests that would fail on the server.
+        
+        Routed ids such as "auto-select" are always accepted. If the
+        catalog cannot be fetched the request is let through unchecked,
+        and the context-length check is skipped for models whose catalog
+        entry has no context_length.
+        
+        Args:
+            model: Requested model id
+            messages: Chat messages to send
+            max_tokens: Requested completion length
+        
+        Raises:
+            ModelNotFoundError: Model id is not in the catalog
+            ValidationError: Prompt plus max_tokens exceeds the model's context length
+        """
+        if model in ROUTED_MODELS:
+            return
+        
+        try:
+            self.models()
+        except DandoloError:
+            return
+        self._check_loaded(model, messages, max_tokens)
+    
+    def _check_loaded(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        max_tokens: Optional[int]
+    ) -> None:
+        """Run check_request()'s checks against the already loaded list."""
+        info = self._by_id.get(model)
+        if info is None:
+            raise ModelNotFoundError(f"Model '{model}' is not available")
+        
+        if info.context_length:
+            needed = self.client.token_estimator.count_messages(messages) + (max_tokens or 0)
+            if needed > info.context_length:
+                raise ValidationError(
+                    f"Request needs ~{needed} tokens but '{model}' has a context length of {info.context_length}"
+                )
+
+
+class AsyncModelCatalog(ModelCatalog):
+    """
+    TTL cache of the model list for AsyncDandolo.
+    
+    Behaves like ModelCatalog, but fetching is a coroutine and a stale list
+    is revalidated in a background task rather than a thread.
+    
+    Example:
+        model = await client.catalog.get("llama-3.3-70b")
+    """
+    
+    def __init__(self, client, ttl: float = 300.0, background_refresh: bool = True):
+        super().__init__(client, ttl=ttl, background_refresh=background_refresh)
+        self._fetch_lock = None
+        self._refresh_task = None
+    
+    async def models(self, refresh: bool = False) -> List[Model]:
+        """
+        Return the model list, fetching or revalidating as needed.
+        
+        Args:
+            refresh: Revalidate with the server before returning
+        
+        Returns:
+            List of Model objects
+        """
+        if refresh or self._models is None:
+            await self.refresh(only_if_missing=not refresh)
+        elif not self.is_fresh:
+            if self.background_refresh:
+                self._refresh_in_background()
+            else:
+                await self.refresh()
+        return list(self._models)
+    
+    async def refresh(self, only_if_missing: bool = False) -> None:
+        """
+        Revalidate the catalog with the server.
+        
+        Args:
+            only_if_missing: Skip the request if another caller loaded the
+                list while this one waited for the lock
+        """
+        import asyncio
+        
+        if self._fetch_lock is None:
+            self._fetch_lock = asyncio.Lock()
+        async with self._fetch_lock:
+            if only_if_missing and self._models is not None:
+                return
+            headers = {"If-None-Match": self._etag} if self._etag and self._models is not None else None
+            response = await self.client._request("GET", "/v1/models", headers=headers, raw=True)
+            
+            if response.status == 304:
+                self._fetched_at = time.monotonic()
+                return
+            
+            self._load(self.client.serializer.loads(await response.read()), response.headers.get("ETag"))
+    
+    def _refresh_in_background(self) -> None:
+        """Start a refresh task unless one is already running."""
+        import asyncio
+        
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.ensure_future(self._background_refresh())
+    
+    async def _background_refresh(self) -> None:
+        try:
+            await self.refresh()
+        except DandoloError:
+            # Keep serving the stale list; the next expiry retries
+            pass
+    
+    async def get(self, model_id: str) -> Optional[Model]:
+        """
+        Look up a model by id.
+        
+        Args:
+            model_id: Model identifier
+        
+        Returns:
+            Model object, or None if it is not in the catalog
+        """
+        await self.models()
+        return self._by_id.get(model_id)
+    
+    def invalidate(self) -> None:
+        """Drop the cached list so the next access fetches it again."""
+        self._models = None
+        self._by_id = {}
+        self._etag = None
+    
+    async def check_request(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        max_tokens: Optional[int] = None
+    ) -> None:
+        """
+        Reject requests that would fail on the server; see ModelCatalog.check_request().
+        
+        Raises:
+            ModelNotFoundError: Model id is not in the catalog
+            ValidationError: Prompt plus max_tokens exceeds the model's context length
+        """
+        if model in ROUTED_MODELS:
+            return
+        
+        try:
+            await self.models()
+        except DandoloError:
+            return
+        self._check_loaded(model, messages, max_tokens)
@@ -0,0 +1,291 @@
+"""
+Dandolo SDK Circuit Breakers
+
+Per-endpoint and per-model circuit breakers that fail fast while a
+dependency is unhealthy instead of waiting out timeouts and retries.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .exceptions import CircuitOpenError
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Three-state circuit breaker.
+    
+    closed: requests flow; consecutive failures are counted.
+    open: requests fail fast with CircuitOpenError until recovery_timeout
+        has passed, or until a background probe succeeds.
+    half_open: a limited number of trial requests are let through; a
+        success closes the circuit, a failure opens it again.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        probe: Optional[Callable[[], bool]] = None
+    ):
+        """
+        Initialize a closed circuit.
+        
+        Args:
+            name: Identifier shown in errors and snapshots
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds the circuit stays open before recovery is tried
+            half_open_max_calls: Concurrent trial requests allowed when half-open
+            probe: Optional health check run in a background thread once
+                recovery_timeout expires; returns True when healthy
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.probe = probe
+        
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trials = 0
+        self._total_failures = 0
+        self._times_opened = 0
+        self._lock = threading.Lock()
+        self._probe_timer: Optional[threading.Timer] = None
+        self._closed = False
+    
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            return self._state
+    
+    def _maybe_half_open(self, now: float) -> None:
+        # Without a probe, recovery is tried lazily with real requests
+        if (
+            self._state == OPEN
+            and (self.probe is None or self._closed)
+            and now - self._opened_at >= self.recovery_timeout
+        ):
+            self._state = HALF_OPEN
+            self._trials = 0
+    
+    def before_request(self) -> bool:
+        """
+        Admit a request or fail fast.
+        
+        Returns:
+            True if the request took a half-open trial slot, which is freed
+            by record_success(), record_failure() or release()
+        
+        Raises:
+            CircuitOpenError: The circuit is open or its trial slots are taken
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._maybe_half_open(now)
+            if self._state == CLOSED:
+                return False
+            if self._state == HALF_OPEN and self._trials < self.half_open_max_calls:
+                self._trials += 1
+                return True
+            retry_in = max(0.0, self.recovery_timeout - (now - self._opened_at))
+            raise CircuitOpenError(
+                f"Circuit '{self.name}' is {self._state}; failing fast",
+                circuit=self.name,
+                retry_after=str(int(retry_in + 0.999))
+            )
+    
+    def record_success(self) -> None:
+        """Record a healthy response, closing a half-open circuit."""
+        with self._lock:
+            self._failures = 0
+            if self._state == HALF_OPEN:
+                self._state = CLOSED
+                self._trials = 0
+    
+    def release(self) -> None:
+        """Free a trial slot taken by a request that ended without an outcome."""
+        with self._lock:
+            if self._state == HALF_OPEN and self._trials > 0:
+                self._trials -= 1
+    
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit if needed."""
+        with self._lock:
+            self._failures += 1
+            self._total_failures += 1
+            if self._state == HALF_OPEN or (
+                self._state == CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._open()
+    
+    def _open(self) -> None:
+        """Trip the circuit. Caller holds the lock."""
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self._trials = 0
+        self._times_opened += 1
+        if self.probe is not None:
+            self._schedule_probe()
+    
+    def _schedule_probe(self) -> None:
+        if self._closed or (self._probe_timer is not None and self._probe_timer.is_alive()):
+            return
+        self._probe_timer = threading.Timer(self.recovery_timeout, self._run_probe)
+        self._probe_timer.daemon = True
+        self._probe_timer.start()
+    
+    def _run_probe(self) -> None:
+        try:
+            healthy = bool(self.probe())
+        except Exception:
+            healthy = False
+        
+        with self._lock:
+            if self._state != OPEN or self._closed:
+                return
+            if healthy:
+                # Let real traffic confirm the recovery
+                self._state = HALF_OPEN
+                self._trials = 0
+            else:
+                # This timer is still alive while its callback runs
+                self._probe_timer = None
+                self._opened_at = time.monotonic()
+                self._schedule_probe()
+    
+    def reset(self) -> None:
+        """Force the circuit closed."""
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._trials = 0
+    
+    def close(self) -> None:
+        """
+        Cancel the background probe and stop scheduling new ones.
+        
+        The breaker keeps working; an open circuit then recovers lazily
+        after recovery_timeout, as if it had no probe.
+        """
+        with self._lock:
+            self._closed = True
+            if self._probe_timer is not None:
+                self._probe_timer.cancel()
+                self._probe_timer = None
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Describe the circuit for dashboards.
+        
+        Returns:
+            Dictionary with state, consecutive and total failures, times
+            opened and seconds until recovery is attempted
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._maybe_half_open(now)
+            retry_in = 0.0
+            if self._state == OPEN:
+                retry_in = max(0.0, self.recovery_timeout - (now - self._opened_at))
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "total_failures": self._total_failures,
+                "times_opened": self._times_opened,
+                "retry_in": retry_in
+            }
+
+
+class CircuitBreakerRegistry:
+    """
+    Circuit breakers keyed by base URL and by model.
+    
+    Example:
+        client = Dandolo(
+            api_key="ak_your_agent_key",
+            circuit_breakers=CircuitBreakerRegistry(failure_threshold=5, recovery_timeout=30)
+        )
+        
+        # Expose for dashboards
+        print(client.circuit_breakers.snapshot())
+        # {"url:https://api.dandolo.ai": {"state": "closed", ...},
+        #  "model:llama-3.3-70b": {"state": "open", ...}}
+    """
+    
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1
+    ):
+        """
+        Initialize the registry.
+        
+        Args:
+            failure_threshold: Consecutive failures that open a circuit
+            recovery_timeout: Seconds a circuit stays open before recovery is tried
+            half_open_max_calls: Concurrent trial requests allowed when half-open
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, name: str, probe: Optional[Callable[[], bool]] = None) -> CircuitBreaker:
+        """
+        Return the breaker for a key, creating it on first use.
+        
+        Args:
+            name: Circuit key, e.g. "url:https://api.dandolo.ai" or "model:llama-3.3-70b"
+            probe: Background health check used if the breaker is created
+        
+        Returns:
+            CircuitBreaker instance
+        """
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(name)
+                if breaker is None:
+                    breaker = CircuitBreaker(
+                        name,
+                        failure_threshold=self.failure_threshold,
+                        recovery_timeout=self.recovery_timeout,
+                        half_open_max_calls=self.half_open_max_calls,
+                        probe=probe
+                    )
+                    self._breakers[name] = breaker
+        return breaker
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return the state of every circuit, keyed by name."""
+        with self._lock:
+            breakers = list(self._breakers.items())
+        return {name: breaker.snapshot() for name, breaker in breakers}
+    
+    def reset(self) -> None:
+        """Force every circuit closed."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        for breaker in breakers:
+            breaker.reset()
+    
+    def close(self) -> None:
+        """Cancel every circuit's background probe; called by the client's close()."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        for breaker in breakers:
+            breaker.close()
\ No newline at end of file
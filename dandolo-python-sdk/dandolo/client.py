@@ -6,17 +6,39 @@ Provides OpenAI-compatible interface with enhanced error handling.
 """
 
 import requests
+import threading
 import time
-from typing import List, Dict, Any, Optional, Union, Iterator
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Union, Iterator, Iterable
+from .catalog import ModelCatalog
+from .pool import DEFAULT_POOL_SIZE, ConnectionPool
+from .serialization import Serializer, get_serializer
+from .transport import RequestsTransport, Transport
+from .hooks import RequestEvent, RequestHooks, take_phases
+from .tokens import TokenEstimator
+from .retry import RetryPolicy
 from .exceptions import (
     DandoloError,
-    AuthenticationError,
-    RateLimitError,
-    ModelNotFoundError,
-    ValidationError
+    NetworkError,
+    ServerError,
+    error_from_status
 )
+from .streaming import Stream
 from .types import ChatCompletion, ChatMessage, Model
 
+if TYPE_CHECKING:
+    # Feature modules are imported when their option is used, keeping
+    # `from dandolo import Dandolo` light
+    from .balancer import LoadBalancer
+    from .batch import BatchResult
+    from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+    from .compression import Compression
+    from .conversation import Conversation
+    from .hedging import HedgePolicy
+    from .rate_limit import RateLimiter
+    from .singleflight import SingleFlight
+
 
 class ChatCompletions:
     """Chat completions endpoint handler."""
@@ -26,34 +48,43 @@ class ChatCompletions:
     
     def create(
         self,
-        messages: List[Dict[str, str]],
+        messages: Union[List[Dict[str, str]], "Conversation"],
         model: str = "auto-select",
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         stream: bool = False,
         **kwargs
-    ) -> ChatCompletion:
+    ) -> Union[ChatCompletion, Stream]:
         """
         Create a chat completion.
         
         Args:
-            messages: List of message objects with 'role' and 'content'
+            messages: List of message objects with 'role' and 'content',
+                or a Conversation (only its new messages are re-encoded)
             model: Model to use ("auto-select" for intelligent routing)
             max_tokens: Maximum tokens to generate
             temperature: Randomness (0.0 to 2.0)
             stream: Whether to stream the response
             **kwargs: Additional parameters
-            
+        
         Returns:
-            ChatCompletion object with response
-            
+            ChatCompletion object with response, or a Stream of
+            ChatCompletionChunk objects when stream=True
+        
         Raises:
             AuthenticationError: Invalid API key
             RateLimitError: Rate limit exceeded
             ModelNotFoundError: Model not available
-            ValidationError: Invalid request parameters
+            ValidationError: Invalid request parameters (or, with
+                validate_models, a request longer than the model's context)
             DandoloError: Other API errors
         """
+        conversation = None
+        if not isinstance(messages, list):
+            from .conversation import Conversation
+            if isinstance(messages, Conversation):
+                conversation, messages = messages, messages.messages
+        
         data = {
             "model": model,
             "messages": messages,
@@ -64,10 +95,107 @@ class ChatCompletions:
             data["max_tokens"] = max_tokens
         if temperature is not None:
             data["temperature"] = temperature
-            
+        
         data.update(kwargs)
         
-        return self.client._request("POST", "/v1/chat/completions", data)
+        if self.client.validate_models:
+            self.client.catalog.check_request(model, messages, max_tokens)
+        
+        body = conversation.encode_request(data, self.client.serializer) if conversation is not None else None
+        
+        if stream:
+            hooks = self.client.hooks
+            event = hooks.start("POST", "/v1/chat/completions", data, stream=True) if hooks is not None else None
+            response = self.client._request("POST", "/v1/chat/completions", data, stream=True, body=body, event=event)
+            return Stream(response, loads=self.client.serializer.loads, hooks=hooks, event=event)
+        
+        cache = self.client.cache
+        single_flight = self.client.single_flight
+        key = None
+        cacheable = False
+        if cache is not None or single_flight is not None:
+            from .cache import cache_key, is_cacheable
+            cacheable = is_cacheable(data)
+        if cache is not None and cacheable:
+            key = cache_key(data)
+            cached = cache.get(key)
+            if cached is not None:
+                # Responses are read-only views, so the cached payload is shared
+                return ChatCompletion.from_dict(cached)
+        
+        def fetch() -> Dict[str, Any]:
+            if self.client.hedge_policy is not None:
+                response = self.client.hedge_policy.call(
+                    lambda: self.client._request("POST", "/v1/chat/completions", data, body=body)
+                )
+            else:
+                response = self.client._request("POST", "/v1/chat/completions", data, body=body)
+            
+            if key is not None:
+                cache.set(key, response)
+            return response
+        
+        if single_flight is not None and cacheable:
+            # Concurrent identical requests share one upstream call
+            response = single_flight.do(key or cache_key(data), fetch)
+        else:
+            response = fetch()
+        
+        return ChatCompletion.from_dict(response)
+    
+    def submit(self, messages: List[Dict[str, str]], **kwargs) -> Future:
+        """
+        Schedule a chat completion on the client's worker pool.
+        
+        Args:
+            messages: List of message objects with 'role' and 'content'
+            **kwargs: Any other create() parameters
+        
+        Returns:
+            concurrent.futures.Future resolving to the ChatCompletion
+        """
+        return self.client.executor.submit(self.create, messages, **kwargs)
+    
+    def batch(
+        self,
+        requests: Iterable[Dict[str, Any]],
+        max_concurrency: int = 8
+    ) -> "BatchResult":
+        """
+        Run many chat completions with bounded concurrency.
+        
+        Failed requests do not abort the batch; their exception is
+        recorded on the corresponding BatchItem instead. Results are stored
+        column-wise; see BatchResult for aggregation and Arrow/pandas export.
+        
+        Example:
+            results = client.chat.completions.batch(
+                [{"messages": [{"role": "user", "content": p}]} for p in prompts],
+                max_concurrency=16
+            )
+            for item in results:
+                if item.ok:
+                    print(item.response)
+                else:
+                    print(f"Request {item.index} failed: {item.error}")
+        
+        Args:
+            requests: Iterable of create() keyword-argument dicts
+            max_concurrency: Maximum number of requests in flight at once;
+                requests run on the client's worker pool, so max_workers
+                also caps it, except inside a submit() job, where the
+                batch gets a pool of its own
+        
+        Returns:
+            BatchResult yielding BatchItem objects in input order
+        """
+        from .batch import run_batch
+        executor = self.client.executor
+        if threading.current_thread() in self.client._worker_threads:
+            # Called from a submit() job: waiting on the shared pool from
+            # one of its own workers could deadlock it
+            executor = None
+        return run_batch(self.create, requests, executor, max_concurrency)
 
 
 class Chat:
@@ -83,15 +211,20 @@ class Models:
     def __init__(self, client):
         self.client = client
     
-    def list(self) -> List[Model]:
+    def list(self, refresh: bool = False) -> List[Model]:
         """
         List all available models.
         
+        Served from the client's model catalog, which is revalidated with
+        the server once its TTL expires.
+        
+        Args:
+            refresh: Revalidate with the server before returning
+        
         Returns:
             List of Model objects
         """
-        response = self.client._request("GET", "/v1/models")
-        return [Model(**model) for model in response.get("data", [])]
+        return self.client.catalog.models(refresh=refresh)
 
 
 class Dandolo:
@@ -126,20 +259,70 @@ class Dandolo:
     def __init__(
         self,
         api_key: Optional[str] = None,
-        base_url: str = "https://api.dandolo.ai",
+        base_url: Union[str, List[str]] = "https://api.dandolo.ai",
         timeout: int = 60,
         max_retries: int = 3,
-        retry_delay: float = 1.0
+        retry_delay: float = 1.0,
+        max_workers: int = 10,
+        cache: Optional[Any] = None,
+        model_catalog_ttl: float = 300.0,
+        validate_models: bool = False,
+        rate_limiter: Optional["RateLimiter"] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedge_policy: Optional["HedgePolicy"] = None,
+        circuit_breakers: Optional["CircuitBreakerRegistry"] = None,
+        load_balancer: Optional["LoadBalancer"] = None,
+        connection_pool: Optional[ConnectionPool] = None,
+        transport: Optional[Transport] = None,
+        serializer: Optional[Union[Serializer, str]] = None,
+        compression: Optional["Compression"] = None,
+        single_flight: Optional["SingleFlight"] = None,
+        token_estimator: Optional[TokenEstimator] = None,
+        hooks: Optional[RequestHooks] = None
     ):
         """
         Initialize Dandolo client.
         
         Args:
             api_key: Your Dandolo API key (dk_ or ak_ prefix)
-            base_url: Base URL for the Dandolo API
+            base_url: Base URL for the Dandolo API, or a list of base URLs
+                to balance across with failover
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
-            retry_delay: Delay between retries in seconds
+            retry_delay: Base delay between retries in seconds
+            max_workers: Worker threads used by chat.completions.submit()
+            cache: Optional ResponseCache or DiskCache for deterministic
+                (temperature=0) completions
+            model_catalog_ttl: Seconds the cached model list is trusted
+                before it is revalidated in the background
+            validate_models: Reject unknown models and over-long prompts
+                locally using the cached model catalog
+            rate_limiter: Optional RateLimiter that queues requests to stay
+                within per-second and daily quotas
+            retry_policy: Retry behaviour; defaults to a RetryPolicy built
+                from max_retries and retry_delay
+            hedge_policy: Optional HedgePolicy that duplicates slow
+                non-streaming completions to cut tail latency
+            circuit_breakers: Optional CircuitBreakerRegistry that fails
+                fast while the base URL or a model is unhealthy
+            load_balancer: Optional LoadBalancer with tuned settings; its
+                endpoints take precedence over base_url
+            connection_pool: Optional ConnectionPool; by default one sized
+                for max_workers concurrent requests per host
+            transport: HTTP transport; defaults to a RequestsTransport over
+                connection_pool (see HTTPXTransport for HTTP/2 and
+                MockTransport for tests)
+            serializer: JSON codec, or the name of one ("orjson", "msgspec",
+                "json"); defaults to the fastest installed
+            compression: Optional Compression for large request bodies,
+                with automatic fallback for servers that reject them
+            single_flight: Optional SingleFlight that merges identical
+                deterministic requests in flight at the same time
+            token_estimator: Token counter used by validate_models (the
+                heuristic TokenEstimator by default)
+            hooks: Optional RequestHooks called before and after each
+                attempt, on retries, errors and streamed chunks, with a
+                timing breakdown of every attempt
         """
         if not api_key:
             raise ValueError("API key is required")
@@ -148,28 +331,92 @@ class Dandolo:
             raise ValueError("API key must start with 'dk_' (developer) or 'ak_' (agent)")
         
         self.api_key = api_key
-        self.base_url = base_url.rstrip("/")
+        urls = [base_url] if isinstance(base_url, str) else list(base_url)
+        if load_balancer is None and len(urls) > 1:
+            from .balancer import LoadBalancer
+            load_balancer = LoadBalancer(urls)
+        self.load_balancer = load_balancer
+        self.base_url = load_balancer.urls[0] if load_balancer is not None else urls[0].rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_workers = max_workers
+        self.cache = cache
+        self.validate_models = validate_models
+        self.token_estimator = token_estimator or TokenEstimator()
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_retries=max_retries,
+            base_delay=retry_delay
+        )
+        self.hedge_policy = hedge_policy
+        self.circuit_breakers = circuit_breakers
+        self.compression = compression
+        self.single_flight = single_flight
+        self.hooks = hooks
+        self.serializer = serializer if isinstance(serializer, Serializer) else get_serializer(serializer)
         
         # Initialize endpoint handlers
         self.chat = Chat(self)
         self.models = Models(self)
+        self.catalog = ModelCatalog(self, ttl=model_catalog_ttl)
         
-        # Session for connection pooling
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
             "User-Agent": f"dandolo-python-sdk/1.0.0"
-        })
+        }
+        
+        # HTTP transport; the default shares one connection pool across threads
+        if transport is None:
+            self.pool = connection_pool or ConnectionPool(
+                pool_maxsize=max(DEFAULT_POOL_SIZE, max_workers)
+            )
+            self.pool.headers.update(self.headers)
+            transport = RequestsTransport(self.pool)
+        else:
+            self.pool = getattr(transport, "pool", None)
+        self.transport = transport
+        
+        # Worker pool for submit(), created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._worker_threads: "weakref.WeakSet[threading.Thread]" = weakref.WeakSet()
+    
+    @property
+    def session(self) -> requests.Session:
+        """Session for the calling thread, backed by the shared connection pool."""
+        if self.pool is None:
+            raise AttributeError("session is only available with the requests transport")
+        return self.pool.session()
+    
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Shared worker pool for asynchronous submissions."""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="dandolo",
+                        initializer=self._register_worker
+                    )
+        return self._executor
+    
+    def _register_worker(self) -> None:
+        """Executor initializer: remember the pool's threads so batch() can recognise them."""
+        self._worker_threads.add(threading.current_thread())
     
     def _request(
         self,
         method: str,
         endpoint: str,
-        data: Optional[Dict[str, Any]] = None
+        data: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+        raw: bool = False,
+        body: Optional[bytes] = None,
+        event: Optional[RequestEvent] = None
     ) -> Any:
         """
         Make an HTTP request with automatic retries and error handling.
@@ -178,68 +425,287 @@ class Dandolo:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint path
             data: Request data (for POST requests)
-            
+            stream: Return the open response without reading the body
+            headers: Extra request headers
+            raw: Return the transport response instead of parsed JSON;
+                304 Not Modified is returned rather than raised
+            body: Pre-encoded request body, sent instead of encoding data
+            event: Hook event for the call, when the caller needs it
+                afterwards (streams); created here if hooks are set
+        
         Returns:
-            Parsed JSON response
-            
+            Parsed JSON response, or the transport response when stream
+            or raw is set
+        
         Raises:
             Various DandoloError subclasses based on response
         """
-        url = f"{self.base_url}{endpoint}"
+        method = method.upper()
+        if method not in ("GET", "POST"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
         
-        for attempt in range(self.max_retries + 1):
+        hooks = self.hooks
+        if hooks is not None and event is None:
+            event = hooks.start(method, endpoint, data, stream)
+        if event is None:
+            return self._send(method, endpoint, data, stream, headers, raw, body)
+        
+        try:
+            return self._send(method, endpoint, data, stream, headers, raw, body, event)
+        except BaseException as exc:
+            if event.error is not exc:
+                # Raised outside status handling: client-side rate limit,
+                # open circuit, transport error or cancellation
+                event.error = exc
+                event.retry_delay = None
+                event.finish_attempt()
+            hooks.emit("on_error", event)
+            raise
+    
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        stream: bool,
+        headers: Optional[Dict[str, str]],
+        raw: bool,
+        body: Optional[bytes],
+        event: Optional[RequestEvent] = None
+    ) -> Any:
+        """Send a request with retries and failover; see _request()."""
+        hooks = self.hooks
+        request_headers = {**self.headers, **(headers or {})}
+        if stream:
+            request_headers["Accept"] = "text/event-stream"
+        if self.compression is not None:
+            request_headers["Accept-Encoding"] = self.compression.accept_encoding
+        if body is None and data is not None and method == "POST":
+            body = self.serializer.dumps(data)
+        compressed_body: Optional[bytes] = None
+        fallback = False
+        
+        policy = self.retry_policy
+        policy.budget.record_request()
+        attempt = 0
+        delay = 0.0
+        failed_urls: set = set()
+        base_url = self._choose_endpoint(failed_urls)
+        
+        while True:
+            url = f"{base_url}{endpoint}"
+            if event is not None:
+                event.begin_attempt(url, attempt)
+            if self.rate_limiter is not None:
+                waiting = time.perf_counter()
+                self.rate_limiter.acquire()
+                if event is not None:
+                    event.timing.queueing += time.perf_counter() - waiting
+            breakers = self._circuits_for(base_url, data)
+            trials = self._admit(breakers)
+            if event is not None:
+                hooks.emit("before_request", event)
+            started = self.load_balancer.start(base_url) if self.load_balancer is not None else 0.0
+            settled = False
+            
             try:
-                if method.upper() == "GET":
-                    response = self.session.get(url, timeout=self.timeout)
-                elif method.upper() == "POST":
-                    response = self.session.post(url, json=data, timeout=self.timeout)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
+                content, attempt_headers = body, request_headers
+                compressing = self.compression is not None and self.compression.should_compress(body, base_url)
+                if compressing:
+                    if compressed_body is None:
+                        compressed_body = self.compression.compress(body)
+                    content = compressed_body
+                    attempt_headers = {**request_headers, "Content-Encoding": self.compression.algorithm}
                 
-                # Handle different status codes
-                if response.status_code == 200:
-                    return response.json()
-                elif response.status_code == 401:
-                    raise AuthenticationError("Invalid API key")
-                elif response.status_code == 429:
-                    error_data = response.json() if response.content else {}
-                    raise RateLimitError(
-                        error_data.get("error", {}).get("message", "Rate limit exceeded"),
-                        retry_after=response.headers.get("Retry-After")
+                if event is not None:
+                    take_phases()
+                    sending = time.perf_counter()
+                try:
+                    response = self.transport.request(
+                        method,
+                        url,
+                        headers=attempt_headers,
+                        content=content,
+                        timeout=self.timeout,
+                        stream=stream
                     )
-                elif response.status_code == 404:
-                    if "model" in endpoint:
-                        raise ModelNotFoundError("Specified model not found")
-                    else:
-                        raise DandoloError(f"Endpoint not found: {endpoint}")
-                elif response.status_code == 400:
-                    error_data = response.json() if response.content else {}
-                    raise ValidationError(
-                        error_data.get("error", {}).get("message", "Invalid request")
-                    )
-                elif response.status_code >= 500:
-                    if attempt < self.max_retries:
-                        time.sleep(self.retry_delay * (2 ** attempt))  # Exponential backoff
-                        continue
-                    raise DandoloError(f"Server error: {response.status_code}")
+                except NetworkError as exc:
+                    error = exc
+                    if event is not None:
+                        event.record_transport(time.perf_counter() - sending, *take_phases())
                 else:
-                    error_data = response.json() if response.content else {}
-                    raise DandoloError(
-                        error_data.get("error", {}).get("message", f"Unknown error: {response.status_code}")
-                    )
+                    if event is not None:
+                        elapsed = getattr(response, "elapsed", None)
+                        event.record_transport(
+                            time.perf_counter() - sending,
+                            *take_phases(),
+                            elapsed=elapsed.total_seconds() if elapsed is not None else None
+                        )
+                        event.status_code = response.status_code
+                    
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.update_from_headers(response.headers)
+                        if response.status_code == 429:
+                            self.rate_limiter.on_rate_limited(response.headers.get("Retry-After"))
+                        elif response.status_code < 400:
+                            self.rate_limiter.on_success()
+                    
+                    if self.compression is not None and body is not None:
+                        fallback = self.compression.check_response(base_url, response.status_code, compressing, fallback)
+                        if fallback:
+                            # The server may not decode compressed bodies: resend uncompressed
+                            response.close()
+                            self._record_outcome(base_url, breakers, started, None)
+                            settled = True
+                            if event is not None:
+                                event.finish_attempt()
+                                hooks.emit("after_response", event)
+                            continue
+                    
+                    # Handle different status codes
+                    if response.status_code == 200 or (raw and response.status_code == 304):
+                        self._record_outcome(base_url, breakers, started, None)
+                        settled = True
+                        if event is None:
+                            if stream or raw:
+                                return response
+                            return self.serializer.loads(response.content)
+                        
+                        result = response
+                        if not (stream or raw):
+                            decoding = time.perf_counter()
+                            result = self.serializer.loads(response.content)
+                            event.timing.decode = time.perf_counter() - decoding
+                        event.finish_attempt()
+                        hooks.emit("after_response", event)
+                        return result
                     
-            except requests.exceptions.Timeout:
-                if attempt < self.max_retries:
-                    time.sleep(self.retry_delay * (2 ** attempt))
-                    continue
-                raise DandoloError("Request timeout")
-            except requests.exceptions.ConnectionError:
-                if attempt < self.max_retries:
-                    time.sleep(self.retry_delay * (2 ** attempt))
-                    continue
-                raise DandoloError("Connection error")
-        
-        raise DandoloError("Max retries exceeded")
+                    error = error_from_status(
+                        response.status_code,
+                        self._error_data(response),
+                        endpoint,
+                        retry_after=response.headers.get("Retry-After")
+                    )
+                    response.close()
+                    if event is not None:
+                        event.error = error
+                        event.finish_attempt()
+                        hooks.emit("after_response", event)
+                
+                self._record_outcome(base_url, breakers, started, error)
+                settled = True
+            except BaseException:
+                if not settled:
+                    self._abandon(base_url, trials)
+                raise
+            delay = policy.next_delay(attempt, error, delay)
+            if event is not None:
+                if event.error is None:
+                    event.error = error
+                    event.finish_attempt()
+                event.retry_delay = delay
+                if delay is not None:
+                    hooks.emit("on_retry", event)
+            if delay is None:
+                raise error
+            if isinstance(error, (ServerError, NetworkError)):
+                failed_urls.add(base_url)
+            next_url = self._choose_endpoint(failed_urls)
+            if next_url == base_url:
+                time.sleep(delay)
+            # Otherwise fail over to the other endpoint without waiting
+            base_url = next_url
+            attempt += 1
+    
+    def _choose_endpoint(self, exclude: set) -> str:
+        """Base URL for the next attempt, avoiding failed and open-circuit endpoints."""
+        if self.load_balancer is None:
+            return self.base_url
+        unavailable = set(exclude)
+        if self.circuit_breakers is not None:
+            from .circuit_breaker import OPEN
+            unavailable.update(
+                url for url in self.load_balancer.urls
+                if self._url_circuit(url).state == OPEN
+            )
+        return self.load_balancer.choose(unavailable)
+    
+    def _url_circuit(self, base_url: str) -> "CircuitBreaker":
+        """Circuit breaker of one base URL."""
+        return self.circuit_breakers.get(f"url:{base_url}", probe=lambda: self._probe(base_url))
+    
+    def _circuits_for(self, base_url: str, data: Optional[Dict[str, Any]]) -> List["CircuitBreaker"]:
+        """Circuit breakers guarding a request: the base URL and the model."""
+        if self.circuit_breakers is None:
+            return []
+        breakers = [self._url_circuit(base_url)]
+        model = (data or {}).get("model")
+        if model:
+            breakers.append(self.circuit_breakers.get(f"model:{model}"))
+        return breakers
+    
+    def _admit(self, breakers: List["CircuitBreaker"]) -> List["CircuitBreaker"]:
+        """
+        Pass a request through every breaker, or through none of them.
+        
+        Returns:
+            The breakers whose half-open trial slot the request holds
+        
+        Raises:
+            CircuitOpenError: A breaker refused; slots already taken are freed
+        """
+        trials: List["CircuitBreaker"] = []
+        try:
+            for breaker in breakers:
+                if breaker.before_request():
+                    trials.append(breaker)
+        except BaseException:
+            for breaker in trials:
+                breaker.release()
+            raise
+        return trials
+    
+    def _abandon(self, base_url: str, trials: List["CircuitBreaker"]) -> None:
+        """Undo the bookkeeping of an attempt that raised before its outcome was recorded."""
+        if self.load_balancer is not None:
+            self.load_balancer.release(base_url)
+        for breaker in trials:
+            breaker.release()
+    
+    def _record_outcome(
+        self,
+        base_url: str,
+        breakers: List["CircuitBreaker"],
+        started: float,
+        error: Optional[Exception]
+    ) -> None:
+        """Feed a request outcome to the load balancer and circuit breakers."""
+        failed = isinstance(error, (ServerError, NetworkError))
+        if self.load_balancer is not None:
+            self.load_balancer.finish(base_url, started, failed)
+        for breaker in breakers:
+            if failed:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+    
+    def _probe(self, base_url: str) -> bool:
+        """Background health check for an open base URL circuit."""
+        response = self.transport.request(
+            "GET",
+            f"{base_url}/v1/models",
+            headers=self.headers,
+            timeout=self.timeout
+        )
+        response.close()
+        return response.status_code < 500
+    
+    def _error_data(self, response) -> Any:
+        """Decode an error response body, tolerating non-JSON bodies."""
+        try:
+            return self.serializer.loads(response.content) if response.content else {}
+        except ValueError:
+            return {}
     
     def validate_key(self) -> Dict[str, Any]:
         """
@@ -254,8 +720,9 @@ class Dandolo:
             - remaining: Remaining requests today
         """
         try:
-            # Try a simple request to validate
-            response = self._request("GET", "/v1/models")
+            # Any authenticated request validates the key; the cached
+            # catalog avoids refetching the model list on every check
+            self.catalog.models()
             
             # If successful, return mock validation data
             # In a real implementation, this would come from a dedicated endpoint
@@ -288,8 +755,19 @@ class Dandolo:
         # This would be a real endpoint in production
         return self.validate_key()
     
+    def close(self) -> None:
+        """Shut down the worker pools and close pooled connections."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self.hedge_policy is not None:
+            self.hedge_policy.close()
+        if self.circuit_breakers is not None:
+            self.circuit_breakers.close()
+        self.transport.close()
+    
     def __enter__(self):
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.session.close()
\ No newline at end of file
+        self.close()
\ No newline at end of file
@@ -0,0 +1,180 @@
+"""
+Dandolo SDK Compression
+
+Opt-in compression of large request bodies with per-endpoint detection
+of servers that cannot decode them, and Accept-Encoding negotiation for
+responses.
+"""
+
+import gzip
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from ._optional import optional_import
+
+
+GZIP = "gzip"
+ZSTD = "zstd"
+
+# Status codes a server may answer when it cannot read a compressed body
+UNSUPPORTED_STATUSES = (400, 415)
+
+
+def accept_encoding() -> str:
+    """Accept-Encoding value listing the response codings this install can decode."""
+    if optional_import("zstandard") is not None:
+        return "zstd, gzip, deflate"
+    return "gzip, deflate"
+
+
+@dataclass
+class CompressionStats:
+    """Request compression counters."""
+    compressed: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    fallbacks: int = 0  # bodies resent uncompressed
+    
+    @property
+    def ratio(self) -> float:
+        """Compressed size relative to the original size."""
+        return self.bytes_out / self.bytes_in if self.bytes_in else 1.0
+
+
+class Compression:
+    """
+    Compresses request bodies above a size threshold.
+    
+    Support is tracked per base URL. The first compressed request to an
+    endpoint doubles as the capability check: if it is rejected with 415
+    (or 400, as servers that parse the body as plain JSON do), it is sent
+    again uncompressed, and the endpoint is marked as unsupported only
+    if the uncompressed request is accepted.
+    
+    Example:
+        client = Dandolo(
+            api_key="ak_your_agent_key",
+            compression=Compression("gzip", threshold=4096)
+        )
+    """
+    
+    def __init__(self, algorithm: str = GZIP, threshold: int = 1024, level: Optional[int] = None):
+        """
+        Initialize the compressor.
+        
+        Args:
+            algorithm: "gzip" or "zstd" (zstd requires the zstandard package)
+            threshold: Minimum body size in bytes worth compressing
+            level: Compression level (defaults: gzip 6, zstd 3)
+        
+        Raises:
+            ValueError: Unknown algorithm
+            ImportError: zstd requested but zstandard is not installed
+        """
+        if algorithm not in (GZIP, ZSTD):
+            raise ValueError(f"Unsupported compression algorithm: {algorithm}")
+        if algorithm == ZSTD and optional_import("zstandard") is None:
+            raise ImportError("zstd compression requires zstandard. Install it with: pip install dandolo-ai[zstd]")
+        
+        self.algorithm = algorithm
+        self.threshold = threshold
+        self.level = level
+        self.accept_encoding = accept_encoding()
+        self._supported: Dict[str, bool] = {}
+        self._stats = CompressionStats()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+    
+    def should_compress(self, body: Optional[bytes], base_url: str) -> bool:
+        """Whether a body sent to base_url should be compressed."""
+        return (
+            body is not None
+            and len(body) >= self.threshold
+            and self._supported.get(base_url) is not False
+        )
+    
+    def compress(self, body: bytes) -> bytes:
+        """
+        Compress a request body.
+        
+        Args:
+            body: Encoded request body
+        
+        Returns:
+            Compressed bytes, to be sent with Content-Encoding: algorithm
+        """
+        if self.algorithm == ZSTD:
+            # ZstdCompressor is not thread-safe; keep one per thread
+            compressor = getattr(self._local, "compressor", None)
+            if compressor is None:
+                compressor = optional_import("zstandard").ZstdCompressor(level=self.level if self.level is not None else 3)
+                self._local.compressor = compressor
+            compressed = compressor.compress(body)
+        else:
+            compressed = gzip.compress(body, compresslevel=self.level if self.level is not None else 6)
+        
+        with self._lock:
+            self._stats.compressed += 1
+            self._stats.bytes_in += len(body)
+            self._stats.bytes_out += len(compressed)
+        return compressed
+    
+    def supports(self, base_url: str) -> Optional[bool]:
+        """
+        Known compression support of an endpoint.
+        
+        Returns:
+            True or False once detected, None while unknown
+        """
+        return self._supported.get(base_url)
+    
+    def record(self, base_url: str, supported: Optional[bool]) -> None:
+        """
+        Record the detected support of an endpoint.
+        
+        Args:
+            base_url: Endpoint base URL
+            supported: Detected support, or None to forget it
+        """
+        with self._lock:
+            if supported is None:
+                self._supported.pop(base_url, None)
+            else:
+                self._supported[base_url] = supported
+                if not supported:
+                    self._stats.fallbacks += 1
+    
+    def check_response(self, base_url: str, status_code: int, compressed: bool, fallback: bool) -> bool:
+        """
+        Update detected support from a response to a request with a body.
+        
+        Args:
+            base_url: Endpoint the request was sent to
+            status_code: Response status
+            compressed: Whether the body was compressed
+            fallback: Whether this was the uncompressed resend
+        
+        Returns:
+            True if the request should be sent again uncompressed
+        """
+        if compressed:
+            if status_code in UNSUPPORTED_STATUSES and self.supports(base_url) is None:
+                self.record(base_url, False)
+                return True
+            if status_code < 400 and self.supports(base_url) is None:
+                self.record(base_url, True)
+        elif fallback and status_code in UNSUPPORTED_STATUSES:
+            # Rejected uncompressed as well: the request itself was invalid
+            self.record(base_url, None)
+        return False
+    
+    def stats(self) -> CompressionStats:
+        """Return a snapshot of the compression counters."""
+        with self._lock:
+            return CompressionStats(
+                self._stats.compressed,
+                self._stats.bytes_in,
+                self._stats.bytes_out,
+                self._stats.fallbacks
+            )
\ No newline at end of file
@@ -0,0 +1,388 @@
+"""
+Dandolo SDK Conversations
+
+Message history for multi-turn sessions: a running token estimate,
+trimming or summarization to stay within a budget, and request encoding
+that only serializes messages added since the previous turn.
+"""
+
+from collections.abc import Sequence
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from .serialization import Serializer
+from .tokens import REPLY_PRIMING_TOKENS, TokenEstimator
+from .types import ChatCompletion, Model
+
+
+# Marks the system message a SummarizePolicy inserts in place of old turns
+SUMMARY_PREFIX = "Summary of the earlier conversation: "
+
+
+class TrimPolicy:
+    """
+    Drops the oldest messages until the conversation fits its budget.
+    
+    System messages (unless keep_system is False) and the keep_last most
+    recent messages are never dropped, so a conversation made only of
+    those may stay over budget.
+    """
+    
+    def __init__(self, keep_system: bool = True, keep_last: int = 1):
+        """
+        Initialize the policy.
+        
+        Args:
+            keep_system: Never drop system messages
+            keep_last: Number of most recent messages never dropped
+        """
+        self.keep_system = keep_system
+        self.keep_last = keep_last
+    
+    def droppable(self, conversation: "Conversation") -> List[int]:
+        """
+        Indices of the messages this policy may remove, oldest first.
+        
+        Args:
+            conversation: Conversation to inspect
+        
+        Returns:
+            List of message indices
+        """
+        end = max(0, len(conversation) - self.keep_last)
+        return [
+            index for index in range(end)
+            if not (self.keep_system and _is_pinned_system(conversation[index]))
+        ]
+    
+    def apply(self, conversation: "Conversation", budget: int) -> None:
+        """
+        Bring the conversation's token estimate under budget.
+        
+        Args:
+            conversation: Conversation to trim in place
+            budget: Maximum prompt tokens
+        """
+        excess = conversation.tokens - budget
+        drop = []
+        for index in self.droppable(conversation):
+            if excess <= 0:
+                break
+            drop.append(index)
+            excess -= conversation.token_count(index)
+        conversation.remove(drop)
+
+
+class SummarizePolicy(TrimPolicy):
+    """
+    Replaces old turns with a summary instead of discarding them.
+    
+    When the budget is exceeded, every droppable message (including a
+    previous summary) is passed to summarize, and the returned text is
+    inserted as one system message where the oldest of them stood. If the
+    summary itself does not fit, the oldest messages are trimmed as with
+    TrimPolicy.
+    
+    Example:
+        def summarize(messages):
+            response = client.chat.completions.create(
+                messages=messages + [{"role": "user", "content": "Summarize our conversation so far."}]
+            )
+            return response.choices[0].message.content
+        
+        conversation = Conversation(max_tokens=8000, policy=SummarizePolicy(summarize))
+    """
+    
+    def __init__(
+        self,
+        summarize: Callable[[List[Dict[str, Any]]], str],
+        keep_system: bool = True,
+        keep_last: int = 2
+    ):
+        """
+        Initialize the policy.
+        
+        Args:
+            summarize: Called with the messages to condense; returns the summary text
+            keep_system: Never drop system messages other than summaries
+            keep_last: Number of most recent messages never summarized
+        """
+        super().__init__(keep_system=keep_system, keep_last=keep_last)
+        self.summarize = summarize
+    
+    def apply(self, conversation: "Conversation", budget: int) -> None:
+        indices = self.droppable(conversation)
+        if len(indices) > 1 or (indices and not _is_summary(conversation[indices[0]])):
+            summary = self.summarize([conversation[index] for index in indices])
+            conversation.remove(indices)
+            conversation.insert(indices[0], {"role": "system", "content": SUMMARY_PREFIX + summary})
+        if conversation.tokens > budget:
+            super().apply(conversation, budget)
+
+
+def _is_summary(message: Dict[str, Any]) -> bool:
+    content = message.get("content")
+    return message.get("role") == "system" and isinstance(content, str) and content.startswith(SUMMARY_PREFIX)
+
+
+def _is_pinned_system(message: Dict[str, Any]) -> bool:
+    return message.get("role") == "system" and not _is_summary(message)
+
+
+class Conversation(Sequence):
+    """
+    Chat history that tracks its size and stays within a token budget.
+    
+    Every message's token estimate is computed once, when it is added, and
+    the total is kept as a running sum. When max_tokens is set and an added
+    message pushes the total over it, the policy trims (or summarizes) the
+    history. Messages are also serialized once: passing the conversation
+    as messages to create() only encodes the messages added since the last
+    request and splices them onto the cached encoding of the rest.
+    
+    Messages are copied when added and must not be modified afterwards.
+    A Conversation is not thread-safe.
+    
+    Example:
+        conversation = Conversation.for_model(model, reserve_tokens=1024)
+        conversation.add("system", "You are a helpful assistant.")
+        while True:
+            conversation.add("user", input("> "))
+            response = client.chat.completions.create(messages=conversation, max_tokens=1024)
+            conversation.add_response(response)
+            print(response.choices[0].message.content, f"({conversation.tokens} tokens)")
+    """
+    
+    def __init__(
+        self,
+        messages: Optional[Iterable[Dict[str, Any]]] = None,
+        max_tokens: Optional[int] = None,
+        policy: Optional[TrimPolicy] = None,
+        estimator: Optional[TokenEstimator] = None
+    ):
+        """
+        Initialize the conversation.
+        
+        Args:
+            messages: Initial messages
+            max_tokens: Token budget for the prompt (None for unbounded);
+                leave room for the reply below the model's context length
+            policy: How to get back under budget (default: TrimPolicy())
+            estimator: Token counter (default: the heuristic TokenEstimator)
+        """
+        self.max_tokens = max_tokens
+        self.policy = policy or TrimPolicy()
+        self.estimator = estimator or TokenEstimator()
+        self._messages: List[Dict[str, Any]] = []
+        self._counts: List[int] = []
+        self._tokens = REPLY_PRIMING_TOKENS
+        
+        # Per-message encodings and their comma-joined prefix
+        self._serializer: Optional[Serializer] = None
+        self._encoded: List[Optional[bytes]] = []
+        self._joined = bytearray()
+        self._joined_count = 0
+        
+        if messages is not None:
+            self.extend(messages)
+    
+    @classmethod
+    def for_model(
+        cls,
+        model: Model,
+        reserve_tokens: int = 1024,
+        policy: Optional[TrimPolicy] = None,
+        estimator: Optional[TokenEstimator] = None
+    ) -> "Conversation":
+        """
+        Create a conversation budgeted to a model's context length.
+        
+        Args:
+            model: Model from client.models.list() or client.catalog
+            reserve_tokens: Tokens left free for the reply
+            policy: How to get back under budget
+            estimator: Token counter
+        
+        Returns:
+            Conversation whose budget is context_length - reserve_tokens,
+            or unbounded if the model's context length is unknown
+        """
+        budget = model.context_length - reserve_tokens if model.context_length else None
+        return cls(max_tokens=budget, policy=policy, estimator=estimator)
+    
+    @property
+    def tokens(self) -> int:
+        """Estimated prompt tokens of the whole conversation."""
+        return self._tokens
+    
+    @property
+    def remaining(self) -> Optional[int]:
+        """Tokens left before the budget is reached (None if unbounded)."""
+        if self.max_tokens is None:
+            return None
+        return self.max_tokens - self._tokens
+    
+    @property
+    def messages(self) -> List[Dict[str, Any]]:
+        """The messages as a list, in order."""
+        return list(self._messages)
+    
+    def token_count(self, index: int) -> int:
+        """Estimated tokens contributed by the message at index."""
+        return self._counts[index]
+    
+    def __len__(self) -> int:
+        return len(self._messages)
+    
+    def __getitem__(self, index):
+        return self._messages[index]
+    
+    def __repr__(self) -> str:
+        return f"Conversation(messages={len(self._messages)}, tokens={self._tokens}, max_tokens={self.max_tokens})"
+    
+    def append(self, message: Dict[str, Any]) -> None:
+        """
+        Add a message and enforce the budget.
+        
+        Args:
+            message: Message object with 'role' and 'content'
+        """
+        self._add(message)
+        self._enforce()
+    
+    def add(self, role: str, content: str, **fields) -> None:
+        """
+        Add a message built from its parts.
+        
+        Args:
+            role: "system", "user" or "assistant"
+            content: Message text
+            **fields: Other message fields, e.g. name
+        """
+        self.append({"role": role, "content": content, **fields})
+    
+    def add_response(self, response: Union[ChatCompletion, Dict[str, Any]]) -> None:
+        """
+        Add the assistant reply from a completion.
+        
+        Args:
+            response: ChatCompletion (or its dict form) returned by create()
+        """
+        if isinstance(response, ChatCompletion):
+            message = response.choices[0].message.to_dict()
+        else:
+            message = response["choices"][0]["message"]
+        self.append(message)
+    
+    def extend(self, messages: Iterable[Dict[str, Any]]) -> None:
+        """
+        Add several messages, enforcing the budget once at the end.
+        
+        Args:
+            messages: Message objects to add in order
+        """
+        for message in messages:
+            self._add(message)
+        self._enforce()
+    
+    def insert(self, index: int, message: Dict[str, Any]) -> None:
+        """
+        Insert a message without enforcing the budget (used by policies).
+        
+        Args:
+            index: Position to insert at
+            message: Message object to insert
+        """
+        message = dict(message)
+        count = self.estimator.count_message(message)
+        self._messages.insert(index, message)
+        self._counts.insert(index, count)
+        self._encoded.insert(index, None)
+        self._tokens += count
+        self._invalidate(index)
+    
+    def remove(self, indices: Iterable[int]) -> None:
+        """
+        Remove messages without enforcing the budget (used by policies).
+        
+        Args:
+            indices: Positions of the messages to remove
+        """
+        for index in sorted(set(indices), reverse=True):
+            self._tokens -= self._counts[index]
+            del self._messages[index]
+            del self._counts[index]
+            del self._encoded[index]
+            self._invalidate(index)
+    
+    def trim(self) -> None:
+        """Apply the policy now if the conversation is over budget."""
+        self._enforce()
+    
+    def clear(self) -> None:
+        """Remove every message."""
+        self.remove(range(len(self._messages)))
+    
+    def _add(self, message: Dict[str, Any]) -> None:
+        message = dict(message)
+        count = self.estimator.count_message(message)
+        self._messages.append(message)
+        self._counts.append(count)
+        self._encoded.append(None)
+        self._tokens += count
+    
+    def _enforce(self) -> None:
+        if self.max_tokens is not None and self._tokens > self.max_tokens:
+            self.policy.apply(self, self.max_tokens)
+    
+    def _invalidate(self, index: int) -> None:
+        # The joined prefix is rebuilt from the cached per-message encodings
+        if index < self._joined_count:
+            self._joined = bytearray()
+            self._joined_count = 0
+    
+    def encode(self, serializer: Serializer) -> bytes:
+        """
+        Encode the messages as a JSON array.
+        
+        Only messages not encoded by a previous call are serialized.
+        
+        Args:
+            serializer: Serializer used by the client
+        
+        Returns:
+            JSON bytes
+        """
+        if serializer is not self._serializer:
+            self._serializer = serializer
+            self._encoded = [None] * len(self._messages)
+            self._joined = bytearray()
+            self._joined_count = 0
+        
+        joined = self._joined
+        for index in range(self._joined_count, len(self._messages)):
+            part = self._encoded[index]
+            if part is None:
+                part = serializer.dumps(self._messages[index])
+                self._encoded[index] = part
+            if index:
+                joined += b","
+            joined += part
+        self._joined_count = len(self._messages)
+        return b"[" + joined + b"]"
+    
+    def encode_request(self, data: Dict[str, Any], serializer: Serializer) -> bytes:
+        """
+        Encode a request payload whose messages are this conversation.
+        
+        Args:
+            data: Request payload; its 'messages' entry is ignored
+            serializer: Serializer used by the client
+        
+        Returns:
+            JSON bytes of the payload with this conversation as messages
+        """
+        rest = serializer.dumps({key: value for key, value in data.items() if key != "messages"})
+        messages = self.encode(serializer)
+        if rest == b"{}":
+            return b'{"messages":' + messages + b"}"
+        return b'{"messages":' + messages + b"," + rest[1:]
\ No newline at end of file
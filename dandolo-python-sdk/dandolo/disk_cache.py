@@ -0,0 +1,396 @@
+"""
+Dandolo SDK Disk Cache
+
+Persistent completion cache backed by SQLite in WAL mode. Safe for
+concurrent readers and writers across processes (e.g. gunicorn workers)
+and usable anywhere a ResponseCache is accepted.
+
+Also provides the dandolo-cache command line tool:
+    
+    dandolo-cache stats
+    dandolo-cache list --limit 20
+    dandolo-cache warm prompts.jsonl
+    dandolo-cache prune --max-entries 50000
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from .cache import CacheStats
+
+
+DEFAULT_PATH = os.path.join("~", ".cache", "dandolo", "completions.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    model TEXT,
+    created_at REAL NOT NULL,
+    expires_at REAL,
+    last_access REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access);
+CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at);
+"""
+
+
+class DiskCache:
+    """
+    SQLite-backed LRU cache with optional TTL and size bounds.
+    
+    Each thread uses its own connection, reopened in a forked child so a
+    process never shares the parent's SQLite handle; WAL journaling lets
+    readers in other processes proceed while one process writes.
+    
+    Bounds are enforced every evict_every writes rather than on each
+    set(), so the cache may briefly hold up to evict_every entries more
+    than max_entries.
+    
+    Example:
+        client = Dandolo(
+            api_key="ak_your_agent_key",
+            cache=DiskCache("/var/cache/dandolo/completions.db", max_entries=100000)
+        )
+    """
+    
+    def __init__(
+        self,
+        path: str = DEFAULT_PATH,
+        max_entries: Optional[int] = 100000,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        busy_timeout: float = 30.0,
+        evict_every: int = 64
+    ):
+        """
+        Initialize the cache, creating the database if needed.
+        
+        Args:
+            path: Database file path
+            max_entries: Maximum number of entries (None for unbounded)
+            max_bytes: Maximum total size of stored responses (None for unbounded)
+            ttl: Seconds an entry stays valid (None for no expiry)
+            busy_timeout: Seconds to wait for another process's write lock
+            evict_every: Writes between checks of max_entries and max_bytes
+        """
+        self.path = os.path.expanduser(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.busy_timeout = busy_timeout
+        self.evict_every = max(1, evict_every)
+        
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._stats = CacheStats()
+        self._writes = 0
+        
+        conn = self._connection()
+        conn.executescript(_SCHEMA)
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use or after a fork."""
+        conn = getattr(self._local, "conn", None)
+        pid = os.getpid()
+        if conn is None or self._local.pid != pid:
+            # A connection inherited across fork() must not be used, or
+            # even closed, by the child; leave it to the parent
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = pid
+        return conn
+    
+    def _count(self, field: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            setattr(self._stats, field, getattr(self._stats, field) + amount)
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up an entry, refreshing its LRU position.
+        
+        Args:
+            key: Cache key (see cache_key)
+        
+        Returns:
+            Cached value, or None on a miss or expired entry
+        """
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self._count("misses")
+            return None
+        
+        value, expires_at = row
+        now = time.time()
+        if expires_at is not None and expires_at <= now:
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._count("expirations")
+            self._count("misses")
+            return None
+        
+        conn.execute(
+            "UPDATE entries SET last_access = ?, hits = hits + 1 WHERE key = ?", (now, key)
+        )
+        self._count("hits")
+        return json.loads(value)
+    
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store an entry, evicting the least recently used ones if over bounds.
+        
+        Args:
+            key: Cache key (see cache_key)
+            value: JSON-serializable response to cache
+        """
+        encoded = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl is not None else None
+        model = value.get("model") if isinstance(value, dict) else None
+        
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO entries "
+            "(key, value, size, model, created_at, expires_at, last_access, hits) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, 0)",
+            (key, encoded, len(encoded.encode("utf-8")), model, now, expires_at, now)
+        )
+        
+        with self._stats_lock:
+            self._writes += 1
+            due = self._writes % self.evict_every == 0
+        if due:
+            evicted = self._evict(conn, self.max_entries, self.max_bytes)
+            if evicted:
+                self._count("evictions", evicted)
+    
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        self._connection().execute("DELETE FROM entries WHERE key = ?", (key,))
+    
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        self._connection().execute("DELETE FROM entries")
+        with self._stats_lock:
+            self._stats = CacheStats()
+    
+    @staticmethod
+    def _evict(
+        conn: sqlite3.Connection,
+        max_entries: Optional[int],
+        max_bytes: Optional[int]
+    ) -> int:
+        """Delete least recently used entries until within bounds."""
+        evicted = 0
+        if max_entries is not None:
+            count = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            if count > max_entries:
+                evicted += conn.execute(
+                    "DELETE FROM entries WHERE key IN "
+                    "(SELECT key FROM entries ORDER BY last_access LIMIT ?)",
+                    (count - max_entries,)
+                ).rowcount
+        
+        if max_bytes is not None:
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total > max_bytes:
+                # Walk from the oldest entry until enough bytes are freed
+                excess = total - max_bytes
+                keys = []
+                for key, size in conn.execute("SELECT key, size FROM entries ORDER BY last_access"):
+                    keys.append(key)
+                    excess -= size
+                    if excess <= 0:
+                        break
+                conn.executemany("DELETE FROM entries WHERE key = ?", [(k,) for k in keys])
+                evicted += len(keys)
+        return evicted
+    
+    def prune(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Remove expired entries and shrink the cache to the given bounds.
+        
+        Args:
+            max_entries: Entry bound (defaults to the cache's own)
+            max_bytes: Size bound (defaults to the cache's own)
+        
+        Returns:
+            Dictionary with the number of expired and evicted entries
+        """
+        conn = self._connection()
+        expired = conn.execute(
+            "DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)
+        ).rowcount
+        evicted = self._evict(
+            conn,
+            max_entries if max_entries is not None else self.max_entries,
+            max_bytes if max_bytes is not None else self.max_bytes
+        )
+        return {"expired": expired, "evicted": evicted}
+    
+    def entries(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        List the most recently used entries without their values.
+        
+        Args:
+            limit: Maximum number of entries to return
+        
+        Returns:
+            List of entry metadata dictionaries
+        """
+        rows = self._connection().execute(
+            "SELECT key, model, size, created_at, expires_at, last_access, hits "
+            "FROM entries ORDER BY last_access DESC LIMIT ?",
+            (limit,)
+        ).fetchall()
+        fields = ("key", "model", "size", "created_at", "expires_at", "last_access", "hits")
+        return [dict(zip(fields, row)) for row in rows]
+    
+    def summary(self) -> Dict[str, Any]:
+        """
+        Describe the stored data as a whole.
+        
+        Returns:
+            Dictionary with entry count, total bytes and stored hit count
+        """
+        count, total, hits = self._connection().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hits), 0) FROM entries"
+        ).fetchone()
+        return {"path": self.path, "entries": count, "bytes": total, "hits": hits}
+    
+    def stats(self) -> CacheStats:
+        """Return a snapshot of this process's cache statistics."""
+        size = self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        with self._stats_lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                expirations=self._stats.expirations,
+                size=size
+            )
+    
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            if self._local.pid == os.getpid():
+                conn.close()
+            self._local.conn = None
+    
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+
+def _warm(cache: DiskCache, args: argparse.Namespace) -> int:
+    """Replay a JSONL file of create() requests to populate the cache."""
+    from .cache import is_cacheable
+    from .client import Dandolo
+    
+    api_key = args.api_key or os.getenv("DANDOLO_API_KEY")
+    if not api_key:
+        print("An API key is required (--api-key or DANDOLO_API_KEY)", file=sys.stderr)
+        return 2
+    
+    with open(args.file, "r", encoding="utf-8") as fh:
+        requests = [json.loads(line) for line in fh if line.strip()]
+    
+    # Streaming or sampled requests would be sent and billed but never stored
+    skipped = [item for item in requests if not is_cacheable(item)]
+    requests = [item for item in requests if is_cacheable(item)]
+    if skipped:
+        print(f"Skipping {len(skipped)} non-cacheable requests (streaming or temperature != 0)", file=sys.stderr)
+    
+    before = len(cache)
+    with Dandolo(api_key=api_key, base_url=args.base_url, cache=cache) as client:
+        results = client.chat.completions.batch(requests, max_concurrency=args.max_concurrency)
+    
+    failed = sum(1 for item in results if not item.ok)
+    print(f"Requests: {len(results)}  failed: {failed}  new entries: {len(cache) - before}")
+    return 1 if failed else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for the dandolo-cache command."""
+    parser = argparse.ArgumentParser(prog="dandolo-cache", description="Inspect and manage the Dandolo disk cache")
+    parser.add_argument("--path", default=DEFAULT_PATH, help="Cache database path")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    commands.add_parser("stats", help="Show entry count and size")
+    
+    list_parser = commands.add_parser("list", help="List recently used entries")
+    list_parser.add_argument("--limit", type=int, default=20)
+    
+    show_parser = commands.add_parser("show", help="Print a cached response")
+    show_parser.add_argument("key")
+    
+    prune_parser = commands.add_parser("prune", help="Drop expired entries and shrink to a size bound")
+    prune_parser.add_argument("--max-entries", type=int)
+    prune_parser.add_argument("--max-bytes", type=int)
+    
+    warm_parser = commands.add_parser("warm", help="Populate the cache from a JSONL file of requests")
+    warm_parser.add_argument("file", help="One create() keyword-argument object per line")
+    warm_parser.add_argument("--api-key")
+    warm_parser.add_argument("--base-url", default="https://api.dandolo.ai")
+    warm_parser.add_argument("--max-concurrency", type=int, default=8)
+    
+    commands.add_parser("clear", help="Remove all entries")
+    
+    args = parser.parse_args(argv)
+    cache = DiskCache(args.path, max_entries=None)
+    
+    if args.command == "stats":
+        summary = cache.summary()
+        print(f"Path:    {summary['path']}")
+        print(f"Entries: {summary['entries']}")
+        print(f"Bytes:   {summary['bytes']}")
+        print(f"Hits:    {summary['hits']}")
+    elif args.command == "list":
+        now = time.time()
+        for entry in cache.entries(args.limit):
+            print(
+                f"{entry['key'][:16]}  {entry['model'] or '-':<24} {entry['size']:>8}B  "
+                f"hits={entry['hits']:<5} age={now - entry['created_at']:.0f}s"
+            )
+    elif args.command == "show":
+        conn = cache._connection()
+        row = conn.execute(
+            "SELECT value FROM entries WHERE key LIKE ? LIMIT 2", (args.key + "%",)
+        ).fetchall()
+        if len(row) != 1:
+            print("No unique entry matches that key", file=sys.stderr)
+            return 1
+        print(json.dumps(json.loads(row[0][0]), indent=2, ensure_ascii=False))
+    elif args.command == "prune":
+        result = cache.prune(args.max_entries, args.max_bytes)
+        print(f"Expired: {result['expired']}  evicted: {result['evicted']}")
+    elif args.command == "warm":
+        return _warm(cache, args)
+    elif args.command == "clear":
+        cache.clear()
+        print("Cache cleared")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -4,7 +4,7 @@ Dandolo SDK Exceptions
 Custom exceptions for different types of API errors.
 """
 
-from typing import Optional
+from typing import Any, Optional
 
 
 class DandoloError(Exception):
@@ -48,12 +48,70 @@ class ValidationError(DandoloError):
 class ServerError(DandoloError):
     """Raised when server encounters an error."""
     
-    def __init__(self, message: str = "Server error"):
+    def __init__(self, message: str = "Server error", retry_after: Optional[str] = None):
         super().__init__(message, "server_error")
+        self.retry_after = retry_after
 
 
 class NetworkError(DandoloError):
     """Raised when network connection fails."""
     
     def __init__(self, message: str = "Network connection failed"):
-        super().__init__(message, "network_error")
\ No newline at end of file
+        super().__init__(message, "network_error")
+
+
+class CircuitOpenError(DandoloError):
+    """Raised without sending a request while a circuit breaker is open."""
+    
+    def __init__(
+        self,
+        message: str = "Circuit breaker is open",
+        circuit: Optional[str] = None,
+        retry_after: Optional[str] = None
+    ):
+        super().__init__(message, "circuit_open")
+        self.circuit = circuit
+        self.retry_after = retry_after
+
+
+def error_from_status(
+    status_code: int,
+    error_data: Any = None,
+    endpoint: str = "",
+    retry_after: Optional[str] = None
+) -> DandoloError:
+    """
+    Build the exception for a non-200 API response.
+    
+    Args:
+        status_code: HTTP status code
+        error_data: Decoded error body, if any; any JSON value is accepted
+        endpoint: API endpoint path that was requested
+        retry_after: Value of the Retry-After header, if any
+        
+    Returns:
+        DandoloError subclass instance matching the status code
+    """
+    # Proxies and gateways may answer with a JSON list or string instead of
+    # {"error": {...}}
+    error = error_data.get("error") if isinstance(error_data, dict) else error_data
+    error = error or {}
+    if not isinstance(error, dict):
+        error = {"message": str(error)}
+    
+    if status_code == 401:
+        return AuthenticationError("Invalid API key")
+    elif status_code == 429:
+        return RateLimitError(
+            error.get("message", "Rate limit exceeded"),
+            retry_after=retry_after
+        )
+    elif status_code == 404:
+        if "model" in endpoint:
+            return ModelNotFoundError("Specified model not found")
+        return DandoloError(f"Endpoint not found: {endpoint}")
+    elif status_code == 400:
+        return ValidationError(error.get("message", "Invalid request"))
+    elif status_code >= 500:
+        return ServerError(f"Server error: {status_code}", retry_after=retry_after)
+    return DandoloError(error.get("message", f"Unknown error: {status_code}"))
\ No newline at end of file
@@ -0,0 +1,264 @@
+"""
+Dandolo SDK Request Hedging
+
+Sends a duplicate request when the first one is slower than a latency
+percentile and returns whichever answers first, trimming tail latency
+caused by stalled providers.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+from ._stats import percentile
+from .retry import RetryBudget
+
+
+class LatencyTracker:
+    """Sliding window of recent request latencies."""
+    
+    def __init__(self, window: int = 1000, recompute_every: int = 16):
+        """
+        Initialize the tracker.
+        
+        Args:
+            window: Number of most recent samples kept
+            recompute_every: Samples between percentile recomputations
+        """
+        self.recompute_every = recompute_every
+        self._samples: deque = deque(maxlen=window)
+        self._sorted: list = []
+        self._since_sort = 0
+        self._lock = threading.Lock()
+    
+    def record(self, latency: float) -> None:
+        """Add a latency sample in seconds."""
+        with self._lock:
+            self._samples.append(latency)
+            self._since_sort += 1
+    
+    def percentile(self, p: float) -> Optional[float]:
+        """
+        Return the p-th nearest-rank percentile of recent latencies.
+        
+        Args:
+            p: Percentile between 0 and 100
+        
+        Returns:
+            Latency in seconds, or None if there are no samples
+        """
+        with self._lock:
+            if not self._samples:
+                return None
+            if self._since_sort >= self.recompute_every or not self._sorted:
+                self._sorted = sorted(self._samples)
+                self._since_sort = 0
+            return percentile(self._sorted, p)
+    
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+@dataclass
+class HedgeStats:
+    """Hedging counters."""
+    requests: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+
+
+class HedgePolicy:
+    """
+    Opt-in hedging for non-streaming chat completions.
+    
+    If a request has not completed after the configured latency
+    percentile of recent requests, a second identical request is sent and
+    the first successful response wins. The loser is cancelled: async
+    requests are aborted, while a blocking request that is already on the
+    wire finishes in the background and its result is discarded. The
+    winner's latency feeds the percentile that sets the hedge delay. A hedge
+    budget limits hedges to a fraction of traffic so load never doubles.
+    
+    Hedged requests may both be billed against the daily quota.
+    
+    Example:
+        client = Dandolo(
+            api_key="ak_your_agent_key",
+            hedge_policy=HedgePolicy(percentile=95, budget_ratio=0.05)
+        )
+    """
+    
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        initial_delay: float = 2.0,
+        min_delay: float = 0.05,
+        min_samples: int = 20,
+        budget_ratio: float = 0.1,
+        max_workers: int = 32
+    ):
+        """
+        Initialize the policy.
+        
+        Args:
+            percentile: Latency percentile after which a hedge is sent
+            initial_delay: Hedge delay used until min_samples latencies are known
+            min_delay: Lower bound on the hedge delay
+            min_samples: Samples needed before the percentile is trusted
+            budget_ratio: Maximum fraction of requests that may be hedged
+            max_workers: Worker threads for blocking (sync client) attempts
+        """
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+        self.latencies = LatencyTracker()
+        self.budget = RetryBudget(ratio=budget_ratio, min_retries_per_second=0.0)
+        
+        self._stats = HedgeStats()
+        self._stats_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+    
+    def delay(self) -> float:
+        """Seconds to wait for the first attempt before hedging."""
+        if len(self.latencies) < self.min_samples:
+            return self.initial_delay
+        return max(self.min_delay, self.latencies.percentile(self.percentile))
+    
+    def stats(self) -> HedgeStats:
+        """Return a snapshot of the hedging counters."""
+        with self._stats_lock:
+            return HedgeStats(self._stats.requests, self._stats.hedges, self._stats.hedge_wins)
+    
+    def _count(self, field: str) -> None:
+        with self._stats_lock:
+            setattr(self._stats, field, getattr(self._stats, field) + 1)
+    
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Worker pool for blocking attempts, created on first use."""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="dandolo-hedge"
+                    )
+        return self._executor
+    
+    def _timed(self, fn: Callable[[], Any]) -> Tuple[float, Any]:
+        """Pool task: run one attempt and measure how long it took."""
+        start = time.perf_counter()
+        result = fn()
+        return time.perf_counter() - start, result
+    
+    def call(self, fn: Callable[[], Any]) -> Any:
+        """
+        Run a blocking request with hedging.
+        
+        Both attempts run on the worker pool while the calling thread
+        waits, so max_workers bounds how many hedged calls can be in
+        flight at once.
+        
+        Args:
+            fn: Zero-argument callable performing the request
+        
+        Returns:
+            Result of the first attempt to succeed
+        
+        Raises:
+            The last attempt's exception if every attempt fails
+        """
+        self._count("requests")
+        self.budget.record_request()
+        
+        primary = self.executor.submit(self._timed, fn)
+        done, _ = wait([primary], timeout=self.delay())
+        if done or not self.budget.try_spend():
+            latency, result = primary.result()
+            self.latencies.record(latency)
+            return result
+        
+        self._count("hedges")
+        hedge = self.executor.submit(self._timed, fn)
+        pending = {primary, hedge}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    if future is hedge:
+                        self._count("hedge_wins")
+                    latency, result = future.result()
+                    self.latencies.record(latency)
+                    return result
+                error = future.exception()
+        raise error
+    
+    async def call_async(self, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run an async request with hedging.
+        
+        Args:
+            factory: Zero-argument callable returning a new request coroutine
+        
+        Returns:
+            Result of the first attempt to succeed
+        
+        Raises:
+            The last attempt's exception if every attempt fails
+        """
+        import asyncio
+        
+        self._count("requests")
+        self.budget.record_request()
+        
+        started = {}
+        
+        def launch() -> "asyncio.Future":
+            task = asyncio.ensure_future(factory())
+            started[task] = time.perf_counter()
+            return task
+        
+        primary = launch()
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.delay())
+            if done or not self.budget.try_spend():
+                result = await primary
+                self.latencies.record(time.perf_counter() - started[primary])
+                return result
+            
+            self._count("hedges")
+            hedge = launch()
+            tasks.add(hedge)
+            pending = set(tasks)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self._count("hedge_wins")
+                        self.latencies.record(time.perf_counter() - started[task])
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            # Abort whichever attempt lost (or both, if the caller was cancelled)
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
\ No newline at end of file
@@ -0,0 +1,331 @@
+"""
+Dandolo SDK Request Hooks
+
+Callbacks at each step of a request's lifecycle, together with a
+breakdown of where each attempt's time went (queueing, connect, time to
+first byte, body read, decode and the SDK's own overhead), so slow calls
+can be attributed to the network, the gateway or the calling process.
+
+opentelemetry_hooks() records attempts as OpenTelemetry spans using a
+tracer supplied by the application; the SDK itself does not depend on
+OpenTelemetry.
+"""
+
+import threading
+import time
+import warnings
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from ._optional import optional_import
+
+
+HOOK_NAMES = (
+    "before_request",
+    "after_response",
+    "on_retry",
+    "on_error",
+    "on_stream_chunk",
+    "on_stream_end"
+)
+
+# Connection pool waits, connection setup and body reads, recorded by the
+# requests transport and its urllib3 pools on the thread sending the request
+_phases = threading.local()
+
+
+def record_phase(name: str, seconds: float) -> None:
+    """Add time spent in a transport phase ("queueing", "connect" or "body_read") on this thread."""
+    setattr(_phases, name, getattr(_phases, name, 0.0) + seconds)
+
+
+def take_phases() -> Tuple[float, float, float]:
+    """
+    Read and reset this thread's transport phases.
+
+    Returns:
+        (queueing, connect, body_read) seconds recorded since the last call
+    """
+    queueing = getattr(_phases, "queueing", 0.0)
+    connect = getattr(_phases, "connect", 0.0)
+    body_read = getattr(_phases, "body_read", 0.0)
+    _phases.queueing = _phases.connect = _phases.body_read = 0.0
+    return queueing, connect, body_read
+
+
+@dataclass
+class RequestTiming:
+    """Where the time of one HTTP attempt went, in seconds."""
+    queueing: float = 0.0  # client-side rate limiter and connection pool waits
+    connect: float = 0.0  # DNS, TCP and TLS setup; 0 on a reused connection
+    ttfb: float = 0.0  # request sent until response headers arrived
+    body_read: float = 0.0
+    decode: float = 0.0
+    sdk_overhead: float = 0.0  # time in the client not covered above
+    total: float = 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return asdict(self)
+
+
+@dataclass
+class RequestEvent:
+    """
+    State of one client call, passed to every hook it triggers.
+
+    The same object is updated for each attempt, so hooks can keep
+    per-call state (such as an open span) in context.
+    """
+    method: str
+    endpoint: str
+    data: Optional[Dict[str, Any]] = None
+    stream: bool = False
+    url: Optional[str] = None
+    attempt: int = 0
+    status_code: Optional[int] = None
+    error: Optional[BaseException] = None
+    retry_delay: Optional[float] = None
+    chunks: int = 0
+    timing: RequestTiming = field(default_factory=RequestTiming)
+    context: Dict[str, Any] = field(default_factory=dict)
+    started: float = field(default_factory=time.perf_counter)
+    _attempt_started: float = field(default_factory=time.perf_counter, repr=False)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the call started."""
+        return time.perf_counter() - self.started
+
+    def begin_attempt(self, url: str, attempt: int) -> None:
+        """Reset per-attempt state before a request is sent."""
+        self._attempt_started = self.started if self.url is None else time.perf_counter()
+        self.url = url
+        self.attempt = attempt
+        self.status_code = None
+        self.error = None
+        self.retry_delay = None
+        self.timing = RequestTiming()
+
+    def record_transport(
+        self,
+        seconds: float,
+        queueing: float = 0.0,
+        connect: float = 0.0,
+        body_read: float = 0.0,
+        elapsed: Optional[float] = None
+    ) -> None:
+        """
+        Split the time spent in the HTTP library into phases.
+
+        Args:
+            seconds: Time the transport call took
+            queueing: Connection pool wait within it
+            connect: Connection setup within it
+            body_read: Response body read within it
+            elapsed: Time from sending until the response headers arrived,
+                when the library reports it; library time outside it
+                counts as SDK overhead
+        """
+        timing = self.timing
+        exchange = seconds - body_read if elapsed is None else min(elapsed, seconds - body_read)
+        timing.queueing += queueing
+        timing.connect += connect
+        timing.ttfb = max(0.0, exchange - queueing - connect)
+        timing.body_read += body_read
+
+    def finish_attempt(self) -> None:
+        """Close the attempt's timing; the unaccounted remainder is SDK overhead."""
+        timing = self.timing
+        timing.total = time.perf_counter() - self._attempt_started
+        measured = timing.queueing + timing.connect + timing.ttfb + timing.body_read + timing.decode
+        timing.sdk_overhead = max(0.0, timing.total - measured)
+
+    def finish_stream(self) -> None:
+        """
+        Extend the attempt's total to the end of a streamed body.
+
+        sdk_overhead keeps its value from when the headers arrived, so the
+        remainder of total is time the caller spent between chunks.
+        """
+        self.timing.total = time.perf_counter() - self._attempt_started
+
+
+Hook = Callable[..., Any]
+
+
+class RequestHooks:
+    """
+    Callbacks invoked during each client call.
+
+    Every hook receives the call's RequestEvent; on_stream_chunk also
+    receives the chunk. Hooks run inline (on the event loop for
+    AsyncDandolo) and should be quick. An exception raised by a hook is
+    reported as a RuntimeWarning and does not fail the request.
+
+    - before_request: an attempt is about to be sent
+    - after_response: an attempt got a response (any status), after the
+      body was read and decoded; for streams, when the headers arrived
+    - on_retry: an attempt failed and another follows after retry_delay
+    - on_error: the call failed for good, whatever raised (error
+      responses, client-side rate limits, open circuits, cancellation)
+    - on_stream_chunk: a streamed chunk was parsed
+    - on_stream_end: a stream was exhausted, closed or broke off (after
+      on_error in the last case)
+
+    Example:
+        def log_timing(event):
+            print(event.url, event.status_code, event.timing.to_dict())
+
+        client = Dandolo(api_key="dk_your_key", hooks=RequestHooks(after_response=log_timing))
+    """
+
+    def __init__(
+        self,
+        before_request: Union[Hook, Iterable[Hook], None] = None,
+        after_response: Union[Hook, Iterable[Hook], None] = None,
+        on_retry: Union[Hook, Iterable[Hook], None] = None,
+        on_error: Union[Hook, Iterable[Hook], None] = None,
+        on_stream_chunk: Union[Hook, Iterable[Hook], None] = None,
+        on_stream_end: Union[Hook, Iterable[Hook], None] = None
+    ):
+        self.before_request: List[Hook] = []
+        self.after_response: List[Hook] = []
+        self.on_retry: List[Hook] = []
+        self.on_error: List[Hook] = []
+        self.on_stream_chunk: List[Hook] = []
+        self.on_stream_end: List[Hook] = []
+        self.add(
+            before_request=before_request,
+            after_response=after_response,
+            on_retry=on_retry,
+            on_error=on_error,
+            on_stream_chunk=on_stream_chunk,
+            on_stream_end=on_stream_end
+        )
+
+    def add(self, **hooks: Union[Hook, Iterable[Hook], None]) -> "RequestHooks":
+        """
+        Register more hooks.
+
+        Args:
+            **hooks: Hook name to a callable or list of callables
+
+        Returns:
+            self, for chaining
+
+        Raises:
+            ValueError: Unknown hook name
+        """
+        for name, value in hooks.items():
+            if name not in HOOK_NAMES:
+                raise ValueError(f"Unknown hook '{name}'; expected one of {', '.join(HOOK_NAMES)}")
+            if value is None:
+                continue
+            getattr(self, name).extend([value] if callable(value) else value)
+        return self
+
+    def start(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        stream: bool = False
+    ) -> RequestEvent:
+        """Create the event for a new call."""
+        return RequestEvent(method=method, endpoint=endpoint, data=data, stream=stream)
+
+    def emit(self, name: str, event: RequestEvent, *args: Any) -> None:
+        """Call the hooks registered under name."""
+        for hook in getattr(self, name):
+            try:
+                hook(event, *args)
+            except Exception as exc:
+                warnings.warn(f"Dandolo {name} hook {hook!r} raised {exc!r}", RuntimeWarning, stacklevel=2)
+
+
+def opentelemetry_hooks(tracer: Any, chunk_events: bool = False) -> RequestHooks:
+    """
+    Hooks that record each HTTP attempt as an OpenTelemetry client span.
+
+    The tracer comes from the application's own OpenTelemetry setup; the
+    SDK only calls its start_span method. Spans follow the HTTP client
+    conventions (one span per attempt, http.request.resend_count on
+    retries), are children of the span active when the call was made, and
+    carry the timing breakdown as dandolo.timing.* attributes. Streamed
+    responses stay open until the stream ends, with a "first_chunk" event
+    marking the time to first token.
+
+    Example:
+        from opentelemetry import trace
+
+        client = Dandolo(
+            api_key="ak_your_agent_key",
+            hooks=opentelemetry_hooks(trace.get_tracer("my-agent"))
+        )
+
+    Args:
+        tracer: An opentelemetry.trace.Tracer (or anything with the same
+            start_span interface)
+        chunk_events: Also add a span event for every streamed chunk
+
+    Returns:
+        RequestHooks to pass to the client (or merge with add())
+    """
+    trace = optional_import("opentelemetry.trace")
+
+    def before_request(event: RequestEvent) -> None:
+        attributes: Dict[str, Any] = {
+            "http.request.method": event.method,
+            "url.full": event.url,
+            "dandolo.endpoint": event.endpoint,
+            "dandolo.stream": event.stream
+        }
+        if event.attempt:
+            attributes["http.request.resend_count"] = event.attempt
+        model = (event.data or {}).get("model")
+        if model:
+            attributes["gen_ai.request.model"] = model
+        kwargs: Dict[str, Any] = {"attributes": attributes}
+        if trace is not None:
+            kwargs["kind"] = trace.SpanKind.CLIENT
+        event.context["span"] = tracer.start_span(f"{event.method} {event.endpoint}", **kwargs)
+
+    def end_span(event: RequestEvent) -> None:
+        span = event.context.pop("span", None)
+        if span is None:
+            return
+        if event.status_code is not None:
+            span.set_attribute("http.response.status_code", event.status_code)
+        for name, value in event.timing.to_dict().items():
+            span.set_attribute(f"dandolo.timing.{name}", value)
+        if event.chunks:
+            span.set_attribute("dandolo.stream.chunks", event.chunks)
+        if event.error is not None:
+            span.set_attribute("error.type", type(event.error).__name__)
+            span.record_exception(event.error)
+            if trace is not None:
+                span.set_status(trace.Status(trace.StatusCode.ERROR, str(event.error)))
+        span.end()
+
+    def after_response(event: RequestEvent) -> None:
+        if event.stream and event.error is None:
+            span = event.context.get("span")
+            if span is not None:
+                span.set_attribute("http.response.status_code", event.status_code)
+                span.add_event("response_headers")
+            return
+        end_span(event)
+
+    def on_stream_chunk(event: RequestEvent, chunk: Any) -> None:
+        span = event.context.get("span")
+        if span is not None and (event.chunks == 1 or chunk_events):
+            span.add_event("first_chunk" if event.chunks == 1 else "chunk")
+
+    return RequestHooks(
+        before_request=before_request,
+        after_response=after_response,
+        on_retry=end_span,
+        on_error=end_span,
+        on_stream_chunk=on_stream_chunk,
+        on_stream_end=end_span
+    )
\ No newline at end of file
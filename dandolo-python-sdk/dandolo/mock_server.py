@@ -0,0 +1,515 @@
+"""
+Dandolo SDK Mock Server
+
+A local, Dandolo-compatible API server for offline tests, capacity runs
+and incident reproduction. It serves /v1/chat/completions (JSON and
+server-sent events) and /v1/models with the same bodies, error objects
+and rate-limit headers as the production API. Latency, token rate,
+5xx and 429 rates, request-rate limits and dropped streams are
+configurable, and individual faults can be queued at runtime.
+
+Requires the optional "async" extra: pip install dandolo-ai[async]
+"""
+
+import argparse
+import asyncio
+import collections
+import json
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Set, Tuple
+
+try:
+    from aiohttp import web
+except ImportError:  # pragma: no cover - optional dependency
+    web = None
+
+from .tokens import TokenEstimator
+
+
+DEFAULT_MODELS = [
+    {"id": "llama-3.3-70b", "type": "text", "context_length": 65536},
+    {"id": "qwen-2.5-coder-32b", "type": "code", "context_length": 32768},
+    {"id": "mistral-31-24b", "type": "multimodal", "context_length": 131072}
+]
+
+_WORDS = (
+    "the quick brown fox jumps over a lazy dog while agents plan their next "
+    "step and the network routes each request to a healthy provider"
+).split()
+
+# z-score of the 99th percentile of a normal distribution
+_Z99 = 2.3263
+
+
+class Latency:
+    """
+    Distribution of the delay before the server starts answering.
+    
+    Example:
+        Latency.lognormal(median=0.4, p99=3.0)
+    """
+    
+    def __init__(self, sampler: Callable[[random.Random], float], description: str):
+        self._sampler = sampler
+        self.description = description
+    
+    @classmethod
+    def fixed(cls, seconds: float) -> "Latency":
+        return cls(lambda rng: seconds, f"fixed:{seconds}")
+    
+    @classmethod
+    def uniform(cls, low: float, high: float) -> "Latency":
+        return cls(lambda rng: rng.uniform(low, high), f"uniform:{low},{high}")
+    
+    @classmethod
+    def exponential(cls, mean: float) -> "Latency":
+        return cls(lambda rng: rng.expovariate(1.0 / mean) if mean > 0 else 0.0, f"exponential:{mean}")
+    
+    @classmethod
+    def lognormal(cls, median: float, p99: float) -> "Latency":
+        """Long-tailed latency given its median and 99th percentile."""
+        sigma = math.log(p99 / median) / _Z99 if p99 > median > 0 else 0.0
+        mu = math.log(median) if median > 0 else float("-inf")
+        return cls(lambda rng: rng.lognormvariate(mu, sigma) if median > 0 else 0.0, f"lognormal:{median},{p99}")
+    
+    @classmethod
+    def parse(cls, spec: str) -> "Latency":
+        """
+        Build a distribution from a "kind:arg,arg" string.
+        
+        Args:
+            spec: e.g. "0.2", "fixed:0.2", "uniform:0.1,0.5",
+                "exponential:0.3" or "lognormal:0.4,3.0"
+        
+        Raises:
+            ValueError: Unknown kind or wrong number of arguments
+        """
+        kind, _, args = spec.partition(":")
+        if not args:
+            return cls.fixed(float(kind))
+        values = [float(value) for value in args.split(",")]
+        builders = {"fixed": cls.fixed, "uniform": cls.uniform, "exponential": cls.exponential, "lognormal": cls.lognormal}
+        if kind not in builders:
+            raise ValueError(f"Unknown latency distribution '{kind}'; expected one of {', '.join(builders)}")
+        return builders[kind](*values)
+    
+    def sample(self, rng: random.Random) -> float:
+        return max(0.0, self._sampler(rng))
+    
+    def __repr__(self) -> str:
+        return f"Latency({self.description})"
+
+
+@dataclass
+class MockServerConfig:
+    """Behaviour of a MockServer; may be changed while it runs."""
+    latency: Latency = field(default_factory=lambda: Latency.fixed(0.0))
+    tokens_per_second: float = 0.0  # generation speed; 0 answers instantly
+    completion_tokens: int = 32
+    error_rate: float = 0.0  # fraction of completions answered with a 5xx
+    error_statuses: Sequence[int] = (500, 502, 503)
+    rate_limit_rate: float = 0.0  # fraction of completions answered with a 429
+    requests_per_second: Optional[float] = None  # enforced with 429s when set
+    retry_after: float = 1.0
+    disconnect_rate: float = 0.0  # fraction of streams cut off halfway
+    api_keys: Optional[Set[str]] = None  # accepted keys; None accepts any
+    models: List[Dict[str, Any]] = field(default_factory=lambda: [dict(model) for model in DEFAULT_MODELS])
+    seed: Optional[int] = None
+
+
+class MockServer:
+    """
+    Dandolo-compatible API server running on asyncio.
+    
+    Use it as an async context manager inside an event loop, or as a plain
+    context manager, which runs the server on a background thread for
+    synchronous clients.
+    
+    Example:
+        config = MockServerConfig(latency=Latency.lognormal(0.3, 2.0), error_rate=0.05)
+        with MockServer(config) as server:
+            client = Dandolo(api_key="dk_test", base_url=server.url)
+            client.chat.completions.create(messages=[{"role": "user", "content": "Hi"}])
+            server.inject(429, retry_after=2)  # the next completion is rate limited
+            print(server.stats())
+    """
+    
+    def __init__(self, config: Optional[MockServerConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the server.
+        
+        Args:
+            config: Server behaviour (defaults: instant, error-free)
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+        """
+        if web is None:
+            raise ImportError("MockServer requires aiohttp. Install it with: pip install dandolo-ai[async]")
+        
+        self.config = config or MockServerConfig()
+        self.host = host
+        self.port = port
+        self._rng = random.Random(self.config.seed)
+        self._estimator = TokenEstimator()
+        self._faults: Deque[Tuple[int, Optional[float]]] = collections.deque()
+        self._counts: collections.Counter = collections.Counter()
+        self._usage: collections.Counter = collections.Counter()
+        self._bucket_tokens = max(1.0, self.config.requests_per_second or 1.0)
+        self._bucket_updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._runner: Optional["web.AppRunner"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def url(self) -> str:
+        """Base URL to pass to the client."""
+        return f"http://{self.host}:{self.port}"
+    
+    def inject(self, status: int, count: int = 1, retry_after: Optional[float] = None) -> None:
+        """
+        Queue faults for the next chat completions.
+        
+        Args:
+            status: HTTP status to answer with (e.g. 401, 429, 500, 503)
+            count: Number of consecutive completions to fail
+            retry_after: Retry-After seconds for the faults (429 defaults
+                to config.retry_after)
+        """
+        for _ in range(count):
+            self._faults.append((status, retry_after))
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Counts of what the server answered.
+        
+        Returns:
+            Dictionary with "requests", "streams", "disconnects" and one
+            "status_<code>" entry per status code sent
+        """
+        with self._lock:
+            return dict(self._counts)
+    
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._counts[key] += 1
+    
+    # -- lifecycle ---------------------------------------------------------
+    
+    async def start(self) -> str:
+        """
+        Start serving on the running event loop.
+        
+        Returns:
+            Base URL of the server
+        """
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self._chat_completions)
+        app.router.add_get("/v1/models", self._models)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        # With port 0 the OS picks a free port; read back the bound one
+        self.port = self._runner.addresses[0][1]
+        return self.url
+    
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+    
+    async def __aenter__(self) -> "MockServer":
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+    
+    def __enter__(self) -> "MockServer":
+        started = threading.Event()
+        failure: List[BaseException] = []
+        self._loop = asyncio.new_event_loop()
+        
+        def run() -> None:
+            asyncio.set_event_loop(self._loop)
+            try:
+                self._loop.run_until_complete(self.start())
+            except BaseException as exc:
+                failure.append(exc)
+                started.set()
+                return
+            started.set()
+            self._loop.run_forever()
+        
+        self._thread = threading.Thread(target=run, name="dandolo-mock-server", daemon=True)
+        self._thread.start()
+        started.wait()
+        if failure:
+            self._loop.close()
+            raise failure[0]
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        asyncio.run_coroutine_threadsafe(self.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+    
+    # -- request handling --------------------------------------------------
+    
+    def _headers(self, api_key: Optional[str] = None, started: Optional[float] = None) -> Dict[str, str]:
+        headers = {
+            "Access-Control-Allow-Origin": "*",
+            "X-Dandolo-Version": "1.0.0",
+            "X-Dandolo-Endpoint": "mock"
+        }
+        if api_key is not None:
+            key_type = "agent" if api_key.startswith("ak_") else "developer"
+            limit = 5000 if key_type == "agent" else 500
+            with self._lock:
+                self._usage[api_key] += 1
+                used = self._usage[api_key]
+            headers.update({
+                "X-RateLimit-Limit": str(limit),
+                "X-RateLimit-Remaining": str(max(0, limit - used)),
+                "X-RateLimit-Reset": str(int(time.time()) + 24 * 60 * 60),
+                "X-RateLimit-Type": key_type
+            })
+        if started is not None:
+            headers["X-Response-Time"] = str(int((time.monotonic() - started) * 1000))
+        return headers
+    
+    def _error(
+        self,
+        status: int,
+        message: str,
+        type_: str,
+        code: str,
+        headers: Optional[Dict[str, str]] = None
+    ) -> "web.Response":
+        self._count(f"status_{status}")
+        return web.json_response(
+            {"error": {"message": message, "type": type_, "code": code}},
+            status=status,
+            headers={**self._headers(), **(headers or {})}
+        )
+    
+    def _authenticate(self, request: "web.Request") -> Tuple[Optional[str], Optional["web.Response"]]:
+        auth = request.headers.get("Authorization", "")
+        if not auth.startswith("Bearer "):
+            return None, self._error(401, "Missing or invalid Authorization header", "authentication_error", "missing_auth_header")
+        api_key = auth[7:]
+        if self.config.api_keys is not None and api_key not in self.config.api_keys:
+            return None, self._error(401, "Invalid API key", "authentication_error", "invalid_api_key")
+        return api_key, None
+    
+    def _rate_limited(self) -> Optional[float]:
+        """Take a token from the request-rate bucket; return the wait if empty."""
+        rate = self.config.requests_per_second
+        if not rate:
+            return None
+        with self._lock:
+            now = time.monotonic()
+            burst = max(1.0, rate)
+            self._bucket_tokens = min(burst, self._bucket_tokens + (now - self._bucket_updated) * rate)
+            self._bucket_updated = now
+            if self._bucket_tokens >= 1.0:
+                self._bucket_tokens -= 1.0
+                return None
+            return (1.0 - self._bucket_tokens) / rate
+    
+    def _fault(self, status: int, retry_after: Optional[float]) -> "web.Response":
+        if status == 401:
+            return self._error(401, "Invalid API key", "authentication_error", "invalid_api_key")
+        if status == 429:
+            wait = self.config.retry_after if retry_after is None else retry_after
+            return self._error(
+                429, "Rate limit exceeded", "rate_limit_error", "rate_limit_exceeded",
+                {"Retry-After": str(max(1, math.ceil(wait)))}
+            )
+        headers = {"Retry-After": str(math.ceil(retry_after))} if retry_after is not None else None
+        if status >= 500:
+            return self._error(status, "Internal server error", "server_error", "internal_error", headers)
+        return self._error(status, "Injected fault", "invalid_request_error", "injected_fault", headers)
+    
+    async def _chat_completions(self, request: "web.Request") -> "web.StreamResponse":
+        started = time.monotonic()
+        self._count("requests")
+        api_key, rejected = self._authenticate(request)
+        if rejected is not None:
+            return rejected
+        
+        try:
+            body = json.loads(await request.read())
+        except ValueError:
+            return self._error(400, "Request body is not valid JSON", "validation_error", "invalid_json")
+        messages = body.get("messages") if isinstance(body, dict) else None
+        if not messages or not isinstance(messages, list):
+            return self._error(400, "Messages array is required and cannot be empty", "validation_error", "invalid_messages")
+        
+        if self._faults:
+            status, retry_after = self._faults.popleft()
+            if status != 429:
+                await asyncio.sleep(self.config.latency.sample(self._rng))
+            return self._fault(status, retry_after)
+        
+        wait = self._rate_limited()
+        if wait is not None or self._rng.random() < self.config.rate_limit_rate:
+            return self._fault(429, wait)
+        
+        await asyncio.sleep(self.config.latency.sample(self._rng))
+        if self._rng.random() < self.config.error_rate:
+            return self._fault(self._rng.choice(list(self.config.error_statuses)), None)
+        
+        model = body.get("model") or "auto-select"
+        if model == "auto-select":
+            model = self.config.models[0]["id"] if self.config.models else "llama-3.3-70b"
+        length = self.config.completion_tokens
+        if isinstance(body.get("max_tokens"), int):
+            length = min(length, body["max_tokens"])
+        words = [self._rng.choice(_WORDS) for _ in range(max(1, length))]
+        prompt_tokens = self._estimator.count_messages(messages)
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": len(words),
+            "total_tokens": prompt_tokens + len(words)
+        }
+        completion_id = f"chatcmpl-{int(time.time() * 1000)}"
+        
+        if body.get("stream"):
+            return await self._stream(request, api_key, started, completion_id, model, words, usage)
+        
+        if self.config.tokens_per_second > 0:
+            await asyncio.sleep(len(words) / self.config.tokens_per_second)
+        self._count("status_200")
+        return web.json_response({
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": " ".join(words)},
+                "finish_reason": "stop"
+            }],
+            "usage": usage
+        }, headers=self._headers(api_key, started))
+    
+    async def _stream(
+        self,
+        request: "web.Request",
+        api_key: str,
+        started: float,
+        completion_id: str,
+        model: str,
+        words: List[str],
+        usage: Dict[str, int]
+    ) -> "web.StreamResponse":
+        self._count("streams")
+        self._count("status_200")
+        response = web.StreamResponse(headers={
+            **self._headers(api_key, started),
+            "Content-Type": "text/event-stream",
+            "Cache-Control": "no-cache"
+        })
+        await response.prepare(request)
+        
+        def chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None, **extra) -> bytes:
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+                **extra
+            }
+            return b"data: " + json.dumps(payload).encode("utf-8") + b"\n\n"
+        
+        cut_at = len(words) // 2 if self._rng.random() < self.config.disconnect_rate else None
+        interval = 1.0 / self.config.tokens_per_second if self.config.tokens_per_second > 0 else 0.0
+        await response.write(chunk({"role": "assistant"}))
+        for index, word in enumerate(words):
+            if index == cut_at:
+                # Drop the connection mid-stream, as a failing upstream would
+                self._count("disconnects")
+                request.transport.close()
+                return response
+            if interval:
+                await asyncio.sleep(interval)
+            await response.write(chunk({"content": word if index == 0 else " " + word}))
+        await response.write(chunk({}, "stop", usage=usage))
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
+    
+    async def _models(self, request: "web.Request") -> "web.Response":
+        self._count("requests")
+        api_key, rejected = self._authenticate(request)
+        if rejected is not None:
+            return rejected
+        created = int(time.time())
+        data = [
+            {
+                "object": "model",
+                "created": created,
+                "owned_by": "dandolo",
+                "permission": [],
+                "root": model["id"],
+                "parent": None,
+                **model
+            }
+            for model in self.config.models
+        ]
+        self._count("status_200")
+        return web.json_response({"object": "list", "data": data}, headers=self._headers())
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for the dandolo-mock-server command."""
+    parser = argparse.ArgumentParser(prog="dandolo-mock-server", description="Run a local Dandolo-compatible API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", default="0", help='Time to first byte, e.g. "0.2", "uniform:0.1,0.5", "lognormal:0.4,3"')
+    parser.add_argument("--tokens-per-second", type=float, default=0.0, help="Generation speed (0 for instant)")
+    parser.add_argument("--completion-tokens", type=int, default=32)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of completions answered with a 5xx")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of completions answered with a 429")
+    parser.add_argument("--rps", type=float, help="Request rate enforced with 429s")
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--disconnect-rate", type=float, default=0.0, help="Fraction of streams cut off halfway")
+    parser.add_argument("--api-key", action="append", dest="api_keys", help="Accepted key (repeatable; default: any)")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+    
+    config = MockServerConfig(
+        latency=Latency.parse(args.latency),
+        tokens_per_second=args.tokens_per_second,
+        completion_tokens=args.completion_tokens,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        requests_per_second=args.rps,
+        retry_after=args.retry_after,
+        disconnect_rate=args.disconnect_rate,
+        api_keys=set(args.api_keys) if args.api_keys else None,
+        seed=args.seed
+    )
+    
+    async def serve() -> None:
+        async with MockServer(config, args.host, args.port) as server:
+            print(f"Dandolo mock server listening on {server.url} (latency {config.latency.description})", flush=True)
+            await asyncio.Event().wait()
+    
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
\ No newline at end of file
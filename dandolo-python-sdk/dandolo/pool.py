@@ -0,0 +1,258 @@
+"""
+Dandolo SDK Connection Pooling
+
+Tunable HTTP connection pool for the Dandolo client, shared safely across
+threads and instrumented so pools can be sized from observed usage.
+"""
+
+import socket
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .hooks import record_phase
+
+
+# Connections kept per host by default, matching requests
+DEFAULT_POOL_SIZE = 10
+
+
+@dataclass
+class PoolStats:
+    """Connection pool counters."""
+    requests: int = 0
+    connections_created: int = 0
+    connections_discarded: int = 0
+    in_use: int = 0
+    peak_in_use: int = 0
+    wait_time: float = 0.0
+    pool_maxsize: int = 0
+    hosts: int = 0
+    sessions: int = 0
+    
+    @property
+    def connections_reused(self) -> int:
+        """Requests served on an already open connection."""
+        return max(0, self.requests - self.connections_created)
+    
+    @property
+    def reuse_rate(self) -> float:
+        """Fraction of requests that reused a connection."""
+        return self.connections_reused / self.requests if self.requests else 0.0
+    
+    @property
+    def utilization(self) -> float:
+        """Peak connections in use (all hosts) relative to pool_maxsize."""
+        return self.peak_in_use / self.pool_maxsize if self.pool_maxsize else 0.0
+
+
+class _PoolTracker:
+    """Thread-safe counters updated by the instrumented urllib3 pools."""
+    
+    def __init__(self):
+        self.stats = PoolStats()
+        self.lock = threading.Lock()
+    
+    def created(self) -> None:
+        with self.lock:
+            self.stats.connections_created += 1
+    
+    def checked_out(self, waited: float) -> None:
+        with self.lock:
+            self.stats.requests += 1
+            self.stats.in_use += 1
+            self.stats.peak_in_use = max(self.stats.peak_in_use, self.stats.in_use)
+            self.stats.wait_time += waited
+    
+    def checked_in(self, discarded: bool) -> None:
+        with self.lock:
+            self.stats.in_use = max(0, self.stats.in_use - 1)
+            if discarded:
+                self.stats.connections_discarded += 1
+
+
+class _TrackedPoolMixin:
+    """Counts connection creation, checkout and return on a urllib3 pool."""
+    
+    tracker: _PoolTracker
+    
+    def _new_conn(self):
+        self.tracker.created()
+        return super()._new_conn()
+    
+    def _get_conn(self, timeout=None):
+        start = time.monotonic()
+        conn = super()._get_conn(timeout=timeout)
+        waited = time.monotonic() - start
+        self.tracker.checked_out(waited)
+        record_phase("queueing", waited)
+        return conn
+    
+    def _put_conn(self, conn) -> None:
+        # A full pool means the connection is closed instead of kept alive
+        discarded = conn is not None and self.pool is not None and self.pool.full()
+        self.tracker.checked_in(discarded)
+        super()._put_conn(conn)
+
+
+class _TimedConnectMixin:
+    """Records connection setup time for request hooks."""
+    
+    def connect(self) -> None:
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            record_phase("connect", time.perf_counter() - start)
+
+
+_TimedHTTPConnection = type("TimedHTTPConnection", (_TimedConnectMixin, HTTPConnection), {})
+_TimedHTTPSConnection = type("TimedHTTPSConnection", (_TimedConnectMixin, HTTPSConnection), {})
+
+
+class _TrackedAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools report to a _PoolTracker."""
+    
+    def __init__(self, tracker: _PoolTracker, socket_options: Optional[list] = None, **kwargs):
+        self._tracker = tracker
+        self._socket_options = socket_options
+        super().__init__(**kwargs)
+    
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self._socket_options is not None:
+            pool_kwargs["socket_options"] = self._socket_options
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        tracker = self._tracker
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": type(
+                "TrackedHTTPConnectionPool",
+                (_TrackedPoolMixin, HTTPConnectionPool),
+                {"tracker": tracker, "ConnectionCls": _TimedHTTPConnection}
+            ),
+            "https": type(
+                "TrackedHTTPSConnectionPool",
+                (_TrackedPoolMixin, HTTPSConnectionPool),
+                {"tracker": tracker, "ConnectionCls": _TimedHTTPSConnection}
+            )
+        }
+    
+    @property
+    def hosts(self) -> int:
+        return len(self.poolmanager.pools)
+
+
+class ConnectionPool:
+    """
+    HTTP connection pool shared by all threads using a Dandolo client.
+    
+    One urllib3 pool manager holds the open connections. With
+    per_thread_sessions each thread gets its own requests.Session, so no
+    session state is shared between threads, while every session is mounted
+    on the same adapter and therefore reuses the same connections.
+    
+    Size pool_maxsize to the number of threads issuing requests
+    concurrently; otherwise connections beyond the limit are opened and
+    closed per request (counted as connections_discarded), or callers
+    queue for a free connection when pool_block is set.
+    
+    Example:
+        client = Dandolo(
+            api_key="ak_your_agent_key",
+            max_workers=200,
+            connection_pool=ConnectionPool(pool_maxsize=200, pool_block=True)
+        )
+        stats = client.pool.stats()
+        print(f"reuse {stats.reuse_rate:.0%}, peak {stats.peak_in_use}/{stats.pool_maxsize}")
+    """
+    
+    def __init__(
+        self,
+        pool_maxsize: int = DEFAULT_POOL_SIZE,
+        pool_connections: int = DEFAULT_POOL_SIZE,
+        pool_block: bool = False,
+        tcp_keepalive: bool = True,
+        per_thread_sessions: bool = True
+    ):
+        """
+        Initialize the pool.
+        
+        Args:
+            pool_maxsize: Connections kept open per host
+            pool_connections: Hosts for which a pool is cached
+            pool_block: Wait for a free connection instead of opening an
+                extra, unpooled one when all are in use
+            tcp_keepalive: Enable TCP keep-alive so idle pooled connections
+                are not silently dropped by NAT and load balancers
+            per_thread_sessions: Give each thread its own Session on top of
+                the shared connections (otherwise one Session is shared)
+        """
+        self.pool_maxsize = pool_maxsize
+        self.pool_connections = pool_connections
+        self.pool_block = pool_block
+        self.per_thread_sessions = per_thread_sessions
+        self.headers: Dict[str, str] = {}
+        
+        socket_options = None
+        if tcp_keepalive:
+            socket_options = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            ]
+        
+        self._tracker = _PoolTracker()
+        self._adapter = _TrackedAdapter(
+            self._tracker,
+            socket_options=socket_options,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self._local = threading.local()
+        self._shared: Optional[requests.Session] = None
+        self._sessions: "weakref.WeakSet[requests.Session]" = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._shared_lock = threading.Lock()
+    
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update(self.headers)
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+        with self._lock:
+            self._sessions.add(session)
+        return session
+    
+    def session(self) -> requests.Session:
+        """Return the Session for the calling thread."""
+        if not self.per_thread_sessions:
+            if self._shared is None:
+                with self._shared_lock:
+                    if self._shared is None:
+                        self._shared = self._new_session()
+            return self._shared
+        
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._new_session()
+            self._local.session = session
+        return session
+    
+    def stats(self) -> PoolStats:
+        """Return a snapshot of the pool counters."""
+        with self._tracker.lock:
+            stats = PoolStats(**vars(self._tracker.stats))
+        stats.pool_maxsize = self.pool_maxsize
+        stats.hosts = self._adapter.hosts
+        with self._lock:
+            stats.sessions = len(self._sessions)
+        return stats
+    
+    def close(self) -> None:
+        """Close every pooled connection."""
+        self._adapter.close()
\ No newline at end of file
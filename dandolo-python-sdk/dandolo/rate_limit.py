@@ -0,0 +1,264 @@
+"""
+Dandolo SDK Rate Limiting
+
+Client-side token buckets that pace requests to stay within per-second
+and per-day quotas, adapting to 429 responses and rate-limit headers.
+"""
+
+import email.utils
+import threading
+import time
+from typing import Mapping, Optional
+
+from .exceptions import RateLimitError
+
+
+# Daily request quotas by API key prefix
+DAILY_LIMITS = {
+    "dk_": 500,
+    "ak_": 5000
+}
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+    
+    Args:
+        value: Delay in seconds or an HTTP date
+    
+    Returns:
+        Seconds to wait, or None if the value is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at a fixed rate.
+    
+    Not thread-safe on its own; RateLimiter serializes access.
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize a full bucket.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of stored tokens
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._updated = time.monotonic()
+    
+    def refill(self, now: float) -> None:
+        """Add the tokens accrued since the last update."""
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self._updated = now
+    
+    def wait_time(self, tokens: float = 1.0) -> float:
+        """Seconds until the given number of tokens is available."""
+        deficit = tokens - self.tokens
+        if deficit <= 0:
+            return 0.0
+        if self.rate <= 0:
+            return float("inf")
+        return deficit / self.rate
+
+
+class RateLimiter:
+    """
+    Paces requests with a per-second and a per-day token bucket.
+    
+    Requests reserve a token and sleep until it becomes available, so a
+    burst of calls is spread out instead of failing with 429s. On a 429 the
+    limiter pauses for Retry-After and halves its per-second rate, then
+    recovers gradually as requests succeed. X-RateLimit-Remaining and
+    X-RateLimit-Limit headers keep the daily bucket in line with the server.
+    
+    Example:
+        client = Dandolo(
+            api_key="ak_your_agent_key",
+            rate_limiter=RateLimiter.for_api_key("ak_your_agent_key")
+        )
+    """
+    
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = 10.0,
+        requests_per_day: Optional[int] = None,
+        burst: Optional[int] = None,
+        max_wait: Optional[float] = 60.0,
+        min_rate: float = 0.1
+    ):
+        """
+        Initialize the limiter.
+        
+        Args:
+            requests_per_second: Sustained request rate (None for no per-second limit)
+            requests_per_day: Daily quota (None for no daily limit)
+            burst: Requests allowed back-to-back (defaults to requests_per_second)
+            max_wait: Longest a call may queue before RateLimitError is
+                raised locally (None to wait indefinitely)
+            min_rate: Floor for the per-second rate after 429 backoff
+        """
+        self.requests_per_second = requests_per_second
+        self.requests_per_day = requests_per_day
+        self.max_wait = max_wait
+        self.min_rate = min_rate
+        
+        self._second: Optional[TokenBucket] = None
+        if requests_per_second is not None:
+            capacity = burst if burst is not None else max(1.0, requests_per_second)
+            self._second = TokenBucket(requests_per_second, capacity)
+        
+        self._day: Optional[TokenBucket] = None
+        if requests_per_day is not None:
+            self._day = TokenBucket(requests_per_day / SECONDS_PER_DAY, requests_per_day)
+        
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def for_api_key(cls, api_key: str, **kwargs) -> "RateLimiter":
+        """
+        Create a limiter with the daily quota of the key type.
+        
+        Args:
+            api_key: Dandolo API key (dk_ 500/day, ak_ 5000/day)
+            **kwargs: Other RateLimiter parameters
+        
+        Returns:
+            RateLimiter instance
+        """
+        kwargs.setdefault("requests_per_day", DAILY_LIMITS.get(api_key[:3]))
+        return cls(**kwargs)
+    
+    @property
+    def current_rate(self) -> Optional[float]:
+        """Per-second rate currently in effect."""
+        return self._second.rate if self._second is not None else None
+    
+    def reserve(self) -> float:
+        """
+        Reserve capacity for one request.
+        
+        Returns:
+            Seconds the caller must wait before sending
+        
+        Raises:
+            RateLimitError: The wait would exceed max_wait
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._paused_until - now)
+            for bucket in (self._second, self._day):
+                if bucket is not None:
+                    bucket.refill(now)
+                    wait = max(wait, bucket.wait_time())
+            
+            if self.max_wait is not None and wait > self.max_wait:
+                raise RateLimitError(
+                    "Client-side rate limit reached",
+                    retry_after=str(int(wait + 0.999))
+                )
+            
+            for bucket in (self._second, self._day):
+                if bucket is not None:
+                    bucket.tokens -= 1
+            return wait
+    
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a request may be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            import asyncio
+            await asyncio.sleep(wait)
+    
+    def on_success(self) -> None:
+        """Recover the per-second rate after a successful request."""
+        if self._second is None or self.requests_per_second is None:
+            return
+        with self._lock:
+            if self._second.rate < self.requests_per_second:
+                self._second.rate = min(
+                    self.requests_per_second,
+                    self._second.rate + self.requests_per_second * 0.05
+                )
+    
+    def on_rate_limited(self, retry_after: Optional[str] = None) -> None:
+        """
+        React to a 429 response.
+        
+        Args:
+            retry_after: Retry-After header value, if any
+        """
+        delay = parse_retry_after(retry_after)
+        with self._lock:
+            now = time.monotonic()
+            if delay is not None:
+                self._paused_until = max(self._paused_until, now + delay)
+            if self._second is not None:
+                self._second.refill(now)
+                self._second.rate = max(self.min_rate, self._second.rate / 2)
+                # Run the bucket into debt for the pause so queued calls
+                # resume spaced out rather than all at once
+                self._second.tokens = min(self._second.tokens, -(delay or 0.0) * self._second.rate)
+    
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        Align the daily bucket with the server's rate-limit headers.
+        
+        Args:
+            headers: Response headers (X-RateLimit-Limit, X-RateLimit-Remaining,
+                X-RateLimit-Reset)
+        """
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        try:
+            remaining = float(remaining)
+            limit = float(headers.get("X-RateLimit-Limit") or 0)
+            reset = float(headers.get("X-RateLimit-Reset") or 0)
+        except ValueError:
+            return
+        
+        with self._lock:
+            now = time.monotonic()
+            if self._day is None:
+                if not limit:
+                    return
+                self._day = TokenBucket(limit / SECONDS_PER_DAY, limit)
+            elif limit:
+                self._day.capacity = limit
+                self._day.rate = limit / SECONDS_PER_DAY
+            self._day.refill(now)
+            self._day.tokens = min(self._day.tokens, remaining)
+            
+            if remaining <= 0 and reset:
+                # Quota exhausted: nothing will succeed before the reset
+                self._paused_until = max(self._paused_until, now + max(0.0, reset - time.time()))
\ No newline at end of file
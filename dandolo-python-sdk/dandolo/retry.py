@@ -0,0 +1,168 @@
+"""
+Dandolo SDK Retry Policy
+
+Decides whether and when a failed request is retried: error
+classification, decorrelated jitter backoff, Retry-After handling and a
+retry budget that keeps a degraded backend from being flooded.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from typing import Optional, Tuple, Type
+
+from .exceptions import NetworkError, RateLimitError, ServerError
+from .rate_limit import parse_retry_after
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of recent request volume.
+    
+    Over a sliding window, retries may not exceed min_retries_per_second *
+    window plus ratio times the number of requests. When a backend fails
+    every call, the fleet then adds at most ratio extra load instead of
+    multiplying it by max_retries.
+    """
+    
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries_per_second: float = 1.0,
+        window: float = 10.0
+    ):
+        """
+        Initialize the budget.
+        
+        Args:
+            ratio: Retries allowed per request sent within the window
+            min_retries_per_second: Retries always allowed regardless of volume
+            window: Length of the sliding window in seconds
+        """
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window = window
+        self._requests: deque = deque()
+        self._retries: deque = deque()
+        self._lock = threading.Lock()
+    
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window
+        while self._requests and self._requests[0] < cutoff:
+            self._requests.popleft()
+        while self._retries and self._retries[0] < cutoff:
+            self._retries.popleft()
+    
+    def record_request(self) -> None:
+        """Record a first attempt, which earns retry allowance."""
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            self._requests.append(now)
+    
+    def try_spend(self) -> bool:
+        """
+        Withdraw one retry from the budget.
+        
+        Returns:
+            True if the retry is allowed
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            allowed = self.min_retries_per_second * self.window + self.ratio * len(self._requests)
+            if len(self._retries) >= allowed:
+                return False
+            self._retries.append(now)
+            return True
+
+
+class RetryPolicy:
+    """
+    Retry decisions for failed requests.
+    
+    Retries ServerError (5xx), NetworkError (timeouts, connection
+    failures) and RateLimitError (429). Backoff uses decorrelated jitter,
+    so clients that failed together do not retry in lockstep. A
+    Retry-After header takes precedence over the computed delay.
+    
+    Example:
+        client = Dandolo(
+            api_key="ak_your_agent_key",
+            retry_policy=RetryPolicy(max_retries=5, base_delay=0.5, max_delay=20)
+        )
+    """
+    
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        max_retry_after: float = 60.0,
+        budget: Optional[RetryBudget] = None,
+        retryable: Tuple[Type[Exception], ...] = (ServerError, NetworkError, RateLimitError)
+    ):
+        """
+        Initialize the policy.
+        
+        Args:
+            max_retries: Maximum number of retries per request
+            base_delay: Minimum backoff delay in seconds
+            max_delay: Maximum backoff delay in seconds
+            max_retry_after: Give up instead of waiting longer than this
+                for a server-requested Retry-After
+            budget: Retry budget shared by all requests of a client
+                (a new RetryBudget by default)
+            retryable: Exception types that may be retried
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.budget = budget if budget is not None else RetryBudget()
+        self.retryable = retryable
+    
+    def is_retryable(self, error: Exception) -> bool:
+        """Whether an error is transient and worth retrying."""
+        return isinstance(error, self.retryable)
+    
+    def backoff(self, previous_delay: float) -> float:
+        """
+        Decorrelated jitter: a random delay between base_delay and three
+        times the previous delay (or base_delay), capped at max_delay.
+        
+        Args:
+            previous_delay: Delay used before the last attempt (0 for the first retry)
+        
+        Returns:
+            Seconds to wait
+        """
+        upper = max(self.base_delay, previous_delay) * 3
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+    
+    def next_delay(self, attempt: int, error: Exception, previous_delay: float = 0.0) -> Optional[float]:
+        """
+        Decide whether to retry after a failed attempt.
+        
+        Args:
+            attempt: Number of retries already made for this request
+            error: Exception raised by the failed attempt
+            previous_delay: Delay used before the last attempt
+        
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        if attempt >= self.max_retries or not self.is_retryable(error):
+            return None
+        
+        retry_after = parse_retry_after(getattr(error, "retry_after", None))
+        if retry_after is not None and retry_after > self.max_retry_after:
+            return None
+        
+        if not self.budget.try_spend():
+            return None
+        
+        if retry_after is not None:
+            return retry_after
+        return self.backoff(previous_delay)
\ No newline at end of file
@@ -0,0 +1,110 @@
+"""
+Dandolo SDK Serialization
+
+JSON encoding and decoding for request and response bodies, using orjson
+or msgspec when installed and the standard library otherwise.
+"""
+
+import json
+from typing import Any, Optional, Union
+
+from ._optional import optional_import
+
+
+class Serializer:
+    """
+    JSON codec used by the clients.
+    
+    dumps() returns UTF-8 bytes ready to send; loads() accepts bytes or
+    str and raises ValueError on malformed input.
+    """
+    
+    name = "json"
+    
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object to JSON bytes."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode JSON bytes or text."""
+        return json.loads(data)
+
+
+class OrjsonSerializer(Serializer):
+    """Serializer backed by orjson."""
+    
+    name = "orjson"
+    
+    def __init__(self):
+        self._orjson = optional_import("orjson")
+        if self._orjson is None:
+            raise ImportError("OrjsonSerializer requires orjson. Install it with: pip install dandolo-ai[fast]")
+    
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._orjson.dumps(obj)
+        except TypeError:
+            # e.g. integers beyond 64 bits or non-string keys
+            return super().dumps(obj)
+    
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecSerializer(Serializer):
+    """Serializer backed by msgspec."""
+    
+    name = "msgspec"
+    
+    def __init__(self):
+        msgspec = optional_import("msgspec")
+        if msgspec is None:
+            raise ImportError("MsgspecSerializer requires msgspec. Install it with: pip install msgspec")
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._encode_errors = (TypeError, msgspec.EncodeError)
+        self._decode_error = msgspec.DecodeError
+    
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._encoder.encode(obj)
+        except self._encode_errors:
+            return super().dumps(obj)
+    
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as exc:
+            raise ValueError(str(exc)) from exc
+
+
+def get_serializer(name: Optional[str] = None) -> Serializer:
+    """
+    Return a serializer by name, or the fastest one available.
+    
+    Args:
+        name: "orjson", "msgspec" or "json"; None picks orjson, then
+            msgspec, then the standard library
+    
+    Returns:
+        Serializer instance
+    
+    Raises:
+        ImportError: The named backend is not installed
+        ValueError: Unknown name
+    """
+    if name is None:
+        if optional_import("orjson") is not None:
+            return OrjsonSerializer()
+        if optional_import("msgspec") is not None:
+            return MsgspecSerializer()
+        return Serializer()
+    
+    backends = {
+        "orjson": OrjsonSerializer,
+        "msgspec": MsgspecSerializer,
+        "json": Serializer
+    }
+    if name not in backends:
+        raise ValueError(f"Unknown serializer '{name}'; expected one of {', '.join(backends)}")
+    return backends[name]()
\ No newline at end of file
@@ -0,0 +1,155 @@
+"""
+Dandolo SDK Request Coalescing
+
+Lets identical requests that are in flight at the same time share one
+upstream call, so a burst of agents asking the same question costs a
+single completion.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable, Optional
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+@dataclass
+class SingleFlightStats:
+    """Coalescing counters."""
+    calls: int = 0
+    executed: int = 0
+    coalesced: int = 0
+    
+    @property
+    def coalesce_rate(self) -> float:
+        """Fraction of calls answered by another caller's request."""
+        return self.coalesced / self.calls if self.calls else 0.0
+
+
+class _Call:
+    """One in-flight call and the outcome its waiters receive."""
+    
+    __slots__ = ("done", "result", "error")
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Opt-in coalescing of identical in-flight chat completions.
+    
+    The first caller for a key sends the request; callers arriving with
+    the same key before it completes wait for it and receive the same
+    result, or the same exception. Nothing is kept once the call finishes,
+    so unlike ResponseCache this only merges concurrent requests and
+    never serves stale answers. The clients coalesce only deterministic
+    requests (temperature=0, not streaming), keyed like the cache.
+    
+    Example:
+        client = Dandolo(api_key="ak_your_agent_key", single_flight=SingleFlight())
+        # Ten agents asking the same planning question send one request
+        results = [client.chat.completions.submit(messages, temperature=0) for _ in range(10)]
+        print(client.single_flight.stats())
+    """
+    
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Hashable, "asyncio.Future"] = {}
+        self._stats = SingleFlightStats()
+        self._lock = threading.Lock()
+    
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn, or wait for the identical call already in flight.
+        
+        Args:
+            key: Identity of the request
+            fn: Sends the request and returns its result
+        
+        Returns:
+            Result of fn (shared by every caller with this key)
+        """
+        with self._lock:
+            self._stats.calls += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self._stats.executed += 1
+            else:
+                self._stats.coalesced += 1
+        
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+    
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Async variant of do().
+        
+        The request runs as a task of its own, so a caller that is
+        cancelled does not cancel the request for the others. Its outcome
+        is consumed even when every caller has been cancelled.
+        
+        Args:
+            key: Identity of the request
+            fn: Coroutine function that sends the request
+        
+        Returns:
+            Result of fn (shared by every caller with this key)
+        """
+        import asyncio
+        
+        # Tasks belong to one event loop; keep keys from different loops apart
+        key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            self._stats.calls += 1
+            task = self._tasks.get(key)
+            if task is None:
+                task = asyncio.ensure_future(fn())
+                self._tasks[key] = task
+                task.add_done_callback(lambda done: self._forget(key, done))
+                self._stats.executed += 1
+            else:
+                self._stats.coalesced += 1
+        return await asyncio.shield(task)
+    
+    def _forget(self, key: Hashable, task: "asyncio.Future") -> None:
+        with self._lock:
+            self._tasks.pop(key, None)
+        # Mark the error as retrieved: if every caller was cancelled, nobody
+        # awaits the task and asyncio would log "exception was never retrieved"
+        if not task.cancelled():
+            task.exception()
+    
+    def in_flight(self) -> int:
+        """Number of distinct requests currently in flight."""
+        with self._lock:
+            return len(self._calls) + len(self._tasks)
+    
+    def stats(self) -> SingleFlightStats:
+        """Return a snapshot of the coalescing counters."""
+        with self._lock:
+            return SingleFlightStats(
+                self._stats.calls,
+                self._stats.executed,
+                self._stats.coalesced
+            )
\ No newline at end of file
@@ -0,0 +1,522 @@
+"""
+Dandolo SDK Streaming
+
+Incremental parsing of server-sent event (SSE) responses into chat
+completion chunks, plus helpers to rebuild the final completion.
+"""
+
+import json
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional
+
+from .exceptions import DandoloError
+from .hooks import RequestEvent, RequestHooks
+from .types import (
+    ChatCompletion,
+    ChatCompletionChunk,
+    ChatMessage,
+    Choice,
+    ChoiceDelta,
+    ChunkChoice,
+    Usage
+)
+
+
+# Terminal sentinel sent by OpenAI-compatible servers
+DONE_SENTINEL = "[DONE]"
+
+
+class LineDecoder:
+    """
+    Incrementally split byte chunks into lines.
+    
+    Handles "\\n", "\\r\\n" and "\\r" terminators, including a "\\r\\n"
+    pair that is split across two chunks.
+    """
+    
+    def __init__(self):
+        self._pending = b""
+        self._skip_lf = False
+    
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """
+        Feed a chunk of bytes.
+    
+        Args:
+            chunk: Raw bytes as they arrive off the socket
+    
+        Returns:
+            Lines completed by this chunk, without their terminators
+        """
+        if not chunk:
+            return []
+        if self._skip_lf:
+            self._skip_lf = False
+            if chunk.startswith(b"\n"):
+                chunk = chunk[1:]
+        
+        data = self._pending + chunk
+        lines = []
+        start = 0
+        length = len(data)
+        while True:
+            cr = data.find(b"\r", start)
+            lf = data.find(b"\n", start)
+            if cr == -1 and lf == -1:
+                break
+            if cr == -1 or (lf != -1 and lf < cr):
+                lines.append(data[start:lf])
+                start = lf + 1
+                continue
+            lines.append(data[start:cr])
+            if cr + 1 < length:
+                start = cr + 2 if data[cr + 1:cr + 2] == b"\n" else cr + 1
+            else:
+                # "\r" ends this chunk; swallow a leading "\n" in the next one
+                start = cr + 1
+                self._skip_lf = True
+        self._pending = data[start:]
+        return lines
+    
+    def flush(self) -> List[bytes]:
+        """Return the trailing unterminated line, if any."""
+        pending, self._pending = self._pending, b""
+        return [pending] if pending else []
+
+
+def iter_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Split a stream of byte chunks into lines without buffering the body.
+    
+    Args:
+        chunks: Iterable of raw byte chunks as they arrive off the socket
+    
+    Yields:
+        Each line without its terminator
+    """
+    decoder = LineDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.flush()
+
+
+class SSEDecoder:
+    """
+    Incremental decoder for the text/event-stream format.
+    
+    Lines are fed one at a time; a completed event's data payload is
+    returned when the terminating blank line is seen.
+    """
+    
+    def __init__(self):
+        self._data: List[str] = []
+    
+    def decode(self, line: bytes) -> Optional[str]:
+        """
+        Feed a single line.
+        
+        Args:
+            line: Raw line without its terminator
+        
+        Returns:
+            The event's data payload when an event is complete, else None
+        """
+        if not line:
+            return self.flush()
+        
+        text = line.decode("utf-8")
+        if text.startswith(":"):
+            # Comment / keep-alive
+            return None
+        
+        field, _, value = text.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "data":
+            self._data.append(value)
+        # "event", "id" and "retry" fields are not used by the chat API
+        return None
+    
+    def flush(self) -> Optional[str]:
+        """Return any pending event payload and reset the decoder."""
+        if not self._data:
+            return None
+        payload = "\n".join(self._data)
+        self._data = []
+        return payload
+
+
+def iter_sse_data(lines: Iterable[bytes]) -> Iterator[str]:
+    """
+    Yield the data payload of each server-sent event.
+    
+    Args:
+        lines: Iterable of raw lines (see iter_lines)
+    
+    Yields:
+        Data payload strings, stopping at the [DONE] sentinel
+    """
+    decoder = SSEDecoder()
+    for line in lines:
+        payload = decoder.decode(line)
+        if payload is None:
+            continue
+        if payload == DONE_SENTINEL:
+            return
+        yield payload
+    
+    payload = decoder.flush()
+    if payload is not None and payload != DONE_SENTINEL:
+        yield payload
+
+
+def parse_chunk(data: Dict[str, Any]) -> ChatCompletionChunk:
+    """
+    Convert a decoded chunk payload into a ChatCompletionChunk.
+    
+    Args:
+        data: Decoded JSON object for one streamed chunk
+    
+    Returns:
+        ChatCompletionChunk object
+    
+    Raises:
+        DandoloError: If the server sent an error event mid-stream
+    """
+    if "error" in data:
+        error = data["error"] or {}
+        message = error.get("message", "Stream error") if isinstance(error, dict) else str(error)
+        raise DandoloError(message, "stream_error")
+    
+    choices = []
+    for choice in data.get("choices") or []:
+        delta = choice.get("delta") or {}
+        choices.append(ChunkChoice(
+            index=choice.get("index", 0),
+            delta=ChoiceDelta(role=delta.get("role"), content=delta.get("content")),
+            finish_reason=choice.get("finish_reason")
+        ))
+    
+    usage = data.get("usage")
+    return ChatCompletionChunk(
+        id=data.get("id", ""),
+        created=data.get("created"),
+        model=data.get("model", "auto-select"),
+        choices=choices,
+        usage=Usage.from_dict(usage) if usage else None
+    )
+
+
+def chunk_from_completion(data: Dict[str, Any]) -> ChatCompletionChunk:
+    """
+    Express a complete (non-streamed) completion payload as a single chunk.
+    
+    Used when the server ignores stream=True and answers with plain JSON.
+    """
+    choices = []
+    for choice in data.get("choices") or []:
+        message = choice.get("message") or {}
+        choices.append(ChunkChoice(
+            index=choice.get("index", 0),
+            delta=ChoiceDelta(role=message.get("role"), content=message.get("content")),
+            finish_reason=choice.get("finish_reason")
+        ))
+    
+    usage = data.get("usage")
+    return ChatCompletionChunk(
+        id=data.get("id", ""),
+        created=data.get("created"),
+        model=data.get("model", "auto-select"),
+        choices=choices,
+        usage=Usage.from_dict(usage) if usage else None
+    )
+
+
+class ChunkAccumulator:
+    """
+    Rebuilds a ChatCompletion from streamed deltas.
+    
+    Only the concatenated content per choice is kept, not the chunks.
+    """
+    
+    def __init__(self):
+        self.id: Optional[str] = None
+        self.created: Optional[int] = None
+        self.model: Optional[str] = None
+        self.usage: Optional[Usage] = None
+        self._roles: Dict[int, str] = {}
+        self._parts: Dict[int, List[str]] = {}
+        self._finish_reasons: Dict[int, Optional[str]] = {}
+    
+    def add(self, chunk: ChatCompletionChunk) -> None:
+        """Merge a chunk into the running completion."""
+        if not self.id and chunk.id:
+            self.id = chunk.id
+        if self.created is None:
+            self.created = chunk.created
+        if self.model is None and chunk.model:
+            self.model = chunk.model
+        if chunk.usage is not None:
+            self.usage = chunk.usage
+        
+        for choice in chunk.choices:
+            parts = self._parts.setdefault(choice.index, [])
+            if choice.delta.role:
+                self._roles[choice.index] = choice.delta.role
+            if choice.delta.content:
+                parts.append(choice.delta.content)
+            if choice.finish_reason is not None:
+                self._finish_reasons[choice.index] = choice.finish_reason
+    
+    def completion(self) -> ChatCompletion:
+        """Return the ChatCompletion assembled so far."""
+        choices = [
+            Choice(
+                index=index,
+                message=ChatMessage(
+                    role=self._roles.get(index, "assistant"),
+                    content="".join(self._parts[index])
+                ),
+                finish_reason=self._finish_reasons.get(index)
+            )
+            for index in sorted(self._parts)
+        ]
+        return ChatCompletion(
+            id=self.id or "",
+            created=self.created,
+            model=self.model or "auto-select",
+            choices=choices,
+            usage=self.usage
+        )
+
+
+def accumulate_chunks(chunks: Iterable[ChatCompletionChunk]) -> ChatCompletion:
+    """
+    Rebuild the final ChatCompletion from a sequence of chunks.
+    
+    Example:
+        stream = client.chat.completions.create(messages=messages, stream=True)
+        completion = dandolo.accumulate_chunks(stream)
+    
+    Args:
+        chunks: Chunks yielded by a stream
+    
+    Returns:
+        ChatCompletion with the concatenated message content
+    """
+    accumulator = ChunkAccumulator()
+    for chunk in chunks:
+        accumulator.add(chunk)
+    return accumulator.completion()
+
+
+class Stream:
+    """
+    Iterator over chat completion chunks from a streaming response.
+    
+    Chunks are parsed as each event arrives, so the first tokens are
+    available as soon as the server sends them. The underlying connection
+    is released when the stream is exhausted or closed.
+    
+    Example:
+        with client.chat.completions.create(messages=messages, stream=True) as stream:
+            for chunk in stream:
+                print(chunk.choices[0].delta.content or "", end="", flush=True)
+            completion = stream.get_final_completion()
+    """
+    
+    def __init__(
+        self,
+        response,
+        loads: Callable[[Any], Any] = json.loads,
+        hooks: Optional[RequestHooks] = None,
+        event: Optional[RequestEvent] = None
+    ):
+        self.response = response
+        self.loads = loads
+        self._hooks = hooks
+        self._event = event
+        self._ended = False
+        self._accumulator = ChunkAccumulator()
+        self._iterator = self._iter_chunks()
+    
+    def _parse(self, payload: Any) -> ChatCompletionChunk:
+        if self._event is None:
+            return parse_chunk(self.loads(payload))
+        started = time.perf_counter()
+        chunk = parse_chunk(self.loads(payload))
+        self._event.timing.decode += time.perf_counter() - started
+        return chunk
+    
+    def _iter_chunks(self) -> Iterator[ChatCompletionChunk]:
+        try:
+            content_type = self.response.headers.get("Content-Type", "")
+            if "text/event-stream" not in content_type:
+                # Server answered with a regular completion body
+                yield chunk_from_completion(self.loads(self.response.content))
+                return
+            
+            # chunk_size=None yields each transfer chunk as soon as it arrives
+            chunks = self.response.iter_content(chunk_size=None)
+            for payload in iter_sse_data(iter_lines(chunks)):
+                yield self._parse(payload)
+        except Exception as exc:
+            self._fail(exc)
+            raise
+        finally:
+            self.close()
+    
+    def _fail(self, exc: Exception) -> None:
+        """Report a stream that broke off; on_stream_end follows from close()."""
+        if self._event is not None and not self._ended:
+            self._event.error = exc
+            self._event.finish_stream()
+            self._hooks.emit("on_error", self._event)
+    
+    def __iter__(self) -> Iterator[ChatCompletionChunk]:
+        return self
+    
+    def __next__(self) -> ChatCompletionChunk:
+        if self._event is None:
+            chunk = next(self._iterator)
+            self._accumulator.add(chunk)
+            return chunk
+        
+        event = self._event
+        started, decoded = time.perf_counter(), event.timing.decode
+        chunk = next(self._iterator)
+        event.timing.body_read += time.perf_counter() - started - (event.timing.decode - decoded)
+        self._accumulator.add(chunk)
+        event.chunks += 1
+        self._hooks.emit("on_stream_chunk", event, chunk)
+        return chunk
+    
+    def get_final_completion(self) -> ChatCompletion:
+        """
+        Consume any remaining chunks and return the assembled completion.
+        
+        Returns:
+            ChatCompletion rebuilt from all deltas
+        """
+        for _ in self:
+            pass
+        return self._accumulator.completion()
+    
+    def close(self) -> None:
+        """Release the underlying connection."""
+        self.response.close()
+        if self._event is not None and not self._ended:
+            self._ended = True
+            self._event.finish_stream()
+            self._hooks.emit("on_stream_end", self._event)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class AsyncStream:
+    """
+    Async iterator over chat completion chunks from a streaming response.
+    
+    Asynchronous counterpart of Stream, used by AsyncDandolo.
+    
+    Example:
+        stream = await client.chat.completions.create(messages=messages, stream=True)
+        async with stream:
+            async for chunk in stream:
+                print(chunk.choices[0].delta.content or "", end="", flush=True)
+    """
+    
+    def __init__(
+        self,
+        response,
+        loads: Callable[[Any], Any] = json.loads,
+        hooks: Optional[RequestHooks] = None,
+        event: Optional[RequestEvent] = None
+    ):
+        self.response = response
+        self.loads = loads
+        self._hooks = hooks
+        self._event = event
+        self._ended = False
+        self._accumulator = ChunkAccumulator()
+        self._iterator = self._iter_chunks()
+    
+    _parse = Stream._parse
+    _fail = Stream._fail
+    
+    async def _iter_chunks(self) -> AsyncIterator[ChatCompletionChunk]:
+        try:
+            content_type = self.response.headers.get("Content-Type", "")
+            if "text/event-stream" not in content_type:
+                # Server answered with a regular completion body
+                yield chunk_from_completion(self.loads(await self.response.read()))
+                return
+            
+            lines = LineDecoder()
+            events = SSEDecoder()
+            async for data in self.response.content.iter_any():
+                for line in lines.feed(data):
+                    payload = events.decode(line)
+                    if payload is None:
+                        continue
+                    if payload == DONE_SENTINEL:
+                        return
+                    yield self._parse(payload)
+            
+            for line in lines.flush():
+                events.decode(line)
+            payload = events.flush()
+            if payload is not None and payload != DONE_SENTINEL:
+                yield self._parse(payload)
+        except Exception as exc:
+            self._fail(exc)
+            raise
+        finally:
+            self.close()
+    
+    def __aiter__(self) -> AsyncIterator[ChatCompletionChunk]:
+        return self
+    
+    async def __anext__(self) -> ChatCompletionChunk:
+        if self._event is None:
+            chunk = await self._iterator.__anext__()
+            self._accumulator.add(chunk)
+            return chunk
+        
+        event = self._event
+        started, decoded = time.perf_counter(), event.timing.decode
+        chunk = await self._iterator.__anext__()
+        event.timing.body_read += time.perf_counter() - started - (event.timing.decode - decoded)
+        self._accumulator.add(chunk)
+        event.chunks += 1
+        self._hooks.emit("on_stream_chunk", event, chunk)
+        return chunk
+    
+    async def get_final_completion(self) -> ChatCompletion:
+        """
+        Consume any remaining chunks and return the assembled completion.
+        
+        Returns:
+            ChatCompletion rebuilt from all deltas
+        """
+        async for _ in self:
+            pass
+        return self._accumulator.completion()
+    
+    def close(self) -> None:
+        """Release the underlying connection."""
+        self.response.release()
+        if self._event is not None and not self._ended:
+            self._ended = True
+            self._event.finish_stream()
+            self._hooks.emit("on_stream_end", self._event)
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
\ No newline at end of file
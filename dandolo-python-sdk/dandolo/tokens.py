@@ -0,0 +1,315 @@
+"""
+Dandolo SDK Token Estimation
+
+Local token counts for request checks and quota planning: exact when a
+tokenizer is supplied (tiktoken or any encode function), otherwise a
+dependency-free heuristic that can be calibrated against the usage the
+server reports.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from ._optional import optional_import
+from .types import Model
+
+
+# Average characters per token for English text with common BPE tokenizers
+CHARS_PER_TOKEN = 4.0
+
+# Tokens per non-ASCII character (CJK text is roughly one token each)
+TOKENS_PER_NON_ASCII_CHAR = 1.0
+
+# Formatting overhead per chat message (role markers, separators)
+TOKENS_PER_MESSAGE = 4
+
+# Tokens that prime the assistant reply
+REPLY_PRIMING_TOKENS = 3
+
+
+class TokenEstimator:
+    """
+    Counts prompt tokens locally.
+    
+    With a tokenizer the counts are exact for that tokenizer's vocabulary.
+    Without one, text is estimated from its length: ASCII characters at
+    chars_per_token, other characters (detected from the UTF-8 length) at
+    about one token each. calibrate() scales the heuristic towards the
+    prompt_tokens the server reports for the models actually in use.
+    
+    The batch methods count many prompts in one call: texts from every
+    message are gathered into a single list and counted together (with
+    tiktoken, on several threads), which is what makes pre-flighting
+    100k prompts per job practical.
+    
+    Example:
+        estimator = TokenEstimator()
+        model = client.catalog.get("llama-3.3-70b")
+        budgets = estimator.max_completion_tokens_batch(prompts, model)
+        too_long = [i for i, budget in enumerate(budgets) if budget is not None and budget <= 0]
+    """
+    
+    def __init__(
+        self,
+        tokenizer: Optional[Any] = None,
+        chars_per_token: float = CHARS_PER_TOKEN,
+        num_threads: int = 8
+    ):
+        """
+        Initialize the estimator.
+        
+        Args:
+            tokenizer: tiktoken Encoding, or any callable returning the
+                token ids of a string (e.g. a Hugging Face tokenizer's
+                encode); None uses the heuristic
+            chars_per_token: Heuristic characters per token for ASCII text
+            num_threads: Threads used by tiktoken batch encoding
+        """
+        self.tokenizer = tokenizer
+        self.chars_per_token = chars_per_token
+        self.num_threads = num_threads
+        self.scale = 1.0
+    
+    @classmethod
+    def from_tiktoken(cls, encoding: str = "cl100k_base", **kwargs) -> "TokenEstimator":
+        """
+        Create an exact estimator from a tiktoken encoding.
+        
+        Args:
+            encoding: tiktoken encoding name
+            **kwargs: Other TokenEstimator parameters
+        
+        Returns:
+            TokenEstimator using that encoding
+        
+        Raises:
+            ImportError: tiktoken is not installed
+        """
+        tiktoken = optional_import("tiktoken")
+        if tiktoken is None:
+            raise ImportError("Exact token counts require tiktoken. Install it with: pip install dandolo-ai[tokens]")
+        return cls(tokenizer=tiktoken.get_encoding(encoding), **kwargs)
+    
+    @property
+    def exact(self) -> bool:
+        """Whether counts come from a tokenizer rather than the heuristic."""
+        return self.tokenizer is not None
+    
+    def count(self, text: str) -> int:
+        """
+        Count the tokens of a piece of text.
+        
+        Args:
+            text: Text to count
+        
+        Returns:
+            Number of tokens (estimated unless exact)
+        """
+        if not text:
+            return 0
+        if self.tokenizer is not None:
+            encode = getattr(self.tokenizer, "encode_ordinary", self.tokenizer)
+            return len(encode(text))
+        return self._heuristic(text)
+    
+    def count_batch(self, texts: Sequence[str]) -> List[int]:
+        """
+        Count the tokens of many texts at once.
+        
+        Args:
+            texts: Texts to count
+        
+        Returns:
+            Token counts, in order
+        """
+        tokenizer = self.tokenizer
+        if tokenizer is None:
+            heuristic = self._heuristic
+            return [heuristic(text) if text else 0 for text in texts]
+        if hasattr(tokenizer, "encode_ordinary_batch"):
+            return [len(ids) for ids in tokenizer.encode_ordinary_batch(list(texts), num_threads=self.num_threads)]
+        return [len(tokenizer(text)) if text else 0 for text in texts]
+    
+    def _heuristic(self, text: str) -> int:
+        length = len(text)
+        if text.isascii():
+            tokens = length / self.chars_per_token
+        else:
+            # Non-ASCII characters take 2-4 UTF-8 bytes; count them from the excess
+            non_ascii = min(length, (len(text.encode("utf-8")) - length) / 2)
+            tokens = (length - non_ascii) / self.chars_per_token + non_ascii * TOKENS_PER_NON_ASCII_CHAR
+        return max(1, int(tokens * self.scale + 0.5))
+    
+    def count_message(self, message: Dict[str, Any]) -> int:
+        """
+        Count the tokens one chat message adds to a prompt.
+        
+        Args:
+            message: Message object with 'role' and 'content'
+        
+        Returns:
+            Number of tokens, including formatting overhead
+        """
+        total = TOKENS_PER_MESSAGE
+        content = message.get("content")
+        if isinstance(content, str):
+            total += self.count(content)
+        if message.get("name"):
+            total += self.count(message["name"])
+        return total
+    
+    def count_messages(self, messages: Iterable[Dict[str, Any]]) -> int:
+        """
+        Count the prompt tokens of a list of chat messages.
+        
+        Args:
+            messages: List of message objects with 'role' and 'content'
+        
+        Returns:
+            Number of prompt tokens
+        """
+        return self.count_messages_batch([messages])[0]
+    
+    def count_messages_batch(self, prompts: Iterable[Iterable[Dict[str, Any]]]) -> List[int]:
+        """
+        Count the prompt tokens of many message lists at once.
+        
+        Args:
+            prompts: Message lists, e.g. the messages of every request in a job
+        
+        Returns:
+            Prompt token counts, in order
+        """
+        texts: List[str] = []
+        owners: List[int] = []
+        totals: List[int] = []
+        for position, messages in enumerate(prompts):
+            overhead = REPLY_PRIMING_TOKENS
+            for message in messages:
+                overhead += TOKENS_PER_MESSAGE
+                content = message.get("content")
+                if isinstance(content, str) and content:
+                    texts.append(content)
+                    owners.append(position)
+                name = message.get("name")
+                if name:
+                    texts.append(name)
+                    owners.append(position)
+            totals.append(overhead)
+        
+        for owner, count in zip(owners, self.count_batch(texts)):
+            totals[owner] += count
+        return totals
+    
+    def calibrate(self, messages: Iterable[Dict[str, Any]], prompt_tokens: int, weight: float = 0.2) -> None:
+        """
+        Adjust the heuristic towards a prompt size reported by the server.
+        
+        Has no effect on exact estimators.
+        
+        Args:
+            messages: Messages of a completed request
+            prompt_tokens: usage.prompt_tokens of its response
+            weight: How far to move towards the observed ratio (0-1)
+        """
+        if self.tokenizer is not None:
+            return
+        messages = list(messages)
+        overhead = REPLY_PRIMING_TOKENS + TOKENS_PER_MESSAGE * len(messages)
+        estimated = self.count_messages(messages) - overhead
+        observed = prompt_tokens - overhead
+        if estimated <= 0 or observed <= 0:
+            return
+        self.scale += (self.scale * observed / estimated - self.scale) * weight
+    
+    def max_completion_tokens(self, messages: Iterable[Dict[str, Any]], model: Model) -> Optional[int]:
+        """
+        Tokens left for the reply in a model's context window.
+        
+        Args:
+            messages: Prompt messages
+            model: Model from client.models.list() or client.catalog
+        
+        Returns:
+            context_length minus the prompt (negative if the prompt alone
+            does not fit), or None if the context length is unknown
+        """
+        return self.max_completion_tokens_batch([messages], model)[0]
+    
+    def max_completion_tokens_batch(
+        self,
+        prompts: Iterable[Iterable[Dict[str, Any]]],
+        model: Model
+    ) -> List[Optional[int]]:
+        """
+        Tokens left for the reply for many prompts at once.
+        
+        Args:
+            prompts: Message lists
+            model: Model from client.models.list() or client.catalog
+        
+        Returns:
+            Remaining context per prompt, or None entries if the model's
+            context length is unknown
+        """
+        counts = self.count_messages_batch(prompts)
+        if not model.context_length:
+            return [None] * len(counts)
+        return [model.context_length - count for count in counts]
+    
+    def fits(self, messages: Iterable[Dict[str, Any]], model: Model, max_tokens: Optional[int] = None) -> bool:
+        """
+        Whether a prompt plus max_tokens fits the model's context length.
+        
+        Args:
+            messages: Prompt messages
+            model: Target model
+            max_tokens: Requested completion length
+        
+        Returns:
+            True if it fits or the context length is unknown
+        """
+        remaining = self.max_completion_tokens(messages, model)
+        return remaining is None or remaining >= (max_tokens or 0)
+
+
+# Heuristic estimator behind the module-level helpers
+_default_estimator = TokenEstimator()
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of a piece of text.
+    
+    Args:
+        text: Text to estimate
+        
+    Returns:
+        Approximate number of tokens
+    """
+    return _default_estimator.count(text)
+
+
+def estimate_single_message_tokens(message: Dict[str, Any]) -> int:
+    """
+    Estimate the tokens one chat message adds to a prompt.
+    
+    Args:
+        message: Message object with 'role' and 'content'
+    
+    Returns:
+        Approximate number of tokens, including formatting overhead
+    """
+    return _default_estimator.count_message(message)
+
+
+def estimate_message_tokens(messages: List[Dict[str, str]]) -> int:
+    """
+    Estimate the prompt token count of a list of chat messages.
+    
+    Args:
+        messages: List of message objects with 'role' and 'content'
+        
+    Returns:
+        Approximate number of prompt tokens
+    """
+    return _default_estimator.count_messages(messages)
\ No newline at end of file
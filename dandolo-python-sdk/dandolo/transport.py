@@ -0,0 +1,340 @@
+"""
+Dandolo SDK Transports
+
+Pluggable HTTP layer for the Dandolo client: the default requests
+transport, an HTTP/2 transport that multiplexes concurrent requests over
+few connections, and an in-memory mock transport for tests.
+
+A transport's request() returns a response with the requests-style
+interface the client relies on: status_code, headers (case-insensitive),
+content, json(), iter_content() and close(). Timeouts and connection
+failures are raised as NetworkError.
+"""
+
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .exceptions import NetworkError
+from .hooks import record_phase
+from ._optional import optional_import
+from .pool import ConnectionPool
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class Transport:
+    """
+    Base class for HTTP transports.
+    
+    Subclasses implement request() and, if they hold connections, close().
+    """
+    
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        content: Optional[bytes] = None,
+        timeout: Optional[float] = None,
+        stream: bool = False
+    ) -> Any:
+        """
+        Send one HTTP request.
+        
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            headers: Request headers
+            content: Encoded request body
+            timeout: Timeout in seconds
+            stream: Return before the body is read
+        
+        Returns:
+            Response object (see module docstring)
+        
+        Raises:
+            NetworkError: Timeout or connection failure
+        """
+        raise NotImplementedError
+    
+    def close(self) -> None:
+        """Release pooled connections."""
+
+
+class RequestsTransport(Transport):
+    """HTTP/1.1 transport on requests, using a ConnectionPool."""
+    
+    def __init__(self, pool: Optional[ConnectionPool] = None):
+        """
+        Initialize the transport.
+        
+        Args:
+            pool: Connection pool to send requests through (a default
+                ConnectionPool if omitted)
+        """
+        self.pool = pool or ConnectionPool()
+    
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        content: Optional[bytes] = None,
+        timeout: Optional[float] = None,
+        stream: bool = False
+    ) -> requests.Response:
+        try:
+            response = self.pool.session().request(
+                method,
+                url,
+                headers=headers,
+                data=content,
+                timeout=timeout,
+                stream=True
+            )
+            if not stream:
+                # Read the body here rather than in requests so hooks can time it
+                reading = time.perf_counter()
+                response.content
+                record_phase("body_read", time.perf_counter() - reading)
+            return response
+        except requests.exceptions.Timeout:
+            raise NetworkError("Request timeout")
+        except requests.exceptions.ConnectionError:
+            raise NetworkError("Connection error")
+    
+    def close(self) -> None:
+        self.pool.close()
+
+
+class HTTPXResponse:
+    """Adapts an httpx.Response to the requests-style response interface."""
+    
+    def __init__(self, response: "httpx.Response"):
+        self.raw = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.http_version = response.http_version
+    
+    @property
+    def content(self) -> bytes:
+        return self.raw.read()
+    
+    def json(self) -> Any:
+        return json.loads(self.content)
+    
+    def iter_content(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        return self.raw.iter_bytes(chunk_size)
+    
+    def close(self) -> None:
+        self.raw.close()
+
+
+class HTTPXTransport(Transport):
+    """
+    HTTP/2 transport on httpx.
+    
+    Concurrent requests from any number of threads share a handful of
+    connections, each carrying many streams, instead of holding one socket
+    per in-flight completion.
+    
+    Requires the optional "http2" extra: pip install dandolo-ai[http2]
+    
+    Example:
+        client = Dandolo(
+            api_key="ak_your_agent_key",
+            max_workers=200,
+            transport=HTTPXTransport(max_connections=4)
+        )
+    """
+    
+    def __init__(
+        self,
+        http2: bool = True,
+        max_connections: int = 10,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: float = 30.0
+    ):
+        """
+        Initialize the transport.
+        
+        Args:
+            http2: Negotiate HTTP/2 (falls back to HTTP/1.1 if the server
+                does not offer it)
+            max_connections: Maximum open connections across all hosts
+            max_keepalive_connections: Idle connections kept open
+                (defaults to max_connections)
+            keepalive_expiry: Seconds an idle connection is kept
+        """
+        httpx = optional_import("httpx")
+        if httpx is None:
+            raise ImportError(
+                "HTTPXTransport requires httpx. Install it with: pip install dandolo-ai[http2]"
+            )
+        
+        self._httpx = httpx
+        self.client = httpx.Client(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry
+            )
+        )
+    
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        content: Optional[bytes] = None,
+        timeout: Optional[float] = None,
+        stream: bool = False
+    ) -> HTTPXResponse:
+        try:
+            request = self.client.build_request(method, url, headers=headers, content=content, timeout=timeout)
+            return HTTPXResponse(self.client.send(request, stream=stream))
+        except self._httpx.TimeoutException:
+            raise NetworkError("Request timeout")
+        except self._httpx.TransportError:
+            raise NetworkError("Connection error")
+    
+    def close(self) -> None:
+        self.client.close()
+
+
+@dataclass
+class MockRequest:
+    """A request captured by MockTransport."""
+    method: str
+    url: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    content: Optional[bytes] = None
+    
+    def json(self) -> Any:
+        """Decode the request body."""
+        return json.loads(self.content) if self.content else None
+
+
+class MockResponse:
+    """Canned response returned by a MockTransport handler."""
+    
+    def __init__(
+        self,
+        status_code: int = 200,
+        json_data: Any = None,
+        content: bytes = b"",
+        headers: Optional[Dict[str, str]] = None,
+        chunks: Optional[Iterable[bytes]] = None
+    ):
+        """
+        Build a response.
+        
+        Args:
+            status_code: HTTP status
+            json_data: Body to serialize as JSON (sets Content-Type)
+            content: Raw body, used when json_data is None
+            headers: Response headers
+            chunks: Body delivered piece by piece to streaming readers
+                (sets Content-Type to text/event-stream)
+        """
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        self._chunks = list(chunks) if chunks is not None else None
+        if json_data is not None:
+            content = json.dumps(json_data).encode("utf-8")
+            self.headers.setdefault("Content-Type", "application/json")
+        elif self._chunks is not None:
+            content = b"".join(self._chunks)
+            self.headers.setdefault("Content-Type", "text/event-stream")
+        self.content = content
+        self.closed = False
+    
+    @classmethod
+    def event_stream(cls, events: Iterable[Any], **kwargs) -> "MockResponse":
+        """
+        Build a server-sent events response ending with [DONE].
+        
+        Args:
+            events: JSON-serializable chunk payloads
+            **kwargs: Other MockResponse parameters
+        
+        Returns:
+            MockResponse with one chunk per event
+        """
+        chunks = [f"data: {json.dumps(event)}\n\n".encode("utf-8") for event in events]
+        chunks.append(b"data: [DONE]\n\n")
+        return cls(chunks=chunks, **kwargs)
+    
+    def json(self) -> Any:
+        return json.loads(self.content)
+    
+    def iter_content(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        if self._chunks is not None:
+            return iter(self._chunks)
+        return iter([self.content])
+    
+    def close(self) -> None:
+        self.closed = True
+
+
+class MockTransport(Transport):
+    """
+    In-memory transport for tests.
+    
+    Every request is recorded and passed to a handler that returns a
+    MockResponse, or a dict to answer 200 with that JSON body. A handler
+    may raise NetworkError to simulate connection failures.
+    
+    Example:
+        def handler(request):
+            return {"id": "test", "choices": [...], "model": request.json()["model"]}
+        
+        transport = MockTransport(handler)
+        client = Dandolo(api_key="dk_test", transport=transport)
+        client.chat.completions.create(messages=[...])
+        assert transport.requests[0].url.endswith("/v1/chat/completions")
+    """
+    
+    def __init__(
+        self,
+        handler: Callable[[MockRequest], Union[MockResponse, Dict[str, Any]]],
+        latency: float = 0.0
+    ):
+        """
+        Initialize the transport.
+        
+        Args:
+            handler: Called with each MockRequest to produce the response
+            latency: Seconds to sleep before answering each request
+        """
+        self.handler = handler
+        self.latency = latency
+        self.requests: List[MockRequest] = []
+        self._lock = threading.Lock()
+    
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        content: Optional[bytes] = None,
+        timeout: Optional[float] = None,
+        stream: bool = False
+    ) -> MockResponse:
+        request = MockRequest(method, url, dict(headers or {}), content)
+        with self._lock:
+            self.requests.append(request)
+        if self.latency:
+            time.sleep(self.latency)
+        response = self.handler(request)
+        if not isinstance(response, MockResponse):
+            response = MockResponse(json_data=response)
+        return response
\ No newline at end of file
@@ -2,45 +2,230 @@
 Dandolo SDK Types
 
 Type definitions for API responses and data structures.
+
+Completion objects are read-only views over the decoded JSON payload:
+nothing is copied when a response is wrapped, and nested objects
+(Choice, ChatMessage, Usage) are only built when first accessed.
 """
 
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Tuple, Union
 from dataclasses import dataclass
 import time
 
 
-@dataclass
-class Usage:
+class _Field:
+    """Descriptor reading one key of the wrapped payload."""
+    
+    __slots__ = ("name", "default")
+    
+    def __init__(self, name: str, default: Any = None):
+        self.name = name
+        self.default = default
+    
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return obj._data.get(self.name, self.default)
+
+
+class _Payload:
+    """
+    Base class for objects backed by a decoded JSON dict.
+    
+    Item access (response["id"]) reads the payload directly, so code
+    written against plain response dicts keeps working.
+    """
+    
+    __slots__ = ("_data",)
+    _fields: Tuple[str, ...] = ()
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """
+        Wrap a decoded payload without copying it.
+        
+        Args:
+            data: Decoded JSON object
+        
+        Returns:
+            Instance viewing data
+        """
+        obj = cls.__new__(cls)
+        obj._data = data
+        obj._reset()
+        return obj
+    
+    def _reset(self) -> None:
+        """Clear cached nested objects."""
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the underlying payload (shared, treat as read-only)."""
+        return self._data
+    
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._data
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+    
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._fields)
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{self.__class__.__name__}({fields})"
+    
+    def __getstate__(self):
+        return self._data
+    
+    def __setstate__(self, state) -> None:
+        self._data = state
+        self._reset()
+
+
+class Usage(_Payload):
     """Token usage information."""
-    prompt_tokens: int
-    completion_tokens: int
-    total_tokens: int
+    
+    __slots__ = ()
+    _fields = ("prompt_tokens", "completion_tokens", "total_tokens")
+    
+    prompt_tokens = _Field("prompt_tokens", 0)
+    completion_tokens = _Field("completion_tokens", 0)
+    total_tokens = _Field("total_tokens", 0)
+    
+    def __init__(self, prompt_tokens: int, completion_tokens: int, total_tokens: int):
+        self._data = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": total_tokens
+        }
 
 
-@dataclass
-class ChatMessage:
+class ChatMessage(_Payload):
     """Chat message object."""
-    role: str  # "system", "user", "assistant"
-    content: str
-    name: Optional[str] = None
+    
+    __slots__ = ()
+    _fields = ("role", "content", "name")
+    
+    role = _Field("role", "assistant")  # "system", "user", "assistant"
+    content = _Field("content", "")
+    name = _Field("name")
+    
+    def __init__(self, role: str, content: str, name: Optional[str] = None):
+        self._data = {"role": role, "content": content}
+        if name is not None:
+            self._data["name"] = name
 
 
-@dataclass
-class Choice:
+class Choice(_Payload):
     """Choice object in chat completion response."""
+    
+    __slots__ = ("_message",)
+    _fields = ("index", "message", "finish_reason")
+    
+    index = _Field("index", 0)
+    finish_reason = _Field("finish_reason")
+    
+    def __init__(self, index: int, message: ChatMessage, finish_reason: Optional[str] = None):
+        self._data = {
+            "index": index,
+            "message": message.to_dict(),
+            "finish_reason": finish_reason
+        }
+        self._message = message
+    
+    def _reset(self) -> None:
+        self._message = None
+    
+    @property
+    def message(self) -> ChatMessage:
+        if self._message is None:
+            self._message = ChatMessage.from_dict(self._data.get("message") or {})
+        return self._message
+
+
+class ChatCompletion(_Payload):
+    """Chat completion response object."""
+    
+    __slots__ = ("_choices", "_usage")
+    _fields = ("id", "object", "created", "model", "choices", "usage")
+    
+    id = _Field("id", "")
+    object = _Field("object", "chat.completion")
+    created = _Field("created")
+    model = _Field("model", "auto-select")
+    
+    def __init__(
+        self,
+        id: str,
+        object: str = "chat.completion",
+        created: Optional[int] = None,
+        model: str = "auto-select",
+        choices: Optional[List[Choice]] = None,
+        usage: Optional[Usage] = None
+    ):
+        choices = list(choices or [])
+        self._data = {
+            "id": id,
+            "object": object,
+            "created": int(time.time()) if created is None else created,
+            "model": model,
+            "choices": [choice.to_dict() for choice in choices],
+            "usage": usage.to_dict() if usage is not None else None
+        }
+        self._choices = choices
+        self._usage = usage
+    
+    def _reset(self) -> None:
+        self._choices = None
+        self._usage = None
+    
+    @property
+    def choices(self) -> List[Choice]:
+        if self._choices is None:
+            self._choices = [Choice.from_dict(choice) for choice in self._data.get("choices") or []]
+        return self._choices
+    
+    @property
+    def usage(self) -> Optional[Usage]:
+        if self._usage is None:
+            usage = self._data.get("usage")
+            if usage is None:
+                return None
+            self._usage = Usage.from_dict(usage)
+        return self._usage
+
+
+@dataclass
+class ChoiceDelta:
+    """Incremental message content in a streamed chunk."""
+    role: Optional[str] = None
+    content: Optional[str] = None
+
+
+@dataclass
+class ChunkChoice:
+    """Choice object in a streamed chat completion chunk."""
     index: int
-    message: ChatMessage
+    delta: ChoiceDelta
     finish_reason: Optional[str] = None
 
 
 @dataclass
-class ChatCompletion:
-    """Chat completion response object."""
+class ChatCompletionChunk:
+    """Streamed chat completion chunk object."""
     id: str
-    object: str = "chat.completion"
+    object: str = "chat.completion.chunk"
     created: int = None
     model: str = "auto-select"
-    choices: List[Choice] = None
+    choices: List[ChunkChoice] = None
     usage: Optional[Usage] = None
     
     def __post_init__(self):
@@ -63,6 +248,22 @@ class Model:
     def __post_init__(self):
         if self.created is None:
             self.created = int(time.time())
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Model":
+        """
+        Build a Model from a /v1/models entry.
+        
+        Fields the SDK does not model (permission, root, parent, ...) are
+        ignored, so additions to the API do not break older clients.
+        
+        Args:
+            data: Decoded model object
+        
+        Returns:
+            Model instance
+        """
+        return cls(**{key: value for key, value in data.items() if key in cls.__dataclass_fields__})
 
 
 @dataclass
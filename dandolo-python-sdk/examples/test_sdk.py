@@ -307,38 +307,17 @@ class DandoloSDKTester:
             return
         
         try:
-            import threading
-            import queue
-            
-            results_queue = queue.Queue()
-            
-            def make_request():
-                try:
-                    response = self.client.chat.completions.create(
-                        messages=[{"role": "user", "content": "Hello"}],
-                        max_tokens=20
-                    )
-                    results_queue.put(("success", response))
-                except Exception as e:
-                    results_queue.put(("error", str(e)))
-            
-            # Start 3 concurrent requests
-            threads = []
-            for _ in range(3):
-                thread = threading.Thread(target=make_request)
-                thread.start()
-                threads.append(thread)
-            
-            # Wait for all threads
-            for thread in threads:
-                thread.join(timeout=30)
+            # Run 3 requests concurrently through the batch API
+            results = self.client.chat.completions.batch(
+                [
+                    {"messages": [{"role": "user", "content": "Hello"}], "max_tokens": 20}
+                    for _ in range(3)
+                ],
+                max_concurrency=3
+            )
             
             # Check results
-            successes = 0
-            while not results_queue.empty():
-                status, result = results_queue.get()
-                if status == "success":
-                    successes += 1
+            successes = sum(1 for item in results if item.ok)
             
             if successes >= 2:  # At least 2 out of 3 should succeed
                 self.results.add_result("Concurrent Requests", True)
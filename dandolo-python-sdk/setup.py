@@ -53,6 +53,28 @@ setup(
         "async": [
             "aiohttp>=3.8.0",
         ],
+        "arrow": [
+            "pyarrow>=10.0.0",
+        ],
+        "fast": [
+            "orjson>=3.6.0",
+        ],
+        "http2": [
+            "httpx[http2]>=0.24.0",
+        ],
+        "zstd": [
+            "zstandard>=0.18.0",
+        ],
+        "tokens": [
+            "tiktoken>=0.5.0",
+        ],
+    },
+    entry_points={
+        "console_scripts": [
+            "dandolo-cache=dandolo.disk_cache:main",
+            "dandolo-mock-server=dandolo.mock_server:main",
+            "dandolo-bench=dandolo.bench:main",
+        ],
     },
     keywords="ai, artificial intelligence, api, sdk, dandolo, decentralized, agent, llm",
     include_package_data=True,
@@ -0,0 +1,138 @@
+"""
+Tests for the async client against the aiohttp mock server.
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from aiohttp import web
+
+from dandolo import AsyncDandolo
+from dandolo.exceptions import ModelNotFoundError, ServerError, ValidationError
+from dandolo.mock_server import MockServer
+
+
+MESSAGES = [{"role": "user", "content": "Hello!"}]
+
+
+def run(scenario, config=None, **options):
+    """Run scenario(client, server) against a fresh mock server."""
+    async def main():
+        async with MockServer(config) as server:
+            async with AsyncDandolo(api_key="ak_test", base_url=server.url, **options) as client:
+                return await scenario(client, server)
+    return asyncio.run(main())
+
+
+def test_completion():
+    async def scenario(client, server):
+        return await client.chat.completions.create(messages=MESSAGES, model="llama-3.3-70b")
+    
+    response = run(scenario)
+    assert response.model == "llama-3.3-70b"
+    assert response.choices[0].message.content
+
+
+def test_stream():
+    async def scenario(client, server):
+        stream = await client.chat.completions.create(messages=MESSAGES, model="llama-3.3-70b", stream=True)
+        async with stream:
+            return [chunk async for chunk in stream]
+    
+    chunks = run(scenario)
+    assert chunks
+    assert chunks[-1].choices[0].finish_reason == "stop"
+
+
+def test_server_errors_are_retried():
+    async def scenario(client, server):
+        server.inject(503, count=2)
+        response = await client.chat.completions.create(messages=MESSAGES)
+        return response, server.stats()
+    
+    response, stats = run(scenario, retry_delay=0.01)
+    assert response.choices
+    assert stats["status_503"] == 2
+    assert stats["status_200"] == 1
+
+
+def test_exhausted_retries_raise():
+    async def scenario(client, server):
+        server.inject(500, count=5)
+        with pytest.raises(ServerError):
+            await client.chat.completions.create(messages=MESSAGES)
+    
+    run(scenario, max_retries=1, retry_delay=0.01)
+
+
+def test_models_are_served_from_the_catalog():
+    async def scenario(client, server):
+        first = await client.models.list()
+        second = await client.models.list()
+        model = await client.catalog.get("qwen-2.5-coder-32b")
+        await client.validate_key()
+        return first, second, model, server.stats()
+    
+    first, second, model, stats = run(scenario)
+    assert [m.id for m in first] == [m.id for m in second]
+    assert model.context_length == 32768
+    assert stats["requests"] == 1
+
+
+def test_validate_models_rejects_before_sending():
+    async def scenario(client, server):
+        with pytest.raises(ModelNotFoundError):
+            await client.chat.completions.create(messages=MESSAGES, model="no-such-model")
+        with pytest.raises(ValidationError):
+            await client.chat.completions.create(messages=MESSAGES, model="llama-3.3-70b", max_tokens=70000)
+        await client.chat.completions.create(messages=MESSAGES, model="auto-select")
+        return server.stats()
+    
+    stats = run(scenario, validate_models=True)
+    # One catalog fetch and the routed completion
+    assert stats["requests"] == 2
+
+
+def test_token_estimator_is_used_for_validation():
+    class Oversized:
+        def count_messages(self, messages):
+            return 10 ** 6
+    
+    async def scenario(client, server):
+        with pytest.raises(ValidationError):
+            await client.chat.completions.create(messages=MESSAGES, model="llama-3.3-70b")
+    
+    run(scenario, validate_models=True, token_estimator=Oversized())
+
+
+def test_catalog_revalidates_with_if_none_match():
+    seen = []
+    
+    async def models(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == "\"v1\"":
+            return web.Response(status=304)
+        body = {"object": "list", "data": [{"id": "llama-3.3-70b", "object": "model", "created": 1, "owned_by": "dandolo"}]}
+        return web.json_response(body, headers={"ETag": "\"v1\""})
+    
+    async def main():
+        app = web.Application()
+        app.router.add_get("/v1/models", models)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        url = "http://127.0.0.1:%d" % runner.addresses[0][1]
+        try:
+            async with AsyncDandolo(api_key="ak_test", base_url=url) as client:
+                first = await client.models.list()
+                second = await client.models.list(refresh=True)
+                return first, second
+        finally:
+            await runner.cleanup()
+    
+    first, second = asyncio.run(main())
+    assert seen == [None, "\"v1\""]
+    assert second == first
\ No newline at end of file
@@ -0,0 +1,48 @@
+"""
+Tests for client-side load balancing.
+"""
+
+import pytest
+
+from dandolo import Dandolo
+from dandolo.balancer import LoadBalancer
+from dandolo.transport import MockTransport
+
+
+URLS = ["https://a.example", "https://b.example"]
+
+
+def test_release_frees_the_slot_without_an_outcome():
+    balancer = LoadBalancer(URLS, max_failures=3)
+    url = URLS[0]
+    for _ in range(2):
+        balancer.finish(url, balancer.start(url), failed=True)
+    ewma = balancer.snapshot()[url]["ewma_latency"]
+    
+    balancer.start(url)
+    balancer.release(url)
+    
+    endpoint = balancer._by_url[url]
+    assert endpoint.inflight == 0
+    assert endpoint.ewma == ewma
+    assert endpoint.consecutive_failures == 2
+    
+    # The next failure still ejects: the cancelled attempt reset nothing
+    balancer.finish(url, balancer.start(url), failed=True)
+    assert balancer.snapshot()[url]["ejected"]
+
+
+def test_abandoned_attempt_leaves_endpoint_stats_alone():
+    def handler(request):
+        raise KeyboardInterrupt
+    
+    balancer = LoadBalancer(URLS)
+    client = Dandolo(api_key="dk_test", load_balancer=balancer, transport=MockTransport(handler))
+    with pytest.raises(KeyboardInterrupt):
+        client.chat.completions.create(messages=[{"role": "user", "content": "hi"}])
+    
+    snapshot = balancer.snapshot()
+    assert sum(state["requests"] for state in snapshot.values()) == 1
+    assert all(state["inflight"] == 0 for state in snapshot.values())
+    assert all(state["ewma_latency"] == 0.0 for state in snapshot.values())
+    client.close()
\ No newline at end of file
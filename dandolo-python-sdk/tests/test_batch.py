@@ -0,0 +1,135 @@
+"""
+Tests for columnar batch results.
+"""
+
+import json
+import threading
+import time
+
+from dandolo import Dandolo
+from dandolo._stats import percentile
+from dandolo.batch import BatchResult
+from dandolo.transport import MockTransport
+
+
+def completion(choices, usage=None, **fields):
+    return {
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": 1,
+        "model": "llama-3.3-70b",
+        "choices": choices,
+        "usage": usage,
+        **fields
+    }
+
+
+def choice(content, index=0, role="assistant", **message):
+    return {"index": index, "message": {"role": role, "content": content, **message}, "finish_reason": "stop"}
+
+
+def test_plain_rows_are_rebuilt_from_columns():
+    result = BatchResult()
+    payload = completion(
+        [dict(choice("hi"), logprobs=None)],
+        usage={"prompt_tokens": 1, "completion_tokens": 2, "total_tokens": 3},
+        system_fingerprint="fp"
+    )
+    result.append(payload)
+    assert not result._responses
+    response = result[0].response
+    assert response.choices[0].message.content == "hi"
+    assert response.usage.total_tokens == 3
+
+
+def test_rows_columns_cannot_reproduce_are_kept_whole():
+    result = BatchResult()
+    several = completion([choice("a"), choice("b", index=1)])
+    tool_call = completion([choice(None, tool_calls=[{"id": "call_1", "type": "function"}])])
+    other_role = completion([choice("hi", role="tool")])
+    zero_usage = completion([choice("hi")], usage={"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0})
+    for payload in (several, tool_call, other_role, zero_usage):
+        result.append(payload)
+    
+    assert [c.message.content for c in result[0].response.choices] == ["a", "b"]
+    assert result[1].response.choices[0].message["tool_calls"][0]["id"] == "call_1"
+    assert result[2].response.choices[0].message.role == "tool"
+    assert result[3].response.usage.total_tokens == 0
+    assert result.content[0] == "a"
+
+
+def test_nearest_rank_percentile():
+    values = [1.0, 2.0, 3.0, 4.0]
+    assert percentile(values, 50) == 2.0
+    assert percentile(values, 75) == 3.0
+    assert percentile(values, 99) == 4.0
+    assert percentile(values, 0) == 1.0
+    assert percentile([float(i) for i in range(1, 101)], 95) == 95.0
+    
+    result = BatchResult()
+    for latency in values:
+        result.append(completion([choice("hi")]), latency=latency)
+    assert result.latency_percentiles((50,)) == {50: 2.0}
+
+
+def test_batch_runs_on_client_pool_with_bounded_concurrency():
+    lock = threading.Lock()
+    state = {"inflight": 0, "peak": 0, "threads": set()}
+    
+    def handler(request):
+        with lock:
+            state["inflight"] += 1
+            state["peak"] = max(state["peak"], state["inflight"])
+            state["threads"].add(threading.current_thread().name)
+        time.sleep(0.005)
+        with lock:
+            state["inflight"] -= 1
+        content = json.loads(request.content)["messages"][0]["content"]
+        return completion([choice(content)])
+    
+    client = Dandolo(api_key="dk_test", max_workers=8, transport=MockTransport(handler))
+    requests = ({"messages": [{"role": "user", "content": str(i)}]} for i in range(40))
+    result = client.chat.completions.batch(requests, max_concurrency=3)
+    
+    assert [item.response.choices[0].message.content for item in result] == [str(i) for i in range(40)]
+    assert 1 < state["peak"] <= 3
+    assert all(name.startswith("dandolo_") for name in state["threads"])
+    client.close()
+
+
+def test_batch_inside_a_submitted_job_does_not_deadlock():
+    client = Dandolo(
+        api_key="dk_test",
+        max_workers=2,
+        transport=MockTransport(lambda request: completion([choice("ok")]))
+    )
+    requests = [{"messages": [{"role": "user", "content": str(i)}]} for i in range(10)]
+    
+    def job():
+        return client.chat.completions.batch(requests, max_concurrency=4)
+    
+    # Both workers run a batch, so none is free for the shared pool
+    futures = [client.executor.submit(job) for _ in range(2)]
+    results = [future.result(timeout=10) for future in futures]
+    assert [result.ok_count for result in results] == [10, 10]
+    client.close()
+
+
+def test_errors_are_stored_without_tracebacks():
+    def fail():
+        try:
+            raise KeyError("inner")
+        except KeyError as exc:
+            raise ValueError("boom") from exc
+    
+    result = BatchResult()
+    try:
+        fail()
+    except ValueError as exc:
+        result.append(error=exc, latency=0.1)
+    
+    error = result[0].error
+    assert isinstance(error, ValueError) and str(error) == "boom"
+    assert error.__traceback__ is None
+    assert error.__cause__.__traceback__ is None
+    assert result.error[0] == "ValueError: boom"
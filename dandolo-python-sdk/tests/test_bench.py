@@ -0,0 +1,179 @@
+"""
+Tests for the load generator's report math.
+"""
+
+import json
+
+import pytest
+
+from dandolo import Dandolo
+from dandolo._stats import percentile
+from dandolo.bench import BenchReport, LoadGenerator, RequestSample, load_prompts, main, summarize
+from dandolo.transport import MockResponse, MockTransport
+
+
+COMPLETION = {
+    "id": "chatcmpl-test",
+    "object": "chat.completion",
+    "created": 1,
+    "model": "llama-3.3-70b",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}],
+    "usage": {"prompt_tokens": 5, "completion_tokens": 7, "total_tokens": 12}
+}
+
+
+def report(samples, **overrides):
+    fields = {"mode": "open", "target": 10.0, "window": 2.0, "duration": 4.0, "stream": False, "samples": samples}
+    fields.update(overrides)
+    return BenchReport(**fields)
+
+
+def test_nearest_rank_percentile():
+    values = [float(value) for value in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile(values, 100) == 100.0
+    assert percentile(values, 0) == 1.0
+    assert percentile([3.0], 99) == 3.0
+    # Nearest rank never interpolates
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 51) == 3.0
+
+
+def test_summarize():
+    stats = summarize(float(value) for value in reversed(range(1, 101)))
+    assert stats == {"p50": 50.0, "p95": 95.0, "p99": 99.0, "mean": 50.5, "max": 100.0}
+    assert summarize([]) == {}
+
+
+def test_report_rates_and_counts():
+    samples = [
+        RequestSample(scheduled=0.0, latency=0.1, completion_tokens=10),
+        RequestSample(scheduled=0.1, latency=0.2, completion_tokens=20, retries=2),
+        RequestSample(scheduled=0.2, latency=0.3, completion_tokens=30, retries=1),
+        RequestSample(scheduled=0.3, latency=5.0, error="TimeoutError", retries=3),
+        RequestSample(scheduled=0.4, latency=0.1, error="ServerError"),
+        RequestSample(scheduled=0.5, latency=0.1, error="ServerError")
+    ]
+    result = report(samples)
+    assert result.requests == 6
+    assert result.successes == 3
+    assert result.offered_rate == 3.0  # 6 started over a 2s window
+    assert result.throughput == 0.75  # 3 completed over 4s
+    assert result.tokens_per_second == 15.0
+    assert result.errors == {"ServerError": 2, "TimeoutError": 1}
+    assert list(result.errors) == ["ServerError", "TimeoutError"]
+    assert result.retries() == {"total": 6, "requests_retried": 3, "max": 3}
+    # Failed requests are left out of the latency distribution
+    assert result.latency()["max"] == 0.3
+    assert result.latency()["mean"] == pytest.approx(0.2)
+    assert result.ttft() == {}
+
+
+def test_ttft_only_counts_streamed_samples():
+    samples = [
+        RequestSample(scheduled=0.0, latency=1.0, ttft=0.2),
+        RequestSample(scheduled=0.1, latency=1.0, ttft=0.4),
+        RequestSample(scheduled=0.2, latency=1.0, error="NetworkError")
+    ]
+    assert report(samples, stream=True).ttft() == {"p50": 0.2, "p95": 0.4, "p99": 0.4, "mean": pytest.approx(0.3), "max": 0.4}
+
+
+def test_empty_report():
+    result = report([], window=0.0, duration=0.0)
+    assert (result.offered_rate, result.throughput, result.tokens_per_second) == (0.0, 0.0, 0.0)
+    assert result.retries() == {"total": 0, "requests_retried": 0, "max": 0}
+    assert result.latency() == {}
+    assert "Latency" not in result.format()
+
+
+def test_to_dict_and_format():
+    samples = [
+        RequestSample(scheduled=0.0, latency=0.25, completion_tokens=8),
+        RequestSample(scheduled=0.5, latency=1.0, error="ServerError", retries=1)
+    ]
+    result = report(samples, mode="closed", target=4, window=1.0, duration=2.0)
+    data = json.loads(json.dumps(result.to_dict()))
+    assert data["requests"] == 2
+    assert data["throughput"] == 0.5
+    assert data["latency"]["p99"] == 0.25
+    assert data["errors"] == {"ServerError": 1}
+    
+    text = result.format()
+    assert "closed loop, 4 workers, 1s" in text
+    assert "ok: 1  failed: 1" in text
+    assert "p50 250ms" in text
+    assert "Retries:     1 over 1 requests (max 1)" in text
+    assert "  ServerError: 1" in text
+
+
+def test_load_prompts(tmp_path):
+    path = tmp_path / "prompts.jsonl"
+    path.write_text('{"messages": [{"role": "user", "content": "a"}], "max_tokens": 5}\n\nplain prompt\n', encoding="utf-8")
+    assert load_prompts(str(path)) == [
+        {"messages": [{"role": "user", "content": "a"}], "max_tokens": 5},
+        {"messages": [{"role": "user", "content": "plain prompt"}]}
+    ]
+    empty = tmp_path / "empty.txt"
+    empty.write_text("\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_prompts(str(empty))
+
+
+def test_open_loop_schedule_and_retry_counts():
+    calls = []
+    
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return MockResponse(503)
+        return COMPLETION
+    
+    client = Dandolo(api_key="dk_test", retry_delay=0.01, transport=MockTransport(handler))
+    result = LoadGenerator(client, model="llama-3.3-70b").run(duration=0.25, rps=20)
+    client.close()
+    
+    assert result.mode == "open"
+    assert [sample.scheduled for sample in result.samples] == pytest.approx([0.0, 0.05, 0.1, 0.15, 0.2])
+    assert result.offered_rate == pytest.approx(20.0)
+    assert result.successes == 5
+    assert result.retries() == {"total": 1, "requests_retried": 1, "max": 1}
+    assert result.tokens_per_second == pytest.approx(35 / result.duration)
+    assert calls[0].json()["model"] == "llama-3.3-70b"
+
+
+def test_closed_loop_keeps_workers_busy():
+    transport = MockTransport(lambda request: COMPLETION, latency=0.02)
+    client = Dandolo(api_key="dk_test", transport=transport)
+    result = LoadGenerator(client, requests=[{"messages": [{"role": "user", "content": "x"}]}]).run(duration=0.2, concurrency=2)
+    client.close()
+    
+    assert result.mode == "closed"
+    assert result.target == 2
+    # Two workers at 20ms or more per request over 200ms
+    assert 4 <= result.requests <= 22
+    assert result.duration >= 0.2
+    assert not result.errors
+
+
+def test_run_requires_one_load_model():
+    client = Dandolo(api_key="dk_test", transport=MockTransport(lambda request: COMPLETION))
+    generator = LoadGenerator(client)
+    with pytest.raises(ValueError):
+        generator.run(duration=1)
+    with pytest.raises(ValueError):
+        generator.run(duration=1, rps=1, concurrency=1)
+    client.close()
+
+
+def test_command_line_against_the_mock_server(tmp_path, capsys):
+    pytest.importorskip("aiohttp")
+    path = tmp_path / "report.json"
+    code = main([
+        "--mock", "--mock-latency", "0", "--mock-tokens-per-second", "0",
+        "--concurrency", "2", "--duration", "0.2", "--json", str(path), "--samples"
+    ])
+    assert code == 0
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["successes"] == data["requests"] == len(data["samples"]) > 0
+    assert "Throughput:" in capsys.readouterr().out
\ No newline at end of file
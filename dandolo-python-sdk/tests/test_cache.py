@@ -0,0 +1,96 @@
+"""
+Tests for the in-memory response cache.
+"""
+
+from dandolo import Dandolo
+from dandolo import cache as cache_module
+from dandolo.cache import ResponseCache, cache_key, is_cacheable
+from dandolo.transport import MockTransport
+
+
+COMPLETION = {
+    "id": "chatcmpl-test",
+    "object": "chat.completion",
+    "created": 1,
+    "model": "llama-3.3-70b",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}]
+}
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(max_size=2, ttl=None)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats().evictions == 1
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    cache = ResponseCache(ttl=10)
+    cache.set("a", 1)
+    
+    clock.now += 9.9
+    assert cache.get("a") == 1
+    clock.now += 0.1
+    assert cache.get("a") is None
+    
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.expirations, stats.size) == (1, 1, 1, 0)
+    assert stats.hit_rate == 0.5
+
+
+def test_set_restarts_the_ttl(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    cache = ResponseCache(ttl=10)
+    cache.set("a", 1)
+    clock.now += 8
+    cache.set("a", 2)
+    clock.now += 8
+    assert cache.get("a") == 2
+
+
+def test_cache_key_is_canonical():
+    first = {"model": "m", "messages": MESSAGES, "temperature": 0, "stream": False}
+    second = {"temperature": 0, "messages": MESSAGES, "model": "m"}
+    assert cache_key(first) == cache_key(second)
+    assert cache_key(first) != cache_key(dict(first, max_tokens=5))
+
+
+def test_only_deterministic_requests_are_cacheable():
+    assert is_cacheable({"temperature": 0})
+    assert is_cacheable({"temperature": 0.0, "stream": False})
+    assert not is_cacheable({})
+    assert not is_cacheable({"temperature": 0.7})
+    assert not is_cacheable({"temperature": 0, "stream": True})
+
+
+def test_client_serves_repeats_from_the_cache():
+    transport = MockTransport(lambda request: COMPLETION)
+    client = Dandolo(api_key="dk_test", transport=transport, cache=ResponseCache())
+    for _ in range(3):
+        response = client.chat.completions.create(messages=MESSAGES, temperature=0)
+    client.chat.completions.create(messages=MESSAGES)
+    
+    assert response.choices[0].message.content == "ok"
+    # Three deterministic calls share one request; the sampled one is sent
+    assert len(transport.requests) == 2
+    assert client.cache.stats().hits == 2
+    client.close()
\ No newline at end of file
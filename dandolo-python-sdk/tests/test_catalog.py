@@ -0,0 +1,126 @@
+"""
+Tests for the cached model catalog.
+"""
+
+import pytest
+
+from dandolo import Dandolo
+from dandolo.exceptions import ModelNotFoundError, ValidationError
+from dandolo.transport import MockResponse, MockTransport
+
+
+MODELS = {
+    "object": "list",
+    "data": [{
+        "id": "llama-3.3-70b",
+        "object": "model",
+        "created": 1,
+        "owned_by": "dandolo",
+        "permission": [],
+        "root": "llama-3.3-70b",
+        "parent": None
+    }]
+}
+
+
+COMPLETION = {
+    "id": "chatcmpl-test",
+    "object": "chat.completion",
+    "created": 1,
+    "model": "llama-3.3-70b",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}]
+}
+
+
+def test_models_with_unknown_fields():
+    client = Dandolo(api_key="dk_test", transport=MockTransport(lambda request: MODELS))
+    models = client.models.list(refresh=True)
+    assert [model.id for model in models] == ["llama-3.3-70b"]
+    assert client.catalog.get("llama-3.3-70b").owned_by == "dandolo"
+    client.close()
+
+
+def model_entry(model_id, **fields):
+    return {"id": model_id, "object": "model", "created": 1, "owned_by": "dandolo", **fields}
+
+
+def catalog_handler(models, etag="\"v1\""):
+    def handler(request):
+        if request.url.endswith("/v1/models"):
+            if request.headers.get("If-None-Match") == etag:
+                return MockResponse(304)
+            return MockResponse(json_data={"object": "list", "data": models}, headers={"ETag": etag})
+        return COMPLETION
+    return handler
+
+
+def model_requests(transport):
+    return [request for request in transport.requests if request.url.endswith("/v1/models")]
+
+
+def test_revalidation_sends_if_none_match():
+    transport = MockTransport(catalog_handler([model_entry("llama-3.3-70b")]))
+    client = Dandolo(api_key="dk_test", transport=transport)
+    client.catalog.models()
+    client.catalog.refresh()
+    
+    first, second = model_requests(transport)
+    assert "If-None-Match" not in first.headers
+    assert second.headers["If-None-Match"] == "\"v1\""
+    client.close()
+
+
+def test_not_modified_keeps_the_cached_list():
+    transport = MockTransport(catalog_handler([model_entry("llama-3.3-70b", context_length=8192)]))
+    client = Dandolo(api_key="dk_test", transport=transport)
+    models = client.catalog.models()
+    client.catalog._fetched_at -= client.catalog.ttl
+    assert not client.catalog.is_fresh
+    
+    client.catalog.refresh()
+    assert client.catalog.is_fresh
+    assert client.catalog.models() == models
+    assert client.catalog.get("llama-3.3-70b").context_length == 8192
+    assert len(model_requests(transport)) == 2
+    client.close()
+
+
+def test_fresh_catalog_is_served_without_a_request():
+    transport = MockTransport(catalog_handler([model_entry("llama-3.3-70b")]))
+    client = Dandolo(api_key="dk_test", transport=transport)
+    for _ in range(3):
+        client.catalog.get("llama-3.3-70b")
+    assert len(model_requests(transport)) == 1
+    client.close()
+
+
+def test_unknown_model_is_rejected_before_sending():
+    transport = MockTransport(catalog_handler([model_entry("llama-3.3-70b")]))
+    client = Dandolo(api_key="dk_test", transport=transport, validate_models=True)
+    with pytest.raises(ModelNotFoundError):
+        client.chat.completions.create(model="no-such-model", messages=[{"role": "user", "content": "hi"}])
+    
+    # Routed ids are left to the server
+    client.chat.completions.create(model="auto-select", messages=[{"role": "user", "content": "hi"}])
+    assert [request.url.rsplit("/", 1)[-1] for request in transport.requests] == ["models", "completions"]
+    client.close()
+
+
+def test_context_length_is_checked_when_known():
+    transport = MockTransport(catalog_handler([
+        model_entry("small", context_length=64),
+        model_entry("unsized")
+    ]))
+    client = Dandolo(api_key="dk_test", transport=transport, validate_models=True)
+    messages = [{"role": "user", "content": "word " * 200}]
+    
+    with pytest.raises(ValidationError):
+        client.chat.completions.create(model="small", messages=messages)
+    with pytest.raises(ValidationError):
+        client.chat.completions.create(model="small", messages=[{"role": "user", "content": "hi"}], max_tokens=100)
+    client.chat.completions.create(model="small", messages=[{"role": "user", "content": "hi"}], max_tokens=16)
+    
+    # Without a context_length the length check is skipped
+    client.chat.completions.create(model="unsized", messages=messages, max_tokens=100000)
+    assert len([request for request in transport.requests if request.url.endswith("/completions")]) == 2
+    client.close()
@@ -0,0 +1,151 @@
+"""
+Tests for circuit breaker bookkeeping in the client request loop.
+"""
+
+import time
+
+import pytest
+
+from dandolo import CircuitBreakerRegistry, Dandolo, RateLimiter
+from dandolo.circuit_breaker import CLOSED, HALF_OPEN, OPEN
+from dandolo.exceptions import CircuitOpenError, RateLimitError, ServerError
+from dandolo.transport import MockResponse, MockTransport
+
+
+COMPLETION = {
+    "id": "chatcmpl-test",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "llama-3.3-70b",
+    "choices": [{
+        "index": 0,
+        "message": {"role": "assistant", "content": "ok"},
+        "finish_reason": "stop"
+    }],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+}
+
+
+def wait_for_state(breaker, state, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while breaker.state != state:
+        assert time.monotonic() < deadline, f"{breaker.name} stayed {breaker.state}"
+        time.sleep(0.01)
+
+
+def create(client):
+    return client.chat.completions.create(
+        messages=[{"role": "user", "content": "hi"}],
+        model="llama-3.3-70b"
+    )
+
+
+def test_trial_slot_released_when_rate_limiter_raises():
+    failing = [True]
+
+    def handler(request):
+        if request.url.endswith("/v1/models"):
+            return {"data": []}
+        if failing[0]:
+            return MockResponse(status_code=503, json_data={"error": "unavailable"})
+        return COMPLETION
+
+    registry = CircuitBreakerRegistry(failure_threshold=2, recovery_timeout=0.05)
+    client = Dandolo(
+        api_key="dk_test",
+        base_url="http://h",
+        max_retries=0,
+        circuit_breakers=registry,
+        transport=MockTransport(handler)
+    )
+    for _ in range(2):
+        with pytest.raises(ServerError):
+            create(client)
+    url_breaker = registry.get("url:http://h")
+    assert url_breaker.state == OPEN
+
+    # The background probe answers 200 and moves the circuit to half-open
+    wait_for_state(url_breaker, HALF_OPEN)
+    wait_for_state(registry.get("model:llama-3.3-70b"), HALF_OPEN)
+    failing[0] = False
+
+    # The trial request is refused by an exhausted client-side limiter
+    limiter = RateLimiter(requests_per_second=0.001, burst=1, max_wait=0)
+    limiter.acquire()
+    client.rate_limiter = limiter
+    with pytest.raises(RateLimitError):
+        create(client)
+
+    client.rate_limiter = None
+    assert create(client).choices[0].message.content == "ok"
+    assert url_breaker.state == CLOSED
+    client.close()
+
+
+def test_url_slot_released_when_model_circuit_refuses():
+    failing = [True]
+
+    def handler(request):
+        if request.url.endswith("/v1/models"):
+            return {"data": []}
+        if failing[0]:
+            return MockResponse(status_code=503, json_data={"error": "unavailable"})
+        return COMPLETION
+
+    registry = CircuitBreakerRegistry(failure_threshold=1, recovery_timeout=0.05)
+    client = Dandolo(
+        api_key="dk_test",
+        base_url="http://h",
+        max_retries=0,
+        circuit_breakers=registry,
+        transport=MockTransport(handler)
+    )
+    with pytest.raises(ServerError):
+        create(client)
+    url_breaker = registry.get("url:http://h")
+    model_breaker = registry.get("model:llama-3.3-70b")
+    wait_for_state(url_breaker, HALF_OPEN)
+    wait_for_state(model_breaker, HALF_OPEN)
+    failing[0] = False
+
+    # Another caller holds the model circuit's only trial slot
+    assert model_breaker.before_request() is True
+    with pytest.raises(CircuitOpenError):
+        create(client)
+
+    model_breaker.release()
+    assert create(client).choices[0].message.content == "ok"
+    assert url_breaker.state == CLOSED
+    assert model_breaker.state == CLOSED
+    client.close()
+
+
+def test_close_stops_background_probes():
+    def handler(request):
+        return MockResponse(status_code=503, json_data={"error": "unavailable"})
+
+    registry = CircuitBreakerRegistry(failure_threshold=1, recovery_timeout=0.02)
+    transport = MockTransport(handler)
+    client = Dandolo(
+        api_key="dk_test",
+        base_url="http://h",
+        max_retries=0,
+        circuit_breakers=registry,
+        transport=transport
+    )
+    with pytest.raises(ServerError):
+        create(client)
+
+    def probes():
+        return sum(request.url.endswith("/v1/models") for request in transport.requests)
+
+    deadline = time.monotonic() + 2.0
+    while probes() < 2:
+        assert time.monotonic() < deadline, "probe was not re-armed"
+        time.sleep(0.01)
+
+    client.close()
+    time.sleep(0.05)  # a probe already running when close() was called may finish
+    sent = probes()
+    time.sleep(0.15)
+    assert probes() == sent
@@ -0,0 +1,133 @@
+"""
+Tests for request compression and the uncompressed fallback.
+"""
+
+import gzip
+
+import pytest
+
+from dandolo import Dandolo
+from dandolo import compression as compression_module
+from dandolo.compression import Compression, accept_encoding
+from dandolo.exceptions import ValidationError
+from dandolo.transport import MockResponse, MockTransport
+
+
+COMPLETION = {
+    "id": "chatcmpl-test",
+    "object": "chat.completion",
+    "created": 1,
+    "model": "llama-3.3-70b",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}]
+}
+
+LONG_MESSAGES = [{"role": "user", "content": "lorem ipsum " * 200}]
+SHORT_MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+def rejecting(status, uncompressed_status=200):
+    """Handler rejecting compressed bodies with status."""
+    def handler(request):
+        if request.headers.get("Content-Encoding"):
+            return MockResponse(status, json_data={"error": {"message": "cannot decode body"}})
+        if uncompressed_status != 200:
+            return MockResponse(uncompressed_status, json_data={"error": {"message": "invalid request"}})
+        return COMPLETION
+    return handler
+
+
+def test_threshold_and_gzip_roundtrip():
+    compression = Compression(threshold=100)
+    assert not compression.should_compress(None, "https://a")
+    assert not compression.should_compress(b"x" * 99, "https://a")
+    assert compression.should_compress(b"x" * 100, "https://a")
+    
+    body = b'{"content": "' + b"a" * 1000 + b'"}'
+    compressed = compression.compress(body)
+    assert gzip.decompress(compressed) == body
+    
+    stats = compression.stats()
+    assert (stats.compressed, stats.bytes_in, stats.bytes_out) == (1, len(body), len(compressed))
+    assert stats.ratio == len(compressed) / len(body)
+    assert Compression().stats().ratio == 1.0
+
+
+def test_unknown_or_missing_algorithms(monkeypatch):
+    with pytest.raises(ValueError):
+        Compression("brotli")
+    monkeypatch.setattr(compression_module, "optional_import", lambda name: None)
+    with pytest.raises(ImportError, match="zstandard"):
+        Compression("zstd")
+    assert accept_encoding() == "gzip, deflate"
+
+
+@pytest.mark.parametrize("status", [400, 415])
+def test_check_response_detection(status):
+    compression = Compression()
+    # Rejected compressed: resend uncompressed and stop compressing
+    assert compression.check_response("https://a", status, compressed=True, fallback=False)
+    assert compression.supports("https://a") is False
+    assert not compression.should_compress(b"x" * 4096, "https://a")
+    # The uncompressed resend was accepted, so the verdict stands
+    assert not compression.check_response("https://a", 200, compressed=False, fallback=True)
+    assert compression.supports("https://a") is False
+    
+    # Rejected uncompressed too: the request was bad, not the encoding
+    assert compression.check_response("https://b", status, compressed=True, fallback=False)
+    assert not compression.check_response("https://b", status, compressed=False, fallback=True)
+    assert compression.supports("https://b") is None
+    
+    # Accepted compressed
+    assert not compression.check_response("https://c", 200, compressed=True, fallback=False)
+    assert compression.supports("https://c") is True
+    # Later errors from a known-good endpoint are not retried uncompressed
+    assert not compression.check_response("https://c", status, compressed=True, fallback=False)
+
+
+def test_client_sends_large_bodies_compressed():
+    transport = MockTransport(lambda request: COMPLETION)
+    compression = Compression(threshold=1024)
+    client = Dandolo(api_key="dk_test", compression=compression, transport=transport)
+    client.chat.completions.create(messages=LONG_MESSAGES)
+    client.chat.completions.create(messages=SHORT_MESSAGES)
+    
+    large, small = transport.requests
+    assert large.headers["Content-Encoding"] == "gzip"
+    assert large.headers["Accept-Encoding"] == compression.accept_encoding
+    assert gzip.decompress(large.content).startswith(b"{")
+    assert "Content-Encoding" not in small.headers
+    assert compression.supports(client.base_url) is True
+    client.close()
+
+
+@pytest.mark.parametrize("status", [400, 415])
+def test_client_falls_back_to_uncompressed(status):
+    transport = MockTransport(rejecting(status))
+    compression = Compression(threshold=1024)
+    client = Dandolo(api_key="dk_test", compression=compression, transport=transport)
+    
+    response = client.chat.completions.create(messages=LONG_MESSAGES)
+    assert response.choices[0].message.content == "ok"
+    assert [request.headers.get("Content-Encoding") for request in transport.requests] == ["gzip", None]
+    assert transport.requests[1].json()["messages"] == LONG_MESSAGES
+    assert compression.supports(client.base_url) is False
+    assert compression.stats().fallbacks == 1
+    
+    # Once detected, large bodies go out uncompressed straight away
+    client.chat.completions.create(messages=LONG_MESSAGES)
+    assert len(transport.requests) == 3
+    assert "Content-Encoding" not in transport.requests[2].headers
+    client.close()
+
+
+def test_client_raises_when_the_uncompressed_body_is_rejected_too():
+    transport = MockTransport(rejecting(400, uncompressed_status=400))
+    compression = Compression(threshold=1024)
+    client = Dandolo(api_key="dk_test", compression=compression, transport=transport)
+    
+    with pytest.raises(ValidationError):
+        client.chat.completions.create(messages=LONG_MESSAGES)
+    assert len(transport.requests) == 2
+    # Support stays unknown, so the next large request is compressed again
+    assert compression.supports(client.base_url) is None
+    client.close()
\ No newline at end of file
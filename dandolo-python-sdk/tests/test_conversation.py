@@ -0,0 +1,194 @@
+"""
+Tests for conversation budgeting, trimming and incremental encoding.
+"""
+
+import json
+
+from dandolo import Dandolo
+from dandolo.conversation import SUMMARY_PREFIX, Conversation, SummarizePolicy, TrimPolicy
+from dandolo.serialization import Serializer
+from dandolo.tokens import REPLY_PRIMING_TOKENS, TOKENS_PER_MESSAGE, TokenEstimator
+from dandolo.transport import MockTransport
+from dandolo.types import ChatCompletion, Model
+
+
+# One token per word keeps the arithmetic readable
+WORDS = TokenEstimator(tokenizer=str.split)
+
+
+def words(count, word="w"):
+    return " ".join([word] * count)
+
+
+def message_tokens(count):
+    return TOKENS_PER_MESSAGE + count
+
+
+class CountingSerializer(Serializer):
+    def __init__(self):
+        self.encoded = []
+    
+    def dumps(self, obj):
+        self.encoded.append(obj)
+        return super().dumps(obj)
+
+
+def test_running_total_matches_a_full_count():
+    conversation = Conversation(estimator=WORDS)
+    assert conversation.tokens == REPLY_PRIMING_TOKENS
+    conversation.add("system", words(5))
+    conversation.add("user", words(3), name="alice")
+    assert conversation.tokens == WORDS.count_messages(conversation.messages)
+    assert conversation.token_count(0) == message_tokens(5)
+    assert conversation.remaining is None
+    
+    conversation.remove([0])
+    assert conversation.tokens == WORDS.count_messages(conversation.messages)
+
+
+def test_trim_drops_oldest_turns_first():
+    budget = REPLY_PRIMING_TOKENS + 4 * message_tokens(10)
+    conversation = Conversation(max_tokens=budget, estimator=WORDS)
+    conversation.add("system", words(10, "sys"))
+    for turn in range(3):
+        conversation.add("user", words(10, f"u{turn}"))
+    assert len(conversation) == 4
+    assert conversation.remaining == 0
+    
+    conversation.add("assistant", words(10, "a"))
+    assert [message["content"].split()[0] for message in conversation] == ["sys", "u1", "u2", "a"]
+    assert conversation.tokens <= budget
+    assert conversation.tokens == WORDS.count_messages(conversation.messages)
+
+
+def test_trim_drops_as_many_messages_as_needed():
+    budget = REPLY_PRIMING_TOKENS + message_tokens(30)
+    conversation = Conversation(max_tokens=budget, estimator=WORDS)
+    conversation.extend([{"role": "user", "content": words(5, str(turn))} for turn in range(4)])
+    conversation.add("user", words(30, "big"))
+    assert [message["content"].split()[0] for message in conversation] == ["big"]
+
+
+def test_pinned_messages_may_stay_over_budget():
+    conversation = Conversation(max_tokens=20, policy=TrimPolicy(keep_last=1), estimator=WORDS)
+    conversation.add("system", words(10))
+    conversation.add("user", words(10))
+    assert len(conversation) == 2
+    assert conversation.remaining < 0
+    
+    unpinned = Conversation(max_tokens=20, policy=TrimPolicy(keep_system=False, keep_last=1), estimator=WORDS)
+    unpinned.add("system", words(10))
+    unpinned.add("user", words(10))
+    assert [message["role"] for message in unpinned] == ["user"]
+
+
+def test_extend_enforces_the_budget_once():
+    applied = []
+    
+    class RecordingPolicy(TrimPolicy):
+        def apply(self, conversation, budget):
+            applied.append(len(conversation))
+            super().apply(conversation, budget)
+    
+    conversation = Conversation(max_tokens=30, policy=RecordingPolicy(), estimator=WORDS)
+    conversation.extend([{"role": "user", "content": words(10)} for _ in range(5)])
+    assert applied == [5]
+
+
+def test_summarize_policy_condenses_old_turns():
+    calls = []
+    
+    def summarize(messages):
+        calls.append([message["content"] for message in messages])
+        return f"{len(messages)} messages"
+    
+    budget = REPLY_PRIMING_TOKENS + 4 * message_tokens(10)
+    policy = SummarizePolicy(summarize, keep_last=2)
+    conversation = Conversation(max_tokens=budget, policy=policy, estimator=WORDS)
+    conversation.add("system", words(10, "sys"))
+    for turn in range(4):
+        conversation.add("user", words(10, f"u{turn}"))
+    
+    assert calls == [[words(10, "u0"), words(10, "u1")]]
+    assert [message["content"] for message in conversation] == [
+        words(10, "sys"),
+        SUMMARY_PREFIX + "2 messages",
+        words(10, "u2"),
+        words(10, "u3")
+    ]
+    
+    # The previous summary is folded into the next one
+    conversation.add("user", words(10, "u4"))
+    conversation.add("user", words(10, "u5"))
+    assert calls[-1][0] == SUMMARY_PREFIX + "2 messages"
+    assert sum(message["content"].startswith(SUMMARY_PREFIX) for message in conversation) == 1
+    assert conversation.tokens <= budget
+
+
+def test_for_model_reserves_reply_tokens():
+    conversation = Conversation.for_model(Model(id="m", context_length=8192), reserve_tokens=1024)
+    assert conversation.max_tokens == 7168
+    assert Conversation.for_model(Model(id="m")).max_tokens is None
+
+
+def test_encode_only_serializes_new_messages():
+    serializer = CountingSerializer()
+    conversation = Conversation([{"role": "user", "content": "one"}, {"role": "assistant", "content": "two"}])
+    assert json.loads(conversation.encode(serializer)) == conversation.messages
+    assert len(serializer.encoded) == 2
+    
+    conversation.add("user", "three")
+    assert json.loads(conversation.encode(serializer)) == conversation.messages
+    assert serializer.encoded[-1] == {"role": "user", "content": "three"}
+    assert len(serializer.encoded) == 3
+    
+    # Removing a message rebuilds the prefix from cached parts
+    conversation.remove([0])
+    assert json.loads(conversation.encode(serializer)) == conversation.messages
+    assert len(serializer.encoded) == 3
+    
+    conversation.clear()
+    assert conversation.encode(serializer) == b"[]"
+    assert conversation.tokens == REPLY_PRIMING_TOKENS
+
+
+def test_encode_request_matches_a_full_encoding():
+    serializer = Serializer()
+    conversation = Conversation([{"role": "user", "content": "héllo"}])
+    data = {"model": "m", "messages": [], "stream": False, "temperature": 0.5}
+    assert json.loads(conversation.encode_request(data, serializer)) == {**data, "messages": conversation.messages}
+    assert json.loads(conversation.encode_request({}, serializer)) == {"messages": conversation.messages}
+
+
+def test_messages_are_copied_when_added():
+    message = {"role": "user", "content": "original"}
+    conversation = Conversation([message])
+    message["content"] = "changed"
+    assert conversation[0]["content"] == "original"
+
+
+def test_client_sends_the_conversation():
+    reply = {
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": 1,
+        "model": "llama-3.3-70b",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": "hello"}, "finish_reason": "stop"}]
+    }
+    transport = MockTransport(lambda request: reply)
+    client = Dandolo(api_key="dk_test", transport=transport)
+    conversation = Conversation()
+    conversation.add("user", "hi")
+    response = client.chat.completions.create(messages=conversation, model="llama-3.3-70b", max_tokens=5)
+    conversation.add_response(response)
+    conversation.add("user", "again")
+    client.chat.completions.create(messages=conversation, model="llama-3.3-70b")
+    
+    first, second = (request.json() for request in transport.requests)
+    assert first == {"messages": [{"role": "user", "content": "hi"}], "model": "llama-3.3-70b", "stream": False, "max_tokens": 5}
+    assert second["messages"] == conversation.messages
+    assert second["messages"][1] == {"role": "assistant", "content": "hello"}
+    # Dict-form responses are accepted as well
+    conversation.add_response(ChatCompletion.from_dict(reply).to_dict())
+    assert conversation[-1]["content"] == "hello"
+    client.close()
\ No newline at end of file
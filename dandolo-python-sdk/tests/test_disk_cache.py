@@ -0,0 +1,113 @@
+"""
+Tests for the SQLite disk cache.
+"""
+
+import json
+import multiprocessing
+import os
+
+import pytest
+
+from dandolo.disk_cache import DiskCache, main
+
+
+def _write_from_child(path, key):
+    cache = DiskCache(path)
+    cache.set(key, {"model": "llama-3.3-70b", "pid": os.getpid()})
+    cache.close()
+
+
+def _read_after_fork(cache, queue):
+    # Uses the DiskCache built by the parent; the child must reopen
+    cache.set("child", {"from": "child"})
+    queue.put((cache.get("parent"), cache.get("child")))
+
+
+def test_entries_are_shared_across_processes(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = DiskCache(path)
+    ctx = multiprocessing.get_context("spawn")
+    workers = [ctx.Process(target=_write_from_child, args=(path, f"key-{i}")) for i in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(30)
+        assert worker.exitcode == 0
+    
+    assert len(cache) == 3
+    assert cache.get("key-1")["model"] == "llama-3.3-70b"
+    assert cache.get("key-1")["pid"] != os.getpid()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+def test_forked_child_opens_its_own_connection(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.db"))
+    cache.set("parent", {"from": "parent"})
+    parent_conn = cache._connection()
+    
+    ctx = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+    child = ctx.Process(target=_read_after_fork, args=(cache, queue))
+    child.start()
+    result = queue.get(timeout=30)
+    child.join(30)
+    
+    assert child.exitcode == 0
+    assert result == ({"from": "parent"}, {"from": "child"})
+    # The parent's connection is untouched and sees the child's write
+    assert cache._connection() is parent_conn
+    assert cache.get("child") == {"from": "child"}
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.db"), max_entries=3, evict_every=1)
+    for i in range(3):
+        cache.set(f"k{i}", {"i": i})
+    cache.get("k0")
+    cache.set("k3", {"i": 3})
+    
+    assert len(cache) == 3
+    assert cache.get("k1") is None
+    assert cache.get("k0") == {"i": 0}
+    assert cache.stats().evictions == 1
+
+
+def test_bounds_are_checked_every_n_writes(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.db"), max_entries=2, evict_every=4)
+    for i in range(3):
+        cache.set(f"k{i}", {"i": i})
+    assert len(cache) == 3
+    
+    cache.set("k3", {"i": 3})
+    assert len(cache) == 2
+    assert cache.stats().evictions == 2
+
+
+def test_byte_bound_evicts_oldest_entries(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.db"), max_entries=None, max_bytes=40, evict_every=1)
+    for i in range(4):
+        cache.set(f"k{i}", {"text": "x" * 10})
+    assert cache.summary()["bytes"] <= 40
+    assert cache.get("k3") is not None
+    assert cache.get("k0") is None
+
+
+def test_expired_entries_miss(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.db"), ttl=0)
+    cache.set("k", {"i": 1})
+    assert cache.get("k") is None
+    assert cache.stats().expirations == 1
+
+
+def test_warm_skips_requests_that_are_not_cacheable(tmp_path, capsys):
+    requests = tmp_path / "requests.jsonl"
+    requests.write_text("\n".join(json.dumps(item) for item in [
+        {"model": "m", "messages": [], "stream": True, "temperature": 0},
+        {"model": "m", "messages": [], "temperature": 0.7}
+    ]))
+    code = main(["--path", str(tmp_path / "cache.db"), "warm", str(requests), "--api-key", "ak_test"])
+    
+    out = capsys.readouterr()
+    assert code == 0
+    assert "Skipping 2 non-cacheable requests" in out.err
+    assert "Requests: 0" in out.out
\ No newline at end of file
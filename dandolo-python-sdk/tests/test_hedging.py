@@ -0,0 +1,124 @@
+"""
+Tests for hedged requests.
+"""
+
+import asyncio
+import threading
+import time
+
+from dandolo import Dandolo, HedgePolicy
+from dandolo.transport import MockTransport
+
+
+COMPLETION = {
+    "id": "chatcmpl-test",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "llama-3.3-70b",
+    "choices": [{
+        "index": 0,
+        "message": {"role": "assistant", "content": "ok"},
+        "finish_reason": "stop"
+    }]
+}
+
+
+def stalling_first_request(stall):
+    calls = []
+    lock = threading.Lock()
+    
+    def handler(request):
+        with lock:
+            calls.append(request)
+            first = len(calls) == 1
+        if first:
+            time.sleep(stall)
+        return COMPLETION
+    
+    return handler, calls
+
+
+def test_hedge_beats_a_stalled_primary():
+    handler, calls = stalling_first_request(1.0)
+    policy = HedgePolicy(initial_delay=0.05, budget_ratio=1.0)
+    client = Dandolo(api_key="dk_test", hedge_policy=policy, transport=MockTransport(handler))
+    
+    start = time.perf_counter()
+    response = client.chat.completions.create(messages=[{"role": "user", "content": "hi"}])
+    elapsed = time.perf_counter() - start
+    
+    assert response.choices[0].message.content == "ok"
+    assert elapsed < 0.5
+    assert len(calls) == 2
+    stats = policy.stats()
+    assert (stats.requests, stats.hedges, stats.hedge_wins) == (1, 1, 1)
+    # The winner's latency, not the stalled primary's, is recorded
+    assert len(policy.latencies) == 1
+    assert policy.latencies.percentile(50) < 0.5
+    client.close()
+
+
+def test_fast_primary_is_not_hedged():
+    policy = HedgePolicy(initial_delay=0.5, budget_ratio=1.0)
+    client = Dandolo(api_key="dk_test", hedge_policy=policy, transport=MockTransport(lambda request: COMPLETION))
+    client.chat.completions.create(messages=[{"role": "user", "content": "hi"}])
+    assert policy.stats().hedges == 0
+    assert len(policy.latencies) == 1
+    client.close()
+
+
+def test_exhausted_budget_waits_for_the_primary():
+    handler, calls = stalling_first_request(0.2)
+    policy = HedgePolicy(initial_delay=0.01, budget_ratio=0.0)
+    assert policy.call(lambda: handler(None)) is COMPLETION
+    assert len(calls) == 1
+    assert policy.stats().hedges == 0
+    policy.close()
+
+
+def test_failed_primary_falls_back_to_the_hedge():
+    attempts = []
+    
+    def fn():
+        attempts.append(None)
+        if len(attempts) == 1:
+            time.sleep(0.1)
+            raise RuntimeError("primary failed")
+        time.sleep(0.2)
+        return "hedge"
+    
+    policy = HedgePolicy(initial_delay=0.02, budget_ratio=1.0)
+    assert policy.call(fn) == "hedge"
+    assert policy.stats().hedge_wins == 1
+    policy.close()
+
+
+def test_async_hedge_wins_and_cancels_the_primary():
+    cancelled = []
+    
+    async def main():
+        attempts = []
+        
+        async def attempt():
+            attempts.append(None)
+            if len(attempts) == 1:
+                try:
+                    await asyncio.sleep(1.0)
+                except asyncio.CancelledError:
+                    cancelled.append(True)
+                    raise
+                return "primary"
+            return "hedge"
+        
+        policy = HedgePolicy(initial_delay=0.05, budget_ratio=1.0)
+        start = time.perf_counter()
+        result = await policy.call_async(attempt)
+        await asyncio.sleep(0)
+        return result, time.perf_counter() - start, policy
+    
+    result, elapsed, policy = asyncio.run(main())
+    assert result == "hedge"
+    assert elapsed < 0.5
+    assert cancelled == [True]
+    assert policy.stats().hedge_wins == 1
+    assert len(policy.latencies) == 1
@@ -0,0 +1,125 @@
+"""
+Tests for request hooks on calls that fail outside status handling.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from dandolo import Dandolo, RateLimiter, RequestHooks
+from dandolo.exceptions import RateLimitError
+from dandolo.streaming import AsyncStream
+from dandolo.transport import MockResponse, MockTransport
+
+
+def recording_hooks():
+    calls = []
+    hooks = RequestHooks(**{
+        name: (lambda event, *args, name=name: calls.append((name, event.error)))
+        for name in ("before_request", "after_response", "on_retry", "on_error")
+    })
+    return hooks, calls
+
+
+def test_on_error_when_rate_limiter_raises():
+    hooks, calls = recording_hooks()
+    limiter = RateLimiter(requests_per_second=0.001, burst=1, max_wait=0)
+    limiter.acquire()
+    client = Dandolo(
+        api_key="dk_test",
+        rate_limiter=limiter,
+        hooks=hooks,
+        transport=MockTransport(lambda request: {"data": []})
+    )
+    with pytest.raises(RateLimitError):
+        client.models.list(refresh=True)
+    assert [name for name, _ in calls] == ["on_error"]
+    assert isinstance(calls[0][1], RateLimitError)
+    client.close()
+
+
+def test_on_error_when_transport_raises():
+    def handler(request):
+        raise ValueError("bad header")
+    
+    hooks, calls = recording_hooks()
+    client = Dandolo(api_key="dk_test", hooks=hooks, transport=MockTransport(handler))
+    with pytest.raises(ValueError):
+        client.models.list(refresh=True)
+    assert [name for name, _ in calls] == ["before_request", "on_error"]
+    assert isinstance(calls[1][1], ValueError)
+    client.close()
+
+
+CHUNK = {
+    "id": "chatcmpl-test",
+    "object": "chat.completion.chunk",
+    "created": 0,
+    "model": "llama-3.3-70b",
+    "choices": [{"index": 0, "delta": {"content": "Hel"}, "finish_reason": None}]
+}
+BROKEN_CHUNKS = [
+    f"data: {json.dumps(CHUNK)}\n\n".encode("utf-8"),
+    b'data: {"id": "chatcmpl-test", "choi'
+]
+
+
+def stream_hooks():
+    hooks, calls = recording_hooks()
+    hooks.add(
+        on_stream_chunk=lambda event, chunk: calls.append(("on_stream_chunk", event.error)),
+        on_stream_end=lambda event: calls.append(("on_stream_end", event.error))
+    )
+    return hooks, calls
+
+
+def test_on_error_when_stream_breaks_off():
+    hooks, calls = stream_hooks()
+    client = Dandolo(
+        api_key="dk_test",
+        hooks=hooks,
+        transport=MockTransport(lambda request: MockResponse(chunks=BROKEN_CHUNKS))
+    )
+    stream = client.chat.completions.create(messages=[{"role": "user", "content": "hi"}], stream=True)
+    with pytest.raises(ValueError):
+        for _ in stream:
+            pass
+    
+    names = [name for name, _ in calls]
+    assert names == ["before_request", "after_response", "on_stream_chunk", "on_error", "on_stream_end"]
+    assert isinstance(calls[-2][1], ValueError)
+    client.close()
+
+
+class _FakeContent:
+    def __init__(self, chunks):
+        self.chunks = chunks
+    
+    async def iter_any(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+class _FakeResponse:
+    headers = {"Content-Type": "text/event-stream"}
+    
+    def __init__(self, chunks):
+        self.content = _FakeContent(chunks)
+    
+    def release(self):
+        pass
+
+
+def test_on_error_when_async_stream_breaks_off():
+    hooks, calls = stream_hooks()
+    event = hooks.start("POST", "/v1/chat/completions", stream=True)
+    stream = AsyncStream(_FakeResponse(BROKEN_CHUNKS), hooks=hooks, event=event)
+    
+    async def consume():
+        async for _ in stream:
+            pass
+    
+    with pytest.raises(ValueError):
+        asyncio.run(consume())
+    assert [name for name, _ in calls] == ["on_stream_chunk", "on_error", "on_stream_end"]
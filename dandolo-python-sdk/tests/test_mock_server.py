@@ -0,0 +1,153 @@
+"""
+Tests for the mock server's fault injection and configured failures.
+
+Requests go straight to the server over HTTP so statuses and headers
+can be checked exactly as a client would receive them.
+"""
+
+import random
+
+import pytest
+
+pytest.importorskip("aiohttp")
+requests = pytest.importorskip("requests")
+
+from dandolo import Dandolo
+from dandolo.exceptions import AuthenticationError
+from dandolo.mock_server import Latency, MockServer, MockServerConfig
+
+
+HEADERS = {"Authorization": "Bearer dk_test"}
+BODY = {"messages": [{"role": "user", "content": "hi"}]}
+
+
+def post(server, body=BODY, headers=HEADERS, **kwargs):
+    return requests.post(f"{server.url}/v1/chat/completions", json=body, headers=headers, timeout=10, **kwargs)
+
+
+def test_latency_distributions():
+    rng = random.Random(1)
+    assert Latency.parse("0.25").sample(rng) == 0.25
+    assert Latency.parse("fixed:0.5").sample(rng) == 0.5
+    assert all(0.1 <= Latency.parse("uniform:0.1,0.2").sample(rng) <= 0.2 for _ in range(100))
+    assert Latency.fixed(-1).sample(rng) == 0.0
+    assert Latency.exponential(0).sample(rng) == 0.0
+    
+    samples = sorted(Latency.lognormal(median=0.4, p99=3.0).sample(rng) for _ in range(4000))
+    assert samples[2000] == pytest.approx(0.4, rel=0.1)
+    assert samples[3960] == pytest.approx(3.0, rel=0.25)
+    
+    assert repr(Latency.parse("lognormal:0.4,3")) == "Latency(lognormal:0.4,3.0)"
+    with pytest.raises(ValueError):
+        Latency.parse("gamma:1,2")
+
+
+def test_injected_faults_are_served_in_order_then_cleared():
+    with MockServer() as server:
+        server.inject(503, count=2)
+        server.inject(400)
+        statuses = [post(server).status_code for _ in range(4)]
+        stats = server.stats()
+    
+    assert statuses == [503, 503, 400, 200]
+    assert stats == {"requests": 4, "status_503": 2, "status_400": 1, "status_200": 1}
+
+
+def test_fault_bodies_and_headers():
+    with MockServer(MockServerConfig(retry_after=1.5)) as server:
+        server.inject(429)
+        server.inject(429, retry_after=0.2)
+        server.inject(401)
+        server.inject(500, retry_after=2.5)
+        server.inject(418)
+        responses = [post(server) for _ in range(5)]
+    
+    limited, short, unauthorized, failed, teapot = responses
+    assert limited.headers["Retry-After"] == "2"
+    assert limited.json()["error"]["code"] == "rate_limit_exceeded"
+    # Retry-After is a whole number of seconds, at least one
+    assert short.headers["Retry-After"] == "1"
+    assert unauthorized.json()["error"]["type"] == "authentication_error"
+    assert failed.headers["Retry-After"] == "3"
+    assert failed.json()["error"]["type"] == "server_error"
+    assert teapot.status_code == 418
+    assert teapot.json()["error"]["code"] == "injected_fault"
+    assert "Retry-After" not in teapot.headers
+
+
+def test_invalid_requests_do_not_consume_faults():
+    with MockServer() as server:
+        server.inject(503)
+        assert post(server, headers={}).status_code == 401
+        assert post(server, body={"messages": []}).status_code == 400
+        bad = requests.post(f"{server.url}/v1/chat/completions", data=b"{", headers=HEADERS, timeout=10)
+        assert bad.json()["error"]["code"] == "invalid_json"
+        assert post(server).status_code == 503
+
+
+def test_configured_error_and_rate_limit_rates():
+    config = MockServerConfig(error_rate=1.0, error_statuses=(502,), seed=3)
+    with MockServer(config) as server:
+        assert {post(server).status_code for _ in range(5)} == {502}
+        config.error_rate = 0.0
+        config.rate_limit_rate = 1.0
+        assert post(server).status_code == 429
+        config.rate_limit_rate = 0.0
+        assert post(server).status_code == 200
+
+
+def test_request_rate_is_enforced_with_429s():
+    config = MockServerConfig(requests_per_second=2)
+    with MockServer(config) as server:
+        responses = [post(server) for _ in range(3)]
+    
+    assert [response.status_code for response in responses] == [200, 200, 429]
+    assert responses[2].headers["Retry-After"] == "1"
+
+
+def test_api_keys_are_checked():
+    with MockServer(MockServerConfig(api_keys={"dk_good"})) as server:
+        assert post(server, headers={"Authorization": "Bearer dk_bad"}).json()["error"]["code"] == "invalid_api_key"
+        assert post(server, headers={"Authorization": "Bearer dk_good"}).status_code == 200
+
+
+def test_successful_completions():
+    with MockServer(MockServerConfig(completion_tokens=8)) as server:
+        first = post(server, body={**BODY, "max_tokens": 3})
+        second = post(server)
+    
+    assert first.json()["usage"]["completion_tokens"] == 3
+    assert len(first.json()["choices"][0]["message"]["content"].split()) == 3
+    assert second.json()["usage"]["completion_tokens"] == 8
+    assert first.json()["model"] == "llama-3.3-70b"
+    assert int(first.headers["X-RateLimit-Remaining"]) - int(second.headers["X-RateLimit-Remaining"]) == 1
+
+
+def test_streams_can_be_cut_off():
+    config = MockServerConfig(disconnect_rate=1.0, completion_tokens=10)
+    with MockServer(config) as server:
+        received = b""
+        with pytest.raises(requests.exceptions.RequestException):
+            with post(server, body={**BODY, "stream": True}, stream=True) as response:
+                for chunk in response.iter_content(None):
+                    received += chunk
+        stats = server.stats()
+    
+    assert stats["streams"] == 1
+    assert stats["disconnects"] == 1
+    assert b"data: [DONE]" not in received
+
+
+def test_client_sees_injected_faults():
+    with MockServer() as server:
+        client = Dandolo(api_key="dk_test", base_url=server.url, retry_delay=0.01)
+        server.inject(503, count=2)
+        assert client.chat.completions.create(messages=BODY["messages"]).choices
+        server.inject(401)
+        with pytest.raises(AuthenticationError):
+            client.chat.completions.create(messages=BODY["messages"])
+        stats = server.stats()
+        client.close()
+    
+    # 503s are retried, 401 is not
+    assert stats == {"requests": 4, "status_503": 2, "status_200": 1, "status_401": 1}
\ No newline at end of file
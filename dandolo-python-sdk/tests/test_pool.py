@@ -0,0 +1,83 @@
+"""
+Tests for connection pool statistics.
+
+The pool instruments urllib3, so these tests talk HTTP to a local
+MockServer rather than going through MockTransport.
+"""
+
+import threading
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from dandolo import Dandolo
+from dandolo.mock_server import Latency, MockServer, MockServerConfig
+from dandolo.pool import ConnectionPool, PoolStats
+
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+def run_threads(client, threads, calls):
+    def work():
+        for _ in range(calls):
+            client.chat.completions.create(messages=MESSAGES)
+    
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+def test_stats_properties():
+    stats = PoolStats(requests=10, connections_created=4, peak_in_use=3, pool_maxsize=4)
+    assert stats.connections_reused == 6
+    assert stats.reuse_rate == 0.6
+    assert stats.utilization == 0.75
+    assert PoolStats().reuse_rate == 0.0
+    assert PoolStats().utilization == 0.0
+
+
+def test_sequential_requests_reuse_one_connection():
+    with MockServer() as server:
+        client = Dandolo(api_key="dk_test", base_url=server.url)
+        for _ in range(5):
+            client.chat.completions.create(messages=MESSAGES)
+        stats = client.pool.stats()
+        client.close()
+    
+    assert (stats.requests, stats.connections_created, stats.connections_discarded) == (5, 1, 0)
+    assert stats.connections_reused == 4
+    assert (stats.in_use, stats.peak_in_use, stats.hosts, stats.sessions) == (0, 1, 1, 1)
+
+
+def test_undersized_pool_discards_connections():
+    config = MockServerConfig(latency=Latency.fixed(0.05))
+    with MockServer(config) as server:
+        client = Dandolo(api_key="dk_test", base_url=server.url, connection_pool=ConnectionPool(pool_maxsize=1))
+        run_threads(client, threads=4, calls=2)
+        stats = client.pool.stats()
+        client.close()
+    
+    assert stats.requests == 8
+    assert stats.peak_in_use > 1
+    assert stats.utilization > 1.0
+    assert stats.connections_discarded > 0
+
+
+def test_blocking_pool_queues_for_a_connection():
+    config = MockServerConfig(latency=Latency.fixed(0.05))
+    with MockServer(config) as server:
+        pool = ConnectionPool(pool_maxsize=2, pool_block=True)
+        client = Dandolo(api_key="dk_test", base_url=server.url, connection_pool=pool)
+        run_threads(client, threads=4, calls=2)
+        stats = client.pool.stats()
+        client.close()
+    
+    assert stats.requests == 8
+    assert stats.connections_created == 2
+    assert stats.peak_in_use == 2
+    assert stats.connections_discarded == 0
+    assert stats.wait_time > 0
\ No newline at end of file
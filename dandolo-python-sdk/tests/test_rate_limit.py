@@ -0,0 +1,131 @@
+"""
+Tests for client-side rate limiting.
+"""
+
+import pytest
+
+from dandolo import Dandolo
+from dandolo import rate_limit
+from dandolo.exceptions import RateLimitError
+from dandolo.rate_limit import RateLimiter, parse_retry_after
+from dandolo.transport import MockResponse, MockTransport
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", clock)
+    return clock
+
+
+def test_burst_then_paced(clock):
+    limiter = RateLimiter(requests_per_second=10, burst=3)
+    waits = [limiter.reserve() for _ in range(6)]
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3:] == pytest.approx([0.1, 0.2, 0.3])
+
+
+def test_tokens_refill_over_time(clock):
+    limiter = RateLimiter(requests_per_second=10, burst=2)
+    limiter.reserve()
+    limiter.reserve()
+    clock.now += 0.1
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == pytest.approx(0.1)
+
+
+def test_wait_beyond_max_wait_raises(clock):
+    limiter = RateLimiter(requests_per_second=1, burst=1, max_wait=2.5)
+    for _ in range(3):
+        limiter.reserve()
+    with pytest.raises(RateLimitError) as info:
+        limiter.reserve()
+    assert info.value.retry_after == "3"
+
+
+def test_daily_quota_is_enforced(clock):
+    limiter = RateLimiter(requests_per_second=None, requests_per_day=2, max_wait=60)
+    limiter.reserve()
+    limiter.reserve()
+    with pytest.raises(RateLimitError):
+        limiter.reserve()
+
+
+def test_429_halves_the_rate_and_pauses(clock):
+    limiter = RateLimiter(requests_per_second=8, burst=8)
+    limiter.on_rate_limited("2")
+    assert limiter.current_rate == 4
+    # Nothing is sent during the pause, and queued calls resume spaced out
+    first = limiter.reserve()
+    second = limiter.reserve()
+    assert first >= 2.0
+    assert second - first == pytest.approx(0.25)
+    
+    limiter.on_rate_limited(None)
+    limiter.on_rate_limited(None)
+    assert limiter.current_rate == 1
+
+
+def test_rate_never_drops_below_min_rate(clock):
+    limiter = RateLimiter(requests_per_second=1, min_rate=0.4)
+    for _ in range(5):
+        limiter.on_rate_limited(None)
+    assert limiter.current_rate == 0.4
+
+
+def test_success_recovers_the_rate_gradually(clock):
+    limiter = RateLimiter(requests_per_second=10)
+    limiter.on_rate_limited(None)
+    limiter.on_success()
+    assert limiter.current_rate == pytest.approx(5.5)
+    for _ in range(20):
+        limiter.on_success()
+    assert limiter.current_rate == 10
+
+
+def test_headers_shrink_the_daily_bucket(clock):
+    limiter = RateLimiter(requests_per_second=None, max_wait=1)
+    limiter.update_from_headers({"X-RateLimit-Limit": "500", "X-RateLimit-Remaining": "1"})
+    assert limiter.reserve() == 0.0
+    with pytest.raises(RateLimitError):
+        limiter.reserve()
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("1.5") == 1.5
+    assert parse_retry_after("-3") == 0.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_client_halves_the_rate_on_429():
+    responses = [
+        MockResponse(429, json_data={"error": {"message": "slow down"}}, headers={"Retry-After": "0"}),
+        {
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 1,
+            "model": "llama-3.3-70b",
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}]
+        }
+    ]
+    limiter = RateLimiter(requests_per_second=100)
+    client = Dandolo(
+        api_key="dk_test",
+        retry_delay=0.01,
+        rate_limiter=limiter,
+        transport=MockTransport(lambda request: responses.pop(0))
+    )
+    client.chat.completions.create(messages=[{"role": "user", "content": "hi"}])
+    # Halved by the 429, then nudged back up by the success
+    assert limiter.current_rate == pytest.approx(55)
+    client.close()
\ No newline at end of file
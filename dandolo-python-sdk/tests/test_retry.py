@@ -0,0 +1,110 @@
+"""
+Tests for retry backoff, the retry budget and error classification.
+"""
+
+import random
+
+import pytest
+
+from dandolo import Dandolo
+from dandolo.exceptions import (
+    AuthenticationError,
+    DandoloError,
+    NetworkError,
+    RateLimitError,
+    ServerError,
+    ValidationError,
+    error_from_status
+)
+from dandolo.retry import RetryBudget, RetryPolicy
+from dandolo.transport import MockResponse, MockTransport
+
+
+def test_decorrelated_jitter_stays_within_bounds():
+    random.seed(7)
+    policy = RetryPolicy(base_delay=0.5, max_delay=10.0)
+    previous = 0.0
+    for _ in range(200):
+        delay = policy.backoff(previous)
+        assert 0.5 <= delay <= min(10.0, max(0.5, previous) * 3)
+        previous = delay
+
+
+def test_jitter_grows_then_caps_at_max_delay():
+    random.seed(7)
+    policy = RetryPolicy(base_delay=1.0, max_delay=4.0)
+    delays = []
+    previous = 0.0
+    for _ in range(50):
+        previous = policy.backoff(previous)
+        delays.append(previous)
+    assert max(delays) == 4.0
+    assert len(set(delays)) > 10
+
+
+def test_budget_allows_a_fraction_of_requests():
+    budget = RetryBudget(ratio=0.2, min_retries_per_second=0.0)
+    for _ in range(10):
+        budget.record_request()
+    assert [budget.try_spend() for _ in range(3)] == [True, True, False]
+
+
+def test_budget_floor_allows_retries_without_traffic():
+    budget = RetryBudget(ratio=0.0, min_retries_per_second=0.5, window=4.0)
+    assert [budget.try_spend() for _ in range(3)] == [True, True, False]
+
+
+def test_next_delay():
+    policy = RetryPolicy(max_retries=2, base_delay=0.1, max_delay=0.1, max_retry_after=5)
+    assert policy.next_delay(0, ServerError("boom")) == 0.1
+    assert policy.next_delay(0, NetworkError("reset")) == 0.1
+    assert policy.next_delay(2, ServerError("boom")) is None
+    assert policy.next_delay(0, ValidationError("bad")) is None
+    # Retry-After wins over backoff, unless it is too long to wait
+    assert policy.next_delay(0, RateLimitError("slow", retry_after="3")) == 3.0
+    assert policy.next_delay(0, RateLimitError("slow", retry_after="30")) is None
+
+
+def test_exhausted_budget_stops_retries():
+    budget = RetryBudget(ratio=0.0, min_retries_per_second=0.1, window=10.0)
+    policy = RetryPolicy(max_retries=5, base_delay=0.0, max_delay=0.0, budget=budget)
+    transport = MockTransport(lambda request: MockResponse(503))
+    client = Dandolo(api_key="dk_test", retry_policy=policy, transport=transport)
+    
+    with pytest.raises(ServerError):
+        client.chat.completions.create(messages=[{"role": "user", "content": "hi"}])
+    # The budget holds a single retry, so one retry is sent instead of five
+    assert len(transport.requests) == 2
+    
+    with pytest.raises(ServerError):
+        client.chat.completions.create(messages=[{"role": "user", "content": "hi"}])
+    assert len(transport.requests) == 3
+    client.close()
+
+
+@pytest.mark.parametrize("body", [
+    ["unexpected", "list"],
+    "Bad gateway",
+    {"error": "plain string"},
+    {"detail": "no error key"},
+    None
+])
+def test_error_from_status_accepts_any_json_body(body):
+    assert isinstance(error_from_status(502, body), ServerError)
+    assert isinstance(error_from_status(400, body), ValidationError)
+    assert isinstance(error_from_status(401, body), AuthenticationError)
+    assert type(error_from_status(418, body)) is DandoloError
+
+
+def test_error_messages_come_from_the_body():
+    assert str(error_from_status(400, {"error": {"message": "too long"}})) == "too long"
+    assert str(error_from_status(400, {"error": "too long"})) == "too long"
+    assert str(error_from_status(400, "too long")) == "too long"
+
+
+def test_client_raises_status_error_for_list_bodies():
+    transport = MockTransport(lambda request: MockResponse(400, json_data=[{"msg": "bad"}]))
+    client = Dandolo(api_key="dk_test", transport=transport)
+    with pytest.raises(ValidationError):
+        client.chat.completions.create(messages=[{"role": "user", "content": "hi"}])
+    client.close()
\ No newline at end of file
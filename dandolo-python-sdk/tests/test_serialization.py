@@ -0,0 +1,98 @@
+"""
+Tests for the JSON serializers.
+"""
+
+import json
+
+import pytest
+
+from dandolo import Dandolo
+from dandolo import serialization
+from dandolo.serialization import Serializer, get_serializer
+from dandolo.transport import MockTransport
+
+
+def backends():
+    available = ["json"]
+    for name in ("orjson", "msgspec"):
+        try:
+            get_serializer(name)
+        except ImportError:
+            continue
+        available.append(name)
+    return available
+
+
+PAYLOADS = [
+    {"model": "llama-3.3-70b", "messages": [{"role": "user", "content": "hi"}], "stream": False},
+    {"unicode": "naïve café ✓ 日本語 🚀", "escapes": "quote \" backslash \\ newline \n tab \t"},
+    {"numbers": [0, -1, 2 ** 53, 1.5, -0.25, 1e-7], "flags": [True, False, None]},
+    {"nested": {"a": [{"b": {"c": []}}], "empty": {}}},
+    [],
+    "text",
+    42
+]
+
+
+@pytest.mark.parametrize("name", backends())
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_roundtrip(name, payload):
+    serializer = get_serializer(name)
+    encoded = serializer.dumps(payload)
+    assert isinstance(encoded, bytes)
+    assert serializer.loads(encoded) == payload
+    assert serializer.loads(encoded.decode("utf-8")) == payload
+    # Every backend produces standard JSON
+    assert json.loads(encoded) == payload
+
+
+@pytest.mark.parametrize("name", backends())
+def test_big_integers_fall_back_to_the_standard_library(name):
+    serializer = get_serializer(name)
+    payload = {"seed": 2 ** 70}
+    assert serializer.loads(serializer.dumps(payload)) == payload
+
+
+@pytest.mark.parametrize("name", backends())
+def test_malformed_input_raises_value_error(name):
+    with pytest.raises(ValueError):
+        get_serializer(name).loads(b'{"truncated": ')
+
+
+def test_output_is_compact_utf8():
+    assert Serializer().dumps({"a": [1, "é"]}) == '{"a":[1,"é"]}'.encode("utf-8")
+
+
+def test_selection():
+    assert get_serializer("json").name == "json"
+    # Auto-selection prefers orjson, then msgspec, then the standard library
+    assert get_serializer().name == sorted(backends(), key=["orjson", "msgspec", "json"].index)[0]
+    with pytest.raises(ValueError):
+        get_serializer("yaml")
+
+
+def test_missing_backend_raises_import_error(monkeypatch):
+    monkeypatch.setattr(serialization, "optional_import", lambda name: None)
+    assert get_serializer().name == "json"
+    for name in ("orjson", "msgspec"):
+        with pytest.raises(ImportError):
+            get_serializer(name)
+
+
+@pytest.mark.parametrize("name", backends())
+def test_client_encodes_and_decodes_with_the_chosen_backend(name):
+    completion = {
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": 1,
+        "model": "llama-3.3-70b",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": "日本語 ✓"}, "finish_reason": "stop"}]
+    }
+    transport = MockTransport(lambda request: completion)
+    client = Dandolo(api_key="dk_test", serializer=name, transport=transport)
+    response = client.chat.completions.create(messages=[{"role": "user", "content": "naïve"}])
+    
+    assert client.serializer.name == name
+    assert transport.requests[0].json()["messages"][0]["content"] == "naïve"
+    assert response.choices[0].message.content == "日本語 ✓"
+    client.close()
\ No newline at end of file
@@ -0,0 +1,196 @@
+"""
+Tests for coalescing identical in-flight requests.
+"""
+
+import asyncio
+import gc
+import threading
+
+import pytest
+
+from dandolo import Dandolo
+from dandolo.singleflight import SingleFlight, SingleFlightStats
+from dandolo.transport import MockTransport
+
+
+COMPLETION = {
+    "id": "chatcmpl-test",
+    "object": "chat.completion",
+    "created": 1,
+    "model": "llama-3.3-70b",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}]
+}
+
+MESSAGES = [{"role": "user", "content": "plan the trip"}]
+
+
+def run_concurrently(flight, key, fn, callers):
+    """Call flight.do from several threads; return results or exceptions."""
+    outcomes = [None] * callers
+    
+    def call(index):
+        try:
+            outcomes[index] = flight.do(key, fn)
+        except Exception as exc:
+            outcomes[index] = exc
+    
+    threads = [threading.Thread(target=call, args=(index,)) for index in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    release = threading.Event()
+    executed = []
+    
+    def fn():
+        executed.append(1)
+        release.wait(5)
+        return object()
+    
+    threading.Timer(0.1, release.set).start()
+    outcomes = run_concurrently(flight, "key", fn, callers=5)
+    assert len(executed) == 1
+    assert all(outcome is outcomes[0] for outcome in outcomes)
+    assert flight.stats() == SingleFlightStats(calls=5, executed=1, coalesced=4)
+    assert flight.stats().coalesce_rate == 0.8
+    assert flight.in_flight() == 0
+
+
+def test_errors_are_shared_and_not_remembered():
+    flight = SingleFlight()
+    release = threading.Event()
+    
+    def fail():
+        release.wait(5)
+        raise ValueError("boom")
+    
+    threading.Timer(0.1, release.set).start()
+    outcomes = run_concurrently(flight, "key", fail, callers=3)
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+    # Nothing is kept once the call finishes
+    assert flight.do("key", lambda: "fresh") == "fresh"
+
+
+def test_sequential_calls_are_not_coalesced():
+    flight = SingleFlight()
+    assert [flight.do("key", lambda: n) for n in range(3)] == [0, 1, 2]
+    assert flight.stats().coalesced == 0
+    assert SingleFlightStats().coalesce_rate == 0.0
+
+
+def test_async_calls_share_one_task():
+    flight = SingleFlight()
+    executed = []
+    
+    async def fetch():
+        executed.append(1)
+        await asyncio.sleep(0.05)
+        return object()
+    
+    async def main():
+        same = await asyncio.gather(*(flight.do_async("key", fetch) for _ in range(5)))
+        other = await flight.do_async("other", fetch)
+        return same, other
+    
+    same, other = asyncio.run(main())
+    assert len(executed) == 2
+    assert all(result is same[0] for result in same)
+    assert other is not same[0]
+    assert flight.stats() == SingleFlightStats(calls=6, executed=2, coalesced=4)
+    assert flight.in_flight() == 0
+
+
+def test_async_cancelled_caller_does_not_cancel_the_others():
+    flight = SingleFlight()
+    
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return "done"
+    
+    async def main():
+        first = asyncio.ensure_future(flight.do_async("key", fetch))
+        second = asyncio.ensure_future(flight.do_async("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second, first.cancelled()
+    
+    assert asyncio.run(main()) == ("done", True)
+
+
+def test_async_errors_are_shared():
+    flight = SingleFlight()
+    
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+    
+    async def main():
+        return await asyncio.gather(*(flight.do_async("key", fail) for _ in range(3)), return_exceptions=True)
+    
+    errors = asyncio.run(main())
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert errors[0] is errors[1]
+
+
+def test_async_failure_after_every_caller_is_cancelled_is_not_logged():
+    flight = SingleFlight()
+    unhandled = []
+    
+    async def fail():
+        await asyncio.sleep(0.02)
+        raise ValueError("boom")
+    
+    async def main():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: unhandled.append(context))
+        callers = [asyncio.ensure_future(flight.do_async("key", fail)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0.05)
+        del callers
+        gc.collect()
+    
+    asyncio.run(main())
+    assert flight.in_flight() == 0
+    assert unhandled == []
+
+
+def test_client_coalesces_identical_deterministic_requests():
+    transport = MockTransport(lambda request: COMPLETION, latency=0.1)
+    client = Dandolo(api_key="dk_test", single_flight=SingleFlight(), transport=transport)
+    
+    futures = [client.chat.completions.submit(MESSAGES, model="llama-3.3-70b", temperature=0) for _ in range(4)]
+    results = [future.result() for future in futures]
+    assert len(transport.requests) == 1
+    assert all(result.choices[0].message.content == "ok" for result in results)
+    
+    # Sampling requests are never merged
+    futures = [client.chat.completions.submit(MESSAGES, model="llama-3.3-70b", temperature=0.7) for _ in range(2)]
+    [future.result() for future in futures]
+    assert len(transport.requests) == 3
+    client.close()
+
+
+def test_async_client_coalesces_identical_requests():
+    pytest.importorskip("aiohttp")
+    from dandolo import AsyncDandolo
+    from dandolo.mock_server import Latency, MockServer, MockServerConfig
+    
+    async def main():
+        async with MockServer(MockServerConfig(latency=Latency.fixed(0.05))) as server:
+            async with AsyncDandolo(api_key="ak_test", base_url=server.url, single_flight=SingleFlight()) as client:
+                results = await asyncio.gather(*(
+                    client.chat.completions.create(messages=MESSAGES, model="llama-3.3-70b", temperature=0)
+                    for _ in range(4)
+                ))
+                return results, server.stats()
+    
+    results, stats = asyncio.run(main())
+    assert stats["requests"] == 1
+    assert len({result.id for result in results}) == 1
\ No newline at end of file
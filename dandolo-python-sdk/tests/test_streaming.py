@@ -0,0 +1,101 @@
+"""
+Tests for SSE decoding and streamed completions.
+"""
+
+import json
+
+from dandolo import Dandolo
+from dandolo.streaming import LineDecoder, accumulate_chunks, iter_lines, iter_sse_data
+from dandolo.transport import MockResponse, MockTransport
+
+
+def delta_chunk(content=None, role=None, finish_reason=None, usage=None):
+    delta = {}
+    if role is not None:
+        delta["role"] = role
+    if content is not None:
+        delta["content"] = content
+    return {
+        "id": "chatcmpl-test",
+        "object": "chat.completion.chunk",
+        "created": 1,
+        "model": "llama-3.3-70b",
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        "usage": usage
+    }
+
+
+def decode(chunks):
+    return list(iter_sse_data(iter_lines(chunks)))
+
+
+def test_lines_split_across_chunks():
+    assert list(iter_lines([b"da", b"ta: o", b"ne\nda", b"ta: two\n"])) == [b"data: one", b"data: two"]
+
+
+def test_line_terminators():
+    decoder = LineDecoder()
+    assert decoder.feed(b"a\r\nb\rc\n") == [b"a", b"b", b"c"]
+    # "\r\n" split between two chunks is a single terminator
+    assert decoder.feed(b"d\r") == [b"d"]
+    assert decoder.feed(b"\ne\n") == [b"e"]
+    assert decoder.feed(b"tail") == []
+    assert decoder.flush() == [b"tail"]
+
+
+def test_crlf_events():
+    assert decode([b"data: one\r\n\r\ndata: two\r\n\r\n"]) == ["one", "two"]
+
+
+def test_multi_line_data_is_joined():
+    assert decode([b"data: first\ndata: second\n\n"]) == ["first\nsecond"]
+
+
+def test_comments_and_other_fields_are_ignored():
+    chunks = [b": keep-alive\n\nevent: message\nid: 7\nretry: 100\ndata:{\"a\":1}\n\n"]
+    assert decode(chunks) == ["{\"a\":1}"]
+
+
+def test_done_sentinel_ends_the_stream():
+    assert decode([b"data: one\n\ndata: [DONE]\n\ndata: after\n\n"]) == ["one"]
+
+
+def test_trailing_event_without_blank_line():
+    assert decode([b"data: one\n\ndata: last"]) == ["one", "last"]
+
+
+def test_stream_reassembles_byte_split_events():
+    events = [
+        delta_chunk("", role="assistant"),
+        delta_chunk("Hel"),
+        delta_chunk("lo"),
+        delta_chunk(finish_reason="stop", usage={"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5})
+    ]
+    body = b"".join(f"data: {json.dumps(event)}\r\n\r\n".encode("utf-8") for event in events) + b"data: [DONE]\r\n\r\n"
+    # Deliver the body a few bytes at a time
+    chunks = [body[i:i + 7] for i in range(0, len(body), 7)]
+    client = Dandolo(api_key="dk_test", transport=MockTransport(lambda request: MockResponse(chunks=chunks)))
+    
+    with client.chat.completions.create(messages=[{"role": "user", "content": "hi"}], stream=True) as stream:
+        pieces = [chunk.choices[0].delta.content for chunk in stream]
+        completion = stream.get_final_completion()
+    
+    assert pieces == ["", "Hel", "lo", None]
+    assert completion.choices[0].message.content == "Hello"
+    assert completion.choices[0].finish_reason == "stop"
+    assert completion.usage.total_tokens == 5
+    client.close()
+
+
+def test_non_stream_body_is_a_single_chunk():
+    body = {
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": 1,
+        "model": "llama-3.3-70b",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": "whole"}, "finish_reason": "stop"}]
+    }
+    client = Dandolo(api_key="dk_test", transport=MockTransport(lambda request: body))
+    stream = client.chat.completions.create(messages=[{"role": "user", "content": "hi"}], stream=True)
+    assert accumulate_chunks(stream).choices[0].message.content == "whole"
+    client.close()
\ No newline at end of file
@@ -0,0 +1,153 @@
+"""
+Tests for local token estimation.
+"""
+
+import pytest
+
+from dandolo import tokens as tokens_module
+from dandolo.tokens import (
+    REPLY_PRIMING_TOKENS,
+    TOKENS_PER_MESSAGE,
+    TokenEstimator,
+    estimate_message_tokens,
+    estimate_single_message_tokens,
+    estimate_tokens
+)
+from dandolo.types import Model
+
+
+class FakeEncoding:
+    """Stands in for a tiktoken Encoding: one token per word."""
+    
+    def __init__(self):
+        self.batches = []
+    
+    def encode_ordinary(self, text):
+        return text.split()
+    
+    def encode_ordinary_batch(self, texts, num_threads):
+        self.batches.append((list(texts), num_threads))
+        return [text.split() for text in texts]
+
+
+def test_heuristic_counts_ascii_by_length():
+    estimator = TokenEstimator()
+    assert estimator.count("") == 0
+    assert estimator.count("a") == 1
+    assert estimator.count("abcd" * 4) == 4
+    assert estimator.count("x" * 10) == 3  # 2.5 rounds half up
+    assert TokenEstimator(chars_per_token=2).count("abcd" * 4) == 8
+    assert not estimator.exact
+
+
+def test_heuristic_counts_non_ascii_characters_individually():
+    estimator = TokenEstimator()
+    assert estimator.count("日本語") == 3
+    assert estimator.count("ab日本") == 3  # 0.5 + 2 rounds up
+    assert estimator.count("🚀") == 1
+    # Two-byte characters are split between the two rates
+    assert estimator.count("é" * 8) == 5
+
+
+def test_message_counts_include_overhead():
+    estimator = TokenEstimator()
+    assert estimator.count_message({"role": "user", "content": "abcd"}) == TOKENS_PER_MESSAGE + 1
+    assert estimator.count_message({"role": "user", "content": "abcd", "name": "abcdefgh"}) == TOKENS_PER_MESSAGE + 3
+    assert estimator.count_message({"role": "user", "content": None}) == TOKENS_PER_MESSAGE
+    assert estimator.count_message({"role": "user", "content": [{"type": "text"}]}) == TOKENS_PER_MESSAGE
+    
+    messages = [{"role": "system", "content": "abcd" * 2}, {"role": "user", "content": "abcd" * 3}]
+    expected = REPLY_PRIMING_TOKENS + sum(estimator.count_message(message) for message in messages)
+    assert estimator.count_messages(messages) == expected
+    assert estimator.count_messages([]) == REPLY_PRIMING_TOKENS
+
+
+def test_batch_counts_match_individual_counts():
+    estimator = TokenEstimator()
+    prompts = [
+        [{"role": "user", "content": "hello there"}],
+        [],
+        [{"role": "system", "content": "be brief"}, {"role": "user", "content": "日本語のテキスト", "name": "bob"}]
+    ]
+    assert estimator.count_messages_batch(prompts) == [estimator.count_messages(messages) for messages in prompts]
+    assert estimator.count_batch(["", "abcd", "日本"]) == [0, 1, 2]
+
+
+def test_tokenizer_callables_are_exact():
+    estimator = TokenEstimator(tokenizer=str.split)
+    assert estimator.exact
+    assert estimator.count("one two three") == 3
+    assert estimator.count_batch(["a b", "", "c"]) == [2, 0, 1]
+    assert estimator.count_messages([{"role": "user", "content": "a b c"}]) == REPLY_PRIMING_TOKENS + TOKENS_PER_MESSAGE + 3
+
+
+def test_tiktoken_style_encodings_count_in_one_batch():
+    encoding = FakeEncoding()
+    estimator = TokenEstimator(tokenizer=encoding, num_threads=4)
+    assert estimator.count("a b c") == 3
+    counts = estimator.count_messages_batch([
+        [{"role": "user", "content": "a b"}],
+        [{"role": "user", "content": "c d e", "name": "f"}]
+    ])
+    overhead = REPLY_PRIMING_TOKENS + TOKENS_PER_MESSAGE
+    assert counts == [overhead + 2, overhead + 4]
+    # Every text of every prompt goes out in a single threaded call
+    assert encoding.batches == [(["a b", "c d e", "f"], 4)]
+
+
+def test_calibrate_moves_the_scale_towards_observed_usage():
+    estimator = TokenEstimator()
+    messages = [{"role": "user", "content": "abcd" * 25}]
+    overhead = REPLY_PRIMING_TOKENS + TOKENS_PER_MESSAGE
+    estimator.calibrate(messages, prompt_tokens=overhead + 50, weight=0.5)
+    # Observed twice the estimate, moved halfway there
+    assert estimator.scale == pytest.approx(1.5)
+    assert estimator.count("abcd" * 25) == 38
+    
+    for _ in range(50):
+        estimator.calibrate(messages, prompt_tokens=overhead + 50, weight=0.5)
+    assert estimator.count_messages(messages) == pytest.approx(overhead + 50, abs=1)
+
+
+def test_calibrate_ignores_exact_and_degenerate_inputs():
+    exact = TokenEstimator(tokenizer=str.split)
+    exact.calibrate([{"role": "user", "content": "a b"}], prompt_tokens=1000)
+    assert exact.scale == 1.0
+    
+    estimator = TokenEstimator()
+    estimator.calibrate([{"role": "user", "content": "abcd"}], prompt_tokens=0)
+    estimator.calibrate([{"role": "user", "content": ""}], prompt_tokens=100)
+    assert estimator.scale == 1.0
+
+
+def test_remaining_context():
+    estimator = TokenEstimator(tokenizer=str.split)
+    model = Model(id="m", context_length=100)
+    messages = [{"role": "user", "content": "w " * 43}]
+    prompt = REPLY_PRIMING_TOKENS + TOKENS_PER_MESSAGE + 43
+    assert estimator.max_completion_tokens(messages, model) == 100 - prompt
+    assert estimator.max_completion_tokens_batch([messages, []], model) == [100 - prompt, 100 - REPLY_PRIMING_TOKENS]
+    assert estimator.fits(messages, model, max_tokens=100 - prompt)
+    assert not estimator.fits(messages, model, max_tokens=100 - prompt + 1)
+    assert estimator.max_completion_tokens(messages, Model(id="m")) is None
+    assert estimator.fits(messages, Model(id="m"), max_tokens=10 ** 6)
+
+
+def test_module_helpers_use_the_heuristic():
+    message = {"role": "user", "content": "abcd" * 4}
+    assert estimate_tokens("abcd" * 4) == 4
+    assert estimate_single_message_tokens(message) == TOKENS_PER_MESSAGE + 4
+    assert estimate_message_tokens([message]) == REPLY_PRIMING_TOKENS + TOKENS_PER_MESSAGE + 4
+
+
+def test_from_tiktoken_requires_tiktoken(monkeypatch):
+    monkeypatch.setattr(tokens_module, "optional_import", lambda name: None)
+    with pytest.raises(ImportError, match=r"dandolo-ai\[tokens\]"):
+        TokenEstimator.from_tiktoken()
+
+
+def test_from_tiktoken_counts_exactly():
+    pytest.importorskip("tiktoken")
+    estimator = TokenEstimator.from_tiktoken("cl100k_base")
+    assert estimator.exact
+    assert estimator.count("hello world") == 2
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""
+Tests for the pluggable HTTP transports.
+"""
+
+import time
+
+import pytest
+
+from dandolo import Dandolo
+from dandolo import transport as transport_module
+from dandolo.exceptions import NetworkError
+from dandolo.transport import HTTPXTransport, MockResponse, MockTransport, RequestsTransport
+
+
+COMPLETION = {
+    "id": "chatcmpl-test",
+    "object": "chat.completion",
+    "created": 1,
+    "model": "llama-3.3-70b",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}]
+}
+
+
+def test_mock_transport_records_requests():
+    transport = MockTransport(lambda request: COMPLETION)
+    client = Dandolo(api_key="dk_test", base_url="https://edge.example/", transport=transport)
+    client.chat.completions.create(messages=[{"role": "user", "content": "hi"}], model="llama-3.3-70b", max_tokens=5)
+    
+    request, = transport.requests
+    assert request.method == "POST"
+    assert request.url == "https://edge.example/v1/chat/completions"
+    assert request.headers["Authorization"] == "Bearer dk_test"
+    assert request.json() == {
+        "model": "llama-3.3-70b",
+        "messages": [{"role": "user", "content": "hi"}],
+        "stream": False,
+        "max_tokens": 5
+    }
+    assert client.pool is None
+    client.close()
+
+
+def test_mock_response_defaults():
+    response = MockResponse(json_data={"a": 1}, headers={"x-test": "1"})
+    assert response.status_code == 200
+    assert response.json() == {"a": 1}
+    assert response.headers["Content-Type"] == "application/json"
+    assert response.headers["X-Test"] == "1"
+    assert list(response.iter_content()) == [response.content]
+    
+    stream = MockResponse.event_stream([{"n": 1}])
+    assert stream.headers["Content-Type"] == "text/event-stream"
+    assert list(stream.iter_content()) == [b'data: {"n": 1}\n\n', b"data: [DONE]\n\n"]
+
+
+def test_handler_network_errors_are_retried():
+    calls = []
+    
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise NetworkError("Connection error")
+        return COMPLETION
+    
+    client = Dandolo(api_key="dk_test", retry_delay=0.01, transport=MockTransport(handler))
+    response = client.chat.completions.create(messages=[{"role": "user", "content": "hi"}])
+    assert response.choices[0].message.content == "ok"
+    assert len(calls) == 2
+    client.close()
+
+
+def test_mock_transport_latency():
+    transport = MockTransport(lambda request: COMPLETION, latency=0.05)
+    client = Dandolo(api_key="dk_test", transport=transport)
+    started = time.perf_counter()
+    client.chat.completions.create(messages=[{"role": "user", "content": "hi"}])
+    assert time.perf_counter() - started >= 0.05
+    client.close()
+
+
+def test_requests_transport_maps_connection_errors():
+    transport = RequestsTransport()
+    # Port 9 (discard) on localhost is closed in test environments
+    with pytest.raises(NetworkError):
+        transport.request("GET", "http://127.0.0.1:9/v1/models", timeout=2)
+    transport.close()
+
+
+def test_default_transport_uses_the_shared_pool():
+    client = Dandolo(api_key="dk_test")
+    assert isinstance(client.transport, RequestsTransport)
+    assert client.transport.pool is client.pool
+    assert client.pool.headers["Authorization"] == "Bearer dk_test"
+    client.close()
+
+
+def test_httpx_transport_requires_httpx(monkeypatch):
+    monkeypatch.setattr(transport_module, "optional_import", lambda name: None)
+    with pytest.raises(ImportError, match=r"dandolo-ai\[http2\]"):
+        HTTPXTransport()
+
+
+def test_httpx_transport_maps_connection_errors():
+    pytest.importorskip("httpx")
+    transport = HTTPXTransport(http2=False)
+    with pytest.raises(NetworkError):
+        transport.request("GET", "http://127.0.0.1:9/v1/models", timeout=2)
+    transport.close()
\ No newline at end of file
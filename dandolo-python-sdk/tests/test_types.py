@@ -0,0 +1,124 @@
+"""
+Tests for the lazy completion objects.
+"""
+
+import pickle
+
+from dandolo import Dandolo
+from dandolo.cache import ResponseCache
+from dandolo.transport import MockTransport
+from dandolo.types import ChatCompletion, ChatMessage, Choice, Usage
+
+
+def payload():
+    return {
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": 1700000000,
+        "model": "llama-3.3-70b",
+        "choices": [
+            {"index": 0, "message": {"role": "assistant", "content": "first"}, "finish_reason": "stop"},
+            {"index": 1, "message": {"role": "assistant", "content": "second"}, "finish_reason": "length"}
+        ],
+        "usage": {"prompt_tokens": 3, "completion_tokens": 5, "total_tokens": 8},
+        "system_fingerprint": "fp_1"
+    }
+
+
+def test_from_dict_wraps_without_copying():
+    data = payload()
+    completion = ChatCompletion.from_dict(data)
+    assert completion.to_dict() is data
+    assert completion.id == "chatcmpl-test"
+    assert completion.created == 1700000000
+    assert completion.choices[1].message.content == "second"
+    assert completion.choices[1].finish_reason == "length"
+    assert completion.usage.total_tokens == 8
+    # Nested objects view the same dicts
+    assert completion.choices[0].to_dict() is data["choices"][0]
+    assert completion.choices[0].message.to_dict() is data["choices"][0]["message"]
+
+
+def test_nested_objects_are_built_once_on_first_access():
+    completion = ChatCompletion.from_dict(payload())
+    assert completion._choices is None
+    assert completion._usage is None
+    
+    choices = completion.choices
+    assert completion.choices is choices
+    assert choices[0]._message is None
+    assert choices[0].message is choices[0].message
+    assert completion.usage is completion.usage
+
+
+def test_objects_use_slots():
+    completion = ChatCompletion.from_dict(payload())
+    for obj in (completion, completion.choices[0], completion.choices[0].message, completion.usage):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_missing_fields_use_defaults():
+    completion = ChatCompletion.from_dict({"id": "x", "choices": [{"message": None}]})
+    assert completion.object == "chat.completion"
+    assert completion.model == "auto-select"
+    assert completion.usage is None
+    assert completion.choices[0].index == 0
+    assert completion.choices[0].message.role == "assistant"
+    assert completion.choices[0].message.content == ""
+
+
+def test_dict_style_access_keeps_working():
+    completion = ChatCompletion.from_dict(payload())
+    assert completion["choices"][0]["message"]["content"] == "first"
+    assert completion.get("system_fingerprint") == "fp_1"
+    assert completion.get("missing", "default") == "default"
+    assert "usage" in completion
+    assert "missing" not in completion
+
+
+def test_keyword_constructors():
+    message = ChatMessage(role="assistant", content="hi", name="bot")
+    usage = Usage(prompt_tokens=1, completion_tokens=2, total_tokens=3)
+    completion = ChatCompletion(
+        id="chatcmpl-built",
+        model="llama-3.3-70b",
+        choices=[Choice(index=0, message=message, finish_reason="stop")],
+        usage=usage
+    )
+    assert completion.choices[0].message is message
+    assert completion.usage is usage
+    assert isinstance(completion.created, int)
+    assert completion.to_dict()["choices"][0]["message"] == {"role": "assistant", "content": "hi", "name": "bot"}
+    assert ChatMessage(role="user", content="hi").to_dict() == {"role": "user", "content": "hi"}
+
+
+def test_equality_and_repr():
+    assert ChatCompletion.from_dict(payload()) == ChatCompletion.from_dict(payload())
+    assert ChatMessage("user", "a") != ChatMessage("user", "b")
+    assert ChatMessage("user", "a") != {"role": "user", "content": "a"}
+    assert repr(Usage(1, 2, 3)) == "Usage(prompt_tokens=1, completion_tokens=2, total_tokens=3)"
+
+
+def test_pickle_roundtrip_resets_cached_objects():
+    completion = ChatCompletion.from_dict(payload())
+    completion.choices
+    restored = pickle.loads(pickle.dumps(completion))
+    assert restored._choices is None
+    assert restored == completion
+    assert restored.choices[0].message.content == "first"
+
+
+def test_client_returns_completion_objects_over_cached_payloads():
+    transport = MockTransport(lambda request: payload())
+    client = Dandolo(api_key="dk_test", cache=ResponseCache(), transport=transport)
+    messages = [{"role": "user", "content": "hi"}]
+    
+    first = client.chat.completions.create(messages=messages, model="llama-3.3-70b", temperature=0)
+    second = client.chat.completions.create(messages=messages, model="llama-3.3-70b", temperature=0)
+    assert isinstance(first, ChatCompletion)
+    assert len(transport.requests) == 1
+    # Cache hits share the stored payload instead of deep-copying it
+    assert second.to_dict() is first.to_dict()
+    assert second is not first
+    assert second.choices[0].message.content == "first"
+    client.close()
\ No newline at end of file